@@ -0,0 +1,197 @@
+import asyncio
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple, Type, Union
+
+from sqlalchemy import case, func, literal, null, select, tuple_, type_coerce, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+
+from config import settings
+
+
+Aggregates = Mapping[str, Union[ColumnElement, "Aggregates"]]
+
+
+def count_if(condition: ColumnElement) -> ColumnElement:
+    """COUNT of the rows matching `condition` (0 when none do)"""
+    return func.count(case((condition, 1)))
+
+
+def count_by(column: ColumnElement, values: Type[Enum]) -> Dict[str, ColumnElement]:
+    """One conditional COUNT per enum member, keyed by the member's value"""
+    return {value.value: count_if(column == value) for value in values}
+
+
+def _flatten(columns: Aggregates, path: Tuple[str, ...] = ()) -> Iterable:
+    """(key path, expression) of every leaf of a nested Aggregates mapping"""
+    for name, expression in columns.items():
+        if isinstance(expression, Mapping):
+            yield from _flatten(expression, (*path, name))
+        else:
+            yield (*path, name), expression
+
+
+def _unflatten(paths: Iterable[Tuple[str, ...]], values: Iterable[Any]) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {}
+    for (*parents, name), value in zip(paths, values):
+        target = stats
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[name] = value
+    return stats
+
+
+async def aggregate(
+    db: AsyncSession,
+    model: Any,
+    where: ColumnElement,
+    columns: Aggregates,
+) -> Dict[str, Any]:
+    """
+    Evaluate all `columns` over the rows of `model` matching `where` in a
+    single SELECT, so a statistics endpoint is one round trip regardless of
+    how many enum members it counts.
+
+    `columns` maps result keys to aggregate expressions; a nested mapping
+    (e.g. from count_by) comes back as a nested dict.
+    """
+    flat = list(_flatten(columns))
+    query = select(
+        *(expression.label(f"a{index}") for index, (_, expression) in enumerate(flat))
+    ).select_from(model).where(where)
+    row = (await db.execute(query)).one()
+    return _unflatten((path for path, _ in flat), row)
+
+
+def _grouping_sets_query(
+    model: Any,
+    where: Optional[ColumnElement],
+    facets: List[ColumnElement],
+    totals: List[ColumnElement],
+) -> Select:
+    """PostgreSQL: one scan, GROUP BY GROUPING SETS ((facet) ..., ())"""
+    query = select(
+        *(func.grouping(facet).label(f"g{index}") for index, facet in enumerate(facets)),
+        *(facet.label(f"f{index}") for index, facet in enumerate(facets)),
+        func.count().label("n"),
+        *(total.label(f"a{index}") for index, total in enumerate(totals)),
+    ).select_from(model).group_by(
+        func.grouping_sets(*(tuple_(facet) for facet in facets), tuple_())
+    )
+    return query if where is None else query.where(where)
+
+
+def _union_all_query(
+    model: Any,
+    where: Optional[ColumnElement],
+    facets: List[ColumnElement],
+    totals: List[ColumnElement],
+) -> Select:
+    """
+    Everything else: one GROUP BY per facet plus the totals row, combined
+    with UNION ALL into a single statement. The `g` columns mimic
+    GROUPING(): 0 for the facet a row belongs to, 1 otherwise.
+    """
+    def branch(own: Optional[int]) -> Select:
+        query = select(
+            *(literal(0 if index == own else 1).label(f"g{index}") for index in range(len(facets))),
+            *(
+                (facet if index == own else type_coerce(null(), facet.type)).label(f"f{index}")
+                for index, facet in enumerate(facets)
+            ),
+            func.count().label("n"),
+            *(
+                (total if own is None else type_coerce(null(), total.type)).label(f"a{index}")
+                for index, total in enumerate(totals)
+            ),
+        ).select_from(model)
+        if where is not None:
+            query = query.where(where)
+        return query if own is None else query.group_by(facets[own])
+
+    return union_all(branch(None), *(branch(index) for index in range(len(facets))))
+
+
+async def facet_aggregate(
+    db: AsyncSession,
+    model: Any,
+    facets: Mapping[str, ColumnElement],
+    columns: Aggregates,
+    where: Optional[ColumnElement] = None,
+) -> Dict[str, Any]:
+    """
+    Like aggregate(), plus a {value: row count} dict per facet column,
+    all from one statement: GROUPING SETS on PostgreSQL (a single scan),
+    a UNION ALL of grouped selects elsewhere.
+    """
+    names = list(facets)
+    facet_columns = list(facets.values())
+    flat = list(_flatten(columns))
+    totals = [expression for _, expression in flat]
+
+    build = _grouping_sets_query if db.bind.dialect.name == "postgresql" else _union_all_query
+    rows = (await db.execute(build(model, where, facet_columns, totals))).all()
+
+    counts: Dict[str, Dict[Any, int]] = {name: {} for name in names}
+    stats: Dict[str, Any] = {}
+    width = len(facet_columns)
+    for row in rows:
+        groupings, values = row[:width], row[width:2 * width]
+        if all(groupings):
+            stats = _unflatten((path for path, _ in flat), row[2 * width + 1:])
+            continue
+        index = groupings.index(0)
+        counts[names[index]][values[index]] = row[2 * width]
+    return {**stats, **counts}
+
+
+class ResultCache:
+    """
+    In-process TTL cache for computed results (e.g. admin statistics).
+
+    Each worker process has its own cache, so a result can be up to `ttl`
+    seconds stale. Concurrent misses on the same key wait for a single
+    computation instead of all hitting the database. A ttl of 0 disables it.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _fresh(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return True, entry[1]
+        return False, None
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        if self.ttl <= 0:
+            return await compute()
+
+        found, value = self._fresh(key)
+        if found:
+            self.hits += 1
+            return value
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            found, value = self._fresh(key)
+            if found:
+                self.hits += 1
+                return value
+            self.misses += 1
+            value = await compute()
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+admin_stats_cache = ResultCache(settings.ADMIN_STATS_CACHE_TTL_SECONDS)
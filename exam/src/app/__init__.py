@@ -9,6 +9,7 @@ from .language_skills import router as language_skills_router
 from .military_service import router as military_service_router
 from .skills import router as skills_router
 from .training_courses import router as training_courses_router
+from .work_experience import router as work_experience_router
 routers = [
     applicant_router,
     application_details_router,
@@ -20,6 +21,7 @@ routers = [
     language_skills_router,
     military_service_router,
     training_courses_router,
-    skills_router
+    skills_router,
+    work_experience_router,
 
 ]
\ No newline at end of file
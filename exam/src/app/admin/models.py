@@ -8,7 +8,8 @@ from sqlalchemy import (
     DateTime,
     Enum,
     Float,
-    Text
+    Text,
+    Index
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -26,9 +27,14 @@ class AdminJobAssignment(Base):
     job_id = Column(
         Integer, 
         ForeignKey('jobs.id', ondelete="CASCADE"),  # Fixed: using table name 'jobs'
-        nullable=False
+        nullable=False,
+        index=True
     )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
 
-    job = relationship("JobDB")
\ No newline at end of file
+    job = relationship("JobDB")
+
+    __table_args__ = (
+        Index('ix_admin_jobs_admin_id_job_id', 'admin_id', 'job_id'),
+    )
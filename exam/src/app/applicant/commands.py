@@ -0,0 +1,57 @@
+"""
+Maintenance commands for applicants.
+
+Run from the src directory:
+    python -m app.applicant.commands reconcile-stats
+    python -m app.applicant.commands rebuild-search
+"""
+import asyncio
+import sys
+
+from database import AsyncSessionLocal, dispose_engines, engine
+from .search import rebuild_search_index, search_backend
+from .services import rebuild_applicant_stats_rollup
+
+
+async def reconcile_stats() -> int:
+    """Rebuild applicant_stats_rollup and print any drift found"""
+    async with AsyncSessionLocal() as db:
+        report = await rebuild_applicant_stats_rollup(db)
+    await dispose_engines()
+
+    print(f"applicants: {report['applicants']}  buckets: {report['buckets']}")
+    if not report["drift"]:
+        print("rollup is in sync")
+        return 0
+
+    print(f"drift in {len(report['drift'])} bucket(s):")
+    for item in report["drift"]:
+        print(
+            f"  {item['day']} {item['status']:<22} {item['gender']:<7}"
+            f" expected={item['expected']} actual={item['actual']}"
+        )
+    return 1
+
+
+async def rebuild_search() -> int:
+    """Recreate the applicant search index from UsersDetails"""
+    async with engine.begin() as conn:
+        await conn.run_sync(search_backend.create)
+        total = await conn.run_sync(rebuild_search_index)
+    await dispose_engines()
+
+    print(f"indexed {total} applicant(s) with the {search_backend.name} backend")
+    return 0
+
+
+COMMANDS = {
+    "reconcile-stats": reconcile_stats,
+    "rebuild-search": rebuild_search,
+}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in COMMANDS:
+        print(f"usage: python -m app.applicant.commands [{'|'.join(COMMANDS)}]")
+        sys.exit(2)
+    sys.exit(asyncio.run(COMMANDS[sys.argv[1]]()))
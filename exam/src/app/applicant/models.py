@@ -93,6 +93,8 @@ class Applicant(AbstractModel):
 
     tracking_code = Column(String(20), unique=True, nullable=True)
     
+    status = Column(Enum(StatusEnum), nullable=False, default=StatusEnum.DRAFT)
+    
 
     submitted_at = Column(DateTime(timezone=True), nullable=True)
     
@@ -104,4 +106,29 @@ class Applicant(AbstractModel):
         uselist=False  
     )
 
+    __table_args__ = (
+        # admin listing: filter by status, newest submissions first
+        Index('ix_UsersDetails_status_submitted_at', 'status', 'submitted_at'),
+    )
+
 
+
+
+class ApplicantStatsRollup(Base):
+    """
+    Pre-aggregated applicant counts per status x gender x day.
+    Maintained by the applicant services in the same transaction as the
+    applicant change, rebuilt by `python -m app.applicant.commands`.
+    """
+
+    __tablename__ = "applicant_stats_rollup"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(Enum(StatusEnum), nullable=False)
+    gender = Column(Enum(GenderEnum), nullable=False)
+    day = Column(Date, nullable=False)  # submitted_at (or created_at) day
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('status', 'gender', 'day', name='unique_rollup_bucket'),
+    )
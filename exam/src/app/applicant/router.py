@@ -1,18 +1,25 @@
 # routers/applicant_router.py
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
+import time
 
-from database import get_db
+from config import settings
+from database import get_db, get_read_db
+from db_pool import WAIT_MS_BUCKETS, Histogram
+from export import export_response
+from pagination import CursorParams, Page
 from auth.models import User
 from .enums import StatusEnum
 from .schemas import (
     ApplicantCreate,
     ApplicantUpdate,
     ApplicantResponse,
-
+    ApplicantDossierResponse,
+    DossierExportRequest,
 
 )
 # here we have to create 
@@ -24,18 +31,25 @@ from auth.depends import (
 from .services import (
     create_applicant,
     delete_applicant_with_check,
-    update_applicant
+    update_applicant,
+    get_applicant_statistics,
 )
 from .selectors import (
-    get_applicants_by_status_with_pagination,
+    get_applicants_page,
+    applicants_export_query,
     get_applicant_by_user_id,
     get_applicant_by_tracking_code,
     get_applicant_by_id,
+    get_applicant_dossier,
+    get_job_applicant_user_ids,
+    iter_applicant_dossiers,
 
 )
 
 router = APIRouter(prefix="/applicants", tags=["applicants"])
 
+dossier_latency = Histogram(WAIT_MS_BUCKETS)
+
 
 @router.post("/", response_model=ApplicantResponse, status_code=status.HTTP_201_CREATED)
 async def create_applicant_api(
@@ -66,20 +80,18 @@ async def create_applicant_api(
 
 
 
-@router.get("/", response_model=List[ApplicantResponse])
+@router.get("/", response_model=Page[ApplicantResponse])
 async def get_applicants_api(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    pagination: CursorParams = Depends(),
     status: Optional[StatusEnum] = None,
     search: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_superuser)  # فقط ادمین
 ):
 
-    applicants = await get_applicants_by_status_with_pagination(
-        db, status, skip, limit, search
+    return await get_applicants_page(
+        db, pagination, status, search
     )
-    return applicants
 
 
 @router.get("/me/", response_model=ApplicantResponse)
@@ -99,6 +111,80 @@ async def get_my_applicant(
     return applicant
 
 
+@router.get("/statistics/")
+async def get_applicants_statistics_api(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_superuser)  # فقط ادمین
+):
+    """آمار متقاضیان برای داشبورد ادمین"""
+    return await get_applicant_statistics(db)
+
+
+@router.get("/export/")
+async def export_applicants_api(
+    export_format: str = Query("csv", alias="format"),
+    status: Optional[StatusEnum] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_superuser)  # فقط ادمین
+):
+    """خروجی CSV/XLSX متقاضیان به صورت استریم"""
+    return export_response(db, applicants_export_query(status), "applicants", export_format)
+
+
+@router.get("/dossier/latency/")
+async def get_dossier_latency_api(
+    current_user: User = Depends(get_current_superuser)  # فقط ادمین
+):
+    """زمان پاسخ پرونده متقاضی در مقایسه با هدف p99"""
+    p99 = dossier_latency.percentile(99)
+    return {
+        "p99_target_ms": settings.DOSSIER_P99_TARGET_MS,
+        "p99_ms": p99,
+        "within_target": p99 is None or p99 <= settings.DOSSIER_P99_TARGET_MS,
+        "latency_ms": dossier_latency.snapshot(),
+    }
+
+
+@router.post("/dossier/export/")
+async def export_applicant_dossiers_api(
+    export: DossierExportRequest,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_superuser)  # فقط ادمین
+):
+    """پرونده چند متقاضی به صورت NDJSON (هر خط یک پرونده)"""
+    if export.job_id is not None:
+        user_ids = await get_job_applicant_user_ids(db, export.job_id)
+    else:
+        user_ids = export.user_ids
+
+    async def lines():
+        async for dossier in iter_applicant_dossiers(
+            db, user_ids, settings.DOSSIER_EXPORT_CHUNK_SIZE
+        ):
+            yield ApplicantDossierResponse.model_validate(dossier).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/dossier/{user_id}/", response_model=ApplicantDossierResponse)
+async def get_applicant_dossier_api(
+    user_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_superuser)  # فقط ادمین
+):
+    """همه بخش‌های پرونده یک کاربر در یک درخواست"""
+    started = time.perf_counter()
+    dossier = await get_applicant_dossier(db, user_id)
+    if dossier is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="کاربر یافت نشد"
+        )
+    response = ApplicantDossierResponse.model_validate(dossier)
+    dossier_latency.observe((time.perf_counter() - started) * 1000)
+    return response
+
+
 @router.get("/{applicant_id}/", response_model=ApplicantResponse)
 async def get_applicant_by_id_api(
     applicant_id: int,
@@ -305,13 +391,9 @@ async def patch_my_applicant_api(
                 )
 
         # اعمال تغییرات
-        for field, value in update_data.items():
-            setattr(applicant, field, value)
-
-        await db.commit()
-        await db.refresh(applicant)
-
-        return applicant
+        return await update_applicant(
+            db, applicant.id, applicant_data, current_user.id
+        )
 
     except HTTPException:
         raise
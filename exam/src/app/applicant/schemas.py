@@ -1,5 +1,5 @@
-from pydantic import BaseModel ,Field ,ConfigDict
-from typing import Optional
+from pydantic import BaseModel ,Field ,ConfigDict, model_validator
+from typing import List, Optional
 from .enums import (
     GenderEnum,
     BloodTypeEnum,
@@ -7,6 +7,18 @@ from .enums import (
 )
 from datetime import (date , datetime)
 
+from app.application_details.schemas import ApplicationDetailsResponse
+from app.contact_information.schemas import AddressResponse, ContactInfoResponse
+from app.education.schemas import EducationResponse
+from app.family_information.schemas import ChildResponse, SiblingResponse, SpouseResponse
+from app.job_applications.schemas import JobApplicationResponse
+from app.language_skills.schemas import LanguageSkillResponse
+from app.military_service.schemas import MilitaryServiceResponse
+from app.skills.schemas import SkillResponse
+from app.training_courses.schemas import TrainingCourseResponse
+from app.work_experience.schemas import WorkExperienceResponse
+
+
 class ApplicantBase(BaseModel):
     """Base schema for Applicant with common fields"""
     name: Optional[str] = Field(None, min_length=3, max_length=200)
@@ -87,4 +99,39 @@ class ApplicantCreate(ApplicantBase):
     def validate_national_code(cls, v):
         if len(v) != 10 or not v.isdigit():
             raise ValueError('کدملی باید 10 رقم باشد')
-        return v
\ No newline at end of file
+        return v
+
+
+class ApplicantDossierResponse(BaseModel):
+    """پرونده کامل متقاضی - همه بخش‌ها در یک پاسخ"""
+    user_id: int
+    mobile: str
+    email: Optional[str] = None
+    applicant: Optional[ApplicantResponse] = None
+    spouse: List[SpouseResponse] = []
+    children: List[ChildResponse] = []
+    siblings: List[SiblingResponse] = []
+    educations: List[EducationResponse] = []
+    work_experiences: List[WorkExperienceResponse] = []
+    skills: List[SkillResponse] = []
+    language_skills: List[LanguageSkillResponse] = []
+    training_courses: List[TrainingCourseResponse] = []
+    military_service: List[MilitaryServiceResponse] = []
+    contact_info: List[ContactInfoResponse] = []
+    addresses: List[AddressResponse] = []
+    application_details: List[ApplicationDetailsResponse] = []
+    job_applications: List[JobApplicationResponse] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DossierExportRequest(BaseModel):
+    """خروجی گروهی پرونده‌ها: یا لیست کاربران یا همه متقاضیان یک شغل"""
+    user_ids: Optional[List[int]] = Field(None, min_length=1, max_length=5000)
+    job_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def check_source(self):
+        if (self.user_ids is None) == (self.job_id is None):
+            raise ValueError("دقیقاً یکی از user_ids یا job_id باید ارسال شود")
+        return self
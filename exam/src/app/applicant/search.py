@@ -0,0 +1,239 @@
+"""
+Applicant search index.
+
+A normalized copy of the searchable applicant fields is kept in
+`applicant_search`, written in the same flush as the applicant itself.
+The backend depends on the database:
+
+- SQLite: FTS5 virtual table with the trigram tokenizer (substring match)
+- PostgreSQL: plain table with a pg_trgm GIN index
+- anything else: no index, ILIKE over the applicant columns
+
+Rebuild it with `python -m app.applicant.commands rebuild-search`.
+"""
+import re
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, column, delete, event, inspect, literal_column, or_, select, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import ColumnElement
+
+from database import engine
+from persian import normalize_persian
+from .models import Applicant
+
+
+SEARCH_TABLE = "applicant_search"
+SEARCH_FIELDS = ("name", "family", "father_name", "national_code", "id_number", "tracking_code")
+REBUILD_BATCH_SIZE = 1000
+
+NATIONAL_CODE_RE = re.compile(r"^\d{10}$")
+TRACKING_CODE_RE = re.compile(r"^AP\d{10}[A-Z0-9]{4}$", re.IGNORECASE)
+
+
+def search_document(values: Iterable[Optional[str]]) -> str:
+    return " ".join(filter(None, (normalize_persian(value) for value in values)))
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class LikeSearchBackend:
+    """No index: ILIKE over the applicant columns (the old behaviour)"""
+
+    name = "like"
+
+    def exists(self, connection: Connection) -> bool:
+        return True
+
+    def create(self, connection: Connection) -> None:
+        pass
+
+    def clear(self, connection: Connection) -> None:
+        pass
+
+    def upsert(self, connection: Connection, documents: Sequence[Tuple[int, str]]) -> None:
+        pass
+
+    def remove(self, connection: Connection, applicant_id: int) -> None:
+        pass
+
+    def match(self, terms: List[str]) -> ColumnElement:
+        return and_(*(
+            or_(*(
+                getattr(Applicant, field).ilike(_like_pattern(term), escape="\\")
+                for field in SEARCH_FIELDS
+            ))
+            for term in terms
+        ))
+
+
+class SqliteFtsSearchBackend(LikeSearchBackend):
+    """FTS5 table keyed by rowid = applicant id"""
+
+    name = "sqlite-fts5"
+    index = table(SEARCH_TABLE, column("rowid"), column("document"))
+
+    def exists(self, connection: Connection) -> bool:
+        return connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+            {"name": SEARCH_TABLE},
+        ).first() is not None
+
+    def create(self, connection: Connection) -> None:
+        connection.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE}"
+            " USING fts5(document, tokenize='trigram')"
+        ))
+
+    def clear(self, connection: Connection) -> None:
+        connection.execute(delete(self.index))
+
+    def upsert(self, connection: Connection, documents: Sequence[Tuple[int, str]]) -> None:
+        connection.execute(
+            text(f"INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, document) VALUES (:id, :document)"),
+            [{"id": applicant_id, "document": document} for applicant_id, document in documents],
+        )
+
+    def remove(self, connection: Connection, applicant_id: int) -> None:
+        connection.execute(
+            text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :id"), {"id": applicant_id}
+        )
+
+    def match(self, terms: List[str]) -> ColumnElement:
+        # trigrams need 3 characters; shorter terms fall back to LIKE on the index
+        long_terms = [term for term in terms if len(term) >= 3]
+        conditions = [
+            self.index.c.document.like(_like_pattern(term), escape="\\")
+            for term in terms if len(term) < 3
+        ]
+        if long_terms:
+            query = " AND ".join('"{}"'.format(term.replace('"', '""')) for term in long_terms)
+            conditions.append(literal_column(SEARCH_TABLE).op("MATCH")(query))
+        return Applicant.id.in_(select(self.index.c.rowid).where(*conditions))
+
+
+class PostgresTrigramSearchBackend(LikeSearchBackend):
+    """Plain table with a GIN trigram index; LIKE '%term%' uses the index"""
+
+    name = "postgresql-trgm"
+    index = table(SEARCH_TABLE, column("applicant_id"), column("document"))
+
+    def exists(self, connection: Connection) -> bool:
+        return connection.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": SEARCH_TABLE}
+        ).scalar()
+
+    def create(self, connection: Connection) -> None:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+            f' applicant_id INTEGER PRIMARY KEY REFERENCES "{Applicant.__tablename__}" (id) ON DELETE CASCADE,'
+            " document TEXT NOT NULL)"
+        ))
+        connection.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_document_trgm"
+            f" ON {SEARCH_TABLE} USING gin (document gin_trgm_ops)"
+        ))
+
+    def clear(self, connection: Connection) -> None:
+        connection.execute(delete(self.index))
+
+    def upsert(self, connection: Connection, documents: Sequence[Tuple[int, str]]) -> None:
+        connection.execute(
+            text(
+                f"INSERT INTO {SEARCH_TABLE} (applicant_id, document) VALUES (:id, :document)"
+                " ON CONFLICT (applicant_id) DO UPDATE SET document = EXCLUDED.document"
+            ),
+            [{"id": applicant_id, "document": document} for applicant_id, document in documents],
+        )
+
+    def remove(self, connection: Connection, applicant_id: int) -> None:
+        connection.execute(delete(self.index).where(self.index.c.applicant_id == applicant_id))
+
+    def match(self, terms: List[str]) -> ColumnElement:
+        return Applicant.id.in_(
+            select(self.index.c.applicant_id).where(*(
+                self.index.c.document.like(_like_pattern(term), escape="\\")
+                for term in terms
+            ))
+        )
+
+
+def backend_for(dialect_name: str) -> LikeSearchBackend:
+    if dialect_name == "sqlite":
+        return SqliteFtsSearchBackend()
+    if dialect_name == "postgresql":
+        return PostgresTrigramSearchBackend()
+    return LikeSearchBackend()
+
+
+search_backend = backend_for(engine.dialect.name)
+
+
+def search_clause(search: Optional[str]) -> Optional[ColumnElement]:
+    """
+    WHERE clause for an admin search box, or None for an empty search.
+    A national code or tracking code is matched exactly on its own column.
+    """
+    term = normalize_persian(search)
+    if not term:
+        return None
+    if NATIONAL_CODE_RE.match(term):
+        return Applicant.national_code == term
+    if TRACKING_CODE_RE.match(term):
+        return Applicant.tracking_code == term.upper()
+    return search_backend.match(term.split(" "))
+
+
+def ensure_search_index(connection: Connection) -> None:
+    """Create the index if needed and fill it from UsersDetails on first creation"""
+    if search_backend.exists(connection):
+        return
+    search_backend.create(connection)
+    rebuild_search_index(connection)
+
+
+def rebuild_search_index(connection: Connection) -> int:
+    """Replace the index contents from UsersDetails; returns the applicant count"""
+    search_backend.clear(connection)
+    fields = [getattr(Applicant, field) for field in SEARCH_FIELDS]
+    result = connection.execute(
+        select(Applicant.id, *fields).execution_options(yield_per=REBUILD_BATCH_SIZE)
+    )
+    total = 0
+    for rows in result.partitions():
+        search_backend.upsert(
+            connection, [(row[0], search_document(row[1:])) for row in rows]
+        )
+        total += len(rows)
+    return total
+
+
+@event.listens_for(Applicant.__table__, "after_create")
+def _create_with_table(target, connection, **kw):
+    # a fresh UsersDetails (metadata.create_all) gets an empty index next to it
+    search_backend.create(connection)
+
+
+def _document(applicant: Applicant) -> str:
+    return search_document(getattr(applicant, field) for field in SEARCH_FIELDS)
+
+
+@event.listens_for(Applicant, "after_insert")
+def _index_inserted(mapper, connection, target):
+    search_backend.upsert(connection, [(target.id, _document(target))])
+
+
+@event.listens_for(Applicant, "after_update")
+def _index_updated(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in SEARCH_FIELDS):
+        search_backend.upsert(connection, [(target.id, _document(target))])
+
+
+@event.listens_for(Applicant, "after_delete")
+def _index_deleted(mapper, connection, target):
+    search_backend.remove(connection, target.id)
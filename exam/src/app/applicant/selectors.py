@@ -1,12 +1,16 @@
 # selectors/applicant_selectors.py
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, func, case, inspect
 from sqlalchemy.orm import selectinload
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from datetime import date, datetime
 
-from .models import Applicant
+from app.job_applications.models import JobApplication
+from auth.models import User
+from pagination import CursorParams, Page, SortKey, paginate
+from .models import Applicant, ApplicantStatsRollup
+from .search import search_clause
 from .enums import GenderEnum, BloodTypeEnum, MaritalStatusEnum, StatusEnum
 
 
@@ -125,7 +129,7 @@ async def count_applicants(
     gender: Optional[GenderEnum] = None
 ) -> int:
     """Count applicants with optional filters"""
-    query = select(Applicant)
+    query = select(func.count()).select_from(Applicant)
     
     filters = []
     if status:
@@ -137,7 +141,7 @@ async def count_applicants(
         query = query.where(and_(*filters))
     
     result = await db.execute(query)
-    return len(result.scalars().all())
+    return result.scalar() or 0
 
 
 async def search_applicants(
@@ -147,16 +151,11 @@ async def search_applicants(
     limit: int = 100
 ) -> List[Applicant]:
     """Search applicants by multiple fields"""
-    query = select(Applicant).where(
-        or_(
-            Applicant.name.ilike(f"%{search_term}%"),
-            Applicant.family.ilike(f"%{search_term}%"),
-            Applicant.national_code.ilike(f"%{search_term}%"),
-            Applicant.father_name.ilike(f"%{search_term}%"),
-            Applicant.id_number.ilike(f"%{search_term}%"),
-            Applicant.tracking_code.ilike(f"%{search_term}%")
-        )
-    ).offset(skip).limit(limit)
+    query = select(Applicant)
+    clause = search_clause(search_term)
+    if clause is not None:
+        query = query.where(clause)
+    query = query.order_by(Applicant.id).offset(skip).limit(limit)
     
     result = await db.execute(query)
     return result.scalars().all()
@@ -188,15 +187,9 @@ async def get_applicants_by_status_with_pagination(
     if status:
         filters.append(Applicant.status == status)
     
-    if search:
-        filters.append(
-            or_(
-                Applicant.name.ilike(f"%{search}%"),
-                Applicant.family.ilike(f"%{search}%"),
-                Applicant.national_code.ilike(f"%{search}%"),
-                Applicant.tracking_code.ilike(f"%{search}%")
-            )
-        )
+    clause = search_clause(search)
+    if clause is not None:
+        filters.append(clause)
     
     if filters:
         query = query.where(and_(*filters))
@@ -206,33 +199,56 @@ async def get_applicants_by_status_with_pagination(
     return result.scalars().all()
 
 
+APPLICANT_LISTING_ORDER = [
+    SortKey(Applicant.submitted_at, descending=True, nullable=True),
+    SortKey(Applicant.id, descending=True),
+]
+
+
+async def get_applicants_page(
+    db: AsyncSession,
+    params: CursorParams,
+    status: Optional[StatusEnum] = None,
+    search: Optional[str] = None
+) -> Page:
+    """Get applicants with keyset pagination (submitted_at DESC NULLS LAST, id)"""
+    query = select(Applicant)
+    
+    filters = []
+    if status:
+        filters.append(Applicant.status == status)
+    
+    clause = search_clause(search)
+    if clause is not None:
+        filters.append(clause)
+    
+    if filters:
+        query = query.where(and_(*filters))
+    
+    return await paginate(db, query, APPLICANT_LISTING_ORDER, params)
+
+
 async def count_applicants_by_filters(
     db: AsyncSession,
     status: Optional[StatusEnum] = None,
     search: Optional[str] = None
 ) -> int:
     """Count applicants with filters"""
-    query = select(Applicant)
+    query = select(func.count()).select_from(Applicant)
     
     filters = []
     if status:
         filters.append(Applicant.status == status)
     
-    if search:
-        filters.append(
-            or_(
-                Applicant.name.ilike(f"%{search}%"),
-                Applicant.family.ilike(f"%{search}%"),
-                Applicant.national_code.ilike(f"%{search}%"),
-                Applicant.tracking_code.ilike(f"%{search}%")
-            )
-        )
+    clause = search_clause(search)
+    if clause is not None:
+        filters.append(clause)
     
     if filters:
         query = query.where(and_(*filters))
     
     result = await db.execute(query)
-    return len(result.scalars().all())
+    return result.scalar() or 0
 
 
 async def get_applicant_with_user_check(
@@ -252,13 +268,19 @@ async def get_applicant_with_user_check(
     return result.scalar_one_or_none()
 
 
-async def get_today_submissions_count(db: AsyncSession) -> int:
-    """Get count of today's submissions"""
+def _today_range() -> Tuple[datetime, datetime]:
+    """Start and end of the current day"""
     today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
     today_end = datetime.now().replace(hour=23, minute=59, second=59, microsecond=999999)
+    return today_start, today_end
+
+
+async def get_today_submissions_count(db: AsyncSession) -> int:
+    """Get count of today's submissions"""
+    today_start, today_end = _today_range()
     
     result = await db.execute(
-        select(Applicant).where(
+        select(func.count()).select_from(Applicant).where(
             and_(
                 Applicant.submitted_at >= today_start,
                 Applicant.submitted_at <= today_end,
@@ -266,7 +288,198 @@ async def get_today_submissions_count(db: AsyncSession) -> int:
             )
         )
     )
-    return len(result.scalars().all())
+    return result.scalar() or 0
+
+
+async def get_applicant_counts(db: AsyncSession) -> Dict[str, int]:
+    """
+    Count applicants by status, gender and today's submissions
+    in a single aggregate query (one scan of UsersDetails).
+    """
+    today_start, today_end = _today_range()
+
+    def count_where(*conditions):
+        return func.count(case((and_(*conditions), 1)))
+
+    status_columns = [
+        count_where(Applicant.status == status).label(status.value)
+        for status in StatusEnum
+    ]
+    gender_columns = [
+        count_where(Applicant.gender == gender).label(gender.value)
+        for gender in GenderEnum
+    ]
+    today_column = count_where(
+        Applicant.submitted_at >= today_start,
+        Applicant.submitted_at <= today_end,
+        Applicant.status == StatusEnum.SUBMITTED,
+    ).label("today_submissions")
+
+    query = select(
+        func.count(Applicant.id).label("total"),
+        *status_columns,
+        *gender_columns,
+        today_column,
+    )
+    result = await db.execute(query)
+    row = result.one()
+
+    return {
+        "total": row.total,
+        "by_status": {status.value: row._mapping[status.value] for status in StatusEnum},
+        "by_gender": {gender.value: row._mapping[gender.value] for gender in GenderEnum},
+        "today_submissions": row.today_submissions,
+    }
+
+
+async def get_applicant_counts_from_rollup(db: AsyncSession) -> Dict[str, int]:
+    """
+    Same result as get_applicant_counts, read from the pre-aggregated
+    applicant_stats_rollup table (cost depends on bucket count, not applicants).
+    """
+    today = date.today()
+    query = select(
+        ApplicantStatsRollup.status,
+        ApplicantStatsRollup.gender,
+        func.sum(ApplicantStatsRollup.count).label("count"),
+        func.sum(
+            case((ApplicantStatsRollup.day == today, ApplicantStatsRollup.count), else_=0)
+        ).label("today"),
+    ).group_by(ApplicantStatsRollup.status, ApplicantStatsRollup.gender)
+    result = await db.execute(query)
+
+    counts = {
+        "total": 0,
+        "by_status": {status.value: 0 for status in StatusEnum},
+        "by_gender": {gender.value: 0 for gender in GenderEnum},
+        "today_submissions": 0,
+    }
+    for status, gender, count, today_count in result.all():
+        count = count or 0
+        counts["total"] += count
+        counts["by_status"][status.value] += count
+        counts["by_gender"][gender.value] += count
+        if status == StatusEnum.SUBMITTED:
+            counts["today_submissions"] += today_count or 0
+    return counts
+
+
+async def get_stats_rollup_buckets(db: AsyncSession) -> List[ApplicantStatsRollup]:
+    """All rows of the applicant stats rollup"""
+    result = await db.execute(select(ApplicantStatsRollup))
+    return result.scalars().all()
+
+
+def applicants_export_query(status: Optional[StatusEnum] = None):
+    """Flat applicant rows for the CSV/XLSX export, in id order"""
+    query = select(
+        Applicant.id,
+        Applicant.user_id,
+        Applicant.tracking_code,
+        Applicant.name,
+        Applicant.family,
+        Applicant.national_code,
+        Applicant.father_name,
+        Applicant.id_number,
+        Applicant.id_place,
+        Applicant.birth_date,
+        Applicant.birth_place,
+        Applicant.nationality,
+        Applicant.religion,
+        Applicant.gender,
+        Applicant.marital_status,
+        Applicant.blood_type,
+        Applicant.insurance_number,
+        Applicant.status,
+        Applicant.submitted_at,
+        Applicant.created_at,
+    ).order_by(Applicant.id)
+    if status:
+        query = query.where(Applicant.status == status)
+    return query
+
+
+# dossier section -> User backref; each one is a single selectin query
+DOSSIER_SECTIONS = {
+    "applicant": "applicant",
+    "spouse": "spouse",
+    "children": "child",
+    "siblings": "siblings",
+    "educations": "educations",
+    "work_experiences": "work_experiences",
+    "skills": "Skill",
+    "language_skills": "language_skills",
+    "training_courses": "TrainingCourse",
+    "military_service": "MilitaryService",
+    "contact_info": "contact_info",
+    "addresses": "addresses",
+    "application_details": "application_details",
+    "job_applications": "job_application",
+}
+
+
+def _dossier_options() -> list:
+    relationships = inspect(User).relationships
+    return [
+        selectinload(relationships[backref].class_attribute)
+        for backref in DOSSIER_SECTIONS.values()
+    ]
+
+
+def _to_dossier(user: User) -> Dict[str, Any]:
+    dossier: Dict[str, Any] = {
+        section: getattr(user, backref)
+        for section, backref in DOSSIER_SECTIONS.items()
+    }
+    dossier["applicant"] = dossier["applicant"][0] if dossier["applicant"] else None
+    dossier.update(user_id=user.id, mobile=user.mobile, email=user.email)
+    return dossier
+
+
+async def get_applicant_dossier(db: AsyncSession, user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    All profile sections of one user: the user row plus one
+    selectinload query per section, whatever the section sizes.
+    """
+    query = select(User).where(User.id == user_id).options(*_dossier_options())
+    user = (await db.execute(query)).scalar_one_or_none()
+    if user is None:
+        return None
+    return _to_dossier(user)
+
+
+async def iter_applicant_dossiers(
+    db: AsyncSession,
+    user_ids: List[int],
+    chunk_size: int = 500,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Dossiers of many users, in the order of `user_ids`.
+
+    Each chunk of `chunk_size` users costs the same queries as a single
+    dossier (every section is one `user_id IN (...)` query) and is
+    expunged from the session once yielded, so memory stays bounded.
+    Unknown ids are skipped.
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    for start in range(0, len(user_ids), chunk_size):
+        chunk = user_ids[start:start + chunk_size]
+        query = select(User).where(User.id.in_(chunk)).options(*_dossier_options())
+        users = {user.id: user for user in (await db.execute(query)).scalars()}
+        for user_id in chunk:
+            if user_id in users:
+                yield _to_dossier(users[user_id])
+        db.expunge_all()
+
+
+async def get_job_applicant_user_ids(db: AsyncSession, job_id: int) -> List[int]:
+    """Users who applied to `job_id`, best score first"""
+    result = await db.execute(
+        select(JobApplication.user_id)
+        .where(JobApplication.job_id == job_id)
+        .order_by(JobApplication.score.desc(), JobApplication.id)
+    )
+    return list(result.scalars().all())
 
 
 """
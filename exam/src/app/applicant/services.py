@@ -1,25 +1,99 @@
 # services/applicant_service.py
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from typing import Optional, List, Dict, Any
+from sqlalchemy import select, and_, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Optional, List, Dict, Any, Tuple
+from collections import Counter
 from datetime import date, datetime
 import random
 import string
 
-from .models import Applicant
+from .models import Applicant, ApplicantStatsRollup
 from auth.models import User
 from .enums import StatusEnum, GenderEnum, BloodTypeEnum, MaritalStatusEnum
 from .selectors import (
     get_applicant_by_user_id ,
     get_applicant_by_national_code,
     get_applicant_by_id,
-    count_applicants,
-    get_today_submissions_count,
+    get_applicant_counts_from_rollup,
+    get_stats_rollup_buckets,
     )
 from .schemas import ApplicantCreate, ApplicantUpdate
 
 
+RollupKey = Tuple[StatusEnum, GenderEnum, date]
+
+
+def _bucket(
+    status: Optional[StatusEnum],
+    gender: GenderEnum,
+    submitted_at: Optional[datetime],
+    created_at: Optional[datetime],
+) -> RollupKey:
+    moment = submitted_at or created_at or datetime.now()
+    return (status or StatusEnum.DRAFT, gender, moment.date())
+
+
+def _rollup_key(applicant: Applicant) -> RollupKey:
+    """Bucket of the stats rollup that an applicant is counted in"""
+    return _bucket(
+        applicant.status,
+        applicant.gender,
+        applicant.submitted_at,
+        applicant.created_at,
+    )
+
+
+async def _apply_rollup_delta(db: AsyncSession, key: RollupKey, delta: int) -> None:
+    """Add delta to one rollup bucket (upsert), inside the caller's transaction"""
+    if not delta:
+        return
+    
+    status, gender, day = key
+    dialect = db.bind.dialect.name
+    
+    if dialect in ("postgresql", "sqlite"):
+        insert = pg_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert(ApplicantStatsRollup).values(
+            status=status, gender=gender, day=day, count=delta
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["status", "gender", "day"],
+            set_={"count": ApplicantStatsRollup.count + delta},
+        )
+        await db.execute(stmt)
+        return
+    
+    result = await db.execute(
+        update(ApplicantStatsRollup)
+        .where(
+            and_(
+                ApplicantStatsRollup.status == status,
+                ApplicantStatsRollup.gender == gender,
+                ApplicantStatsRollup.day == day,
+            )
+        )
+        .values(count=ApplicantStatsRollup.count + delta)
+    )
+    if result.rowcount == 0:
+        db.add(ApplicantStatsRollup(status=status, gender=gender, day=day, count=delta))
+
+
+async def _apply_rollup_changes(db: AsyncSession, changes: Counter) -> None:
+    """Apply a batch of per-bucket deltas"""
+    for key, delta in changes.items():
+        await _apply_rollup_delta(db, key, delta)
+
+
+async def _move_in_rollup(db: AsyncSession, old_key: RollupKey, applicant: Applicant) -> None:
+    """Move an applicant from its previous bucket to its current one"""
+    new_key = _rollup_key(applicant)
+    if new_key != old_key:
+        await _apply_rollup_changes(db, Counter({old_key: -1, new_key: 1}))
+
+
 async def create_applicant(
     db: AsyncSession,
     applicant_data: ApplicantCreate,
@@ -58,9 +132,14 @@ async def create_applicant(
         blood_type=applicant_data.blood_type,
         marital_status=applicant_data.marital_status,
         marriage_date=applicant_data.marriage_date,
+        status=StatusEnum.DRAFT,
     )
     
     db.add(applicant)
+    # flush first: the rollup day must come from the DB-side created_at,
+    # as it does in rebuild_applicant_stats_rollup
+    await db.flush()
+    await _apply_rollup_delta(db, _rollup_key(applicant), 1)
     await db.commit()
     await db.refresh(applicant)
     return applicant
@@ -83,18 +162,21 @@ async def update_applicant(
         raise PermissionError("You don't have permission to update this applicant")
     
     # Check national code uniqueness if being updated
-    if applicant_data.national_code and applicant_data.national_code != applicant.national_code:
+    national_code = getattr(applicant_data, "national_code", None)
+    if national_code and national_code != applicant.national_code:
         existing = await get_applicant_by_national_code(
-            db, applicant_data.national_code
+            db, national_code
         )
         if existing and existing.id != applicant_id:
             raise ValueError("National code already exists")
     
     # Update fields
+    old_key = _rollup_key(applicant)
     update_data = applicant_data.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(applicant, field, value)
     
+    await _move_in_rollup(db, old_key, applicant)
     await db.commit()
     await db.refresh(applicant)
     return applicant
@@ -115,6 +197,7 @@ async def delete_applicant(
     if user_id and applicant.user_id != user_id:
         raise PermissionError("You don't have permission to delete this applicant")
     
+    await _apply_rollup_delta(db, _rollup_key(applicant), -1)
     await db.delete(applicant)
     await db.commit()
     return True
@@ -127,33 +210,6 @@ def _generate_tracking_code() -> str:
     return f"AP{timestamp}{random_part}"
 
 
-async def get_applicant_statistics(db: AsyncSession) -> Dict[str, Any]:
-    """Get statistics about applicants"""
-    
-    total = await count_applicants(db)
-    draft = await count_applicants(db, status=StatusEnum.DRAFT)
-    submitted = await count_applicants(db, status=StatusEnum.SUBMITTED)
-    approved = await count_applicants(db, status=StatusEnum.APPROVED)
-    rejected = await count_applicants(db, status=StatusEnum.REJECTED)
-    
-    male = await count_applicants(db, gender=GenderEnum.MALE)
-    female = await count_applicants(db, gender=GenderEnum.FEMALE)
-    
-    return {
-        "total": total,
-        "by_status": {
-            "draft": draft,
-            "submitted": submitted,
-            "approved": approved,
-            "rejected": rejected
-        },
-        "by_gender": {
-            "male": male,
-            "female": female
-        }
-    }
-
-
 async def bulk_update_applicants_status(
     db: AsyncSession,
     applicant_ids: List[int],
@@ -167,11 +223,15 @@ async def bulk_update_applicants_status(
     )
     applicants = result.scalars().all()
     
+    rollup_changes = Counter()
     for applicant in applicants:
+        rollup_changes[_rollup_key(applicant)] -= 1
         applicant.status = new_status
         if new_status == StatusEnum.SUBMITTED:
             applicant.submitted_at = datetime.now()
+        rollup_changes[_rollup_key(applicant)] += 1
     
+    await _apply_rollup_changes(db, rollup_changes)
     await db.commit()
     return len(applicants)
 
@@ -203,11 +263,13 @@ async def update_applicant_status(
     if not applicant:
         return None
     
+    old_key = _rollup_key(applicant)
     applicant.status = new_status
     
     if new_status == StatusEnum.SUBMITTED and not applicant.submitted_at:
         applicant.submitted_at = datetime.now()
     
+    await _move_in_rollup(db, old_key, applicant)
     await db.commit()
     await db.refresh(applicant)
     return applicant
@@ -226,6 +288,7 @@ async def update_personal_info(
         return None
     
     # Update fields
+    old_key = _rollup_key(applicant)
     for field, value in personal_data.items():
         if value is not None:
             setattr(applicant, field, value)
@@ -236,6 +299,7 @@ async def update_personal_info(
         # You might want to set a specific status here
         pass
     
+    await _move_in_rollup(db, old_key, applicant)
     await db.commit()
     await db.refresh(applicant)
     return applicant
@@ -259,9 +323,11 @@ async def submit_application(
     if not required_sections_completed:
         raise ValueError("Please complete all sections before submission")
     
+    old_key = _rollup_key(applicant)
     applicant.status = StatusEnum.SUBMITTED
     applicant.submitted_at = datetime.now()
     
+    await _move_in_rollup(db, old_key, applicant)
     await db.commit()
     await db.refresh(applicant)
     return applicant
@@ -282,27 +348,72 @@ async def delete_applicant_with_check(
     if applicant.status not in [StatusEnum.DRAFT, StatusEnum.REJECTED]:
         raise ValueError("Cannot delete application in this stage")
     
+    await _apply_rollup_delta(db, _rollup_key(applicant), -1)
     await db.delete(applicant)
     await db.commit()
     return True
 
 
+async def rebuild_applicant_stats_rollup(db: AsyncSession) -> Dict[str, Any]:
+    """
+    Recompute the stats rollup from UsersDetails, replace its contents
+    and report every bucket whose stored count had drifted.
+    """
+    expected = Counter()
+    rows = await db.stream(
+        select(
+            Applicant.status,
+            Applicant.gender,
+            Applicant.submitted_at,
+            Applicant.created_at,
+        ).execution_options(yield_per=1000)
+    )
+    async for status, gender, submitted_at, created_at in rows:
+        expected[_bucket(status, gender, submitted_at, created_at)] += 1
+    
+    actual = Counter()
+    for bucket in await get_stats_rollup_buckets(db):
+        actual[(bucket.status, bucket.gender, bucket.day)] += bucket.count
+    
+    drift = [
+        {
+            "status": key[0].value,
+            "gender": key[1].value,
+            "day": key[2].isoformat(),
+            "expected": expected.get(key, 0),
+            "actual": actual.get(key, 0),
+        }
+        for key in sorted(set(expected) | set(actual), key=lambda k: (k[2], k[0].value, k[1].value))
+        if expected.get(key, 0) != actual.get(key, 0)
+    ]
+    
+    await db.execute(delete(ApplicantStatsRollup))
+    if expected:
+        db.add_all(
+            ApplicantStatsRollup(status=status, gender=gender, day=day, count=count)
+            for (status, gender, day), count in expected.items()
+        )
+    await db.commit()
+    
+    return {
+        "applicants": sum(expected.values()),
+        "buckets": len(expected),
+        "drift": drift,
+    }
+
+
 async def get_applicant_statistics(db: AsyncSession) -> Dict[str, int]:
     """Get applicant statistics for admin"""
-    total = await count_applicants(db)
-    draft = await count_applicants(db, status=StatusEnum.DRAFT)
-    submitted = await count_applicants(db, status=StatusEnum.SUBMITTED)
-    approved = await count_applicants(db, status=StatusEnum.APPROVED)
-    rejected = await count_applicants(db, status=StatusEnum.REJECTED)
-    today_submissions = await get_today_submissions_count(db)
+    counts = await get_applicant_counts_from_rollup(db)
+    by_status = counts["by_status"]
     
     return {
-        "total": total,
-        "draft": draft,
-        "submitted": submitted,
-        "approved": approved,
-        "rejected": rejected,
-        "today_submissions": today_submissions
+        "total": counts["total"],
+        "draft": by_status[StatusEnum.DRAFT.value],
+        "submitted": by_status[StatusEnum.SUBMITTED.value],
+        "approved": by_status[StatusEnum.ACCEPTED.value],
+        "rejected": by_status[StatusEnum.REJECTED.value],
+        "today_submissions": counts["today_submissions"],
     }
 
 # async def update_applicant_user_by_self(
@@ -1,10 +1,11 @@
 # router.py for application_details
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import datetime, date
 
-from database import get_db
+from database import UnitOfWorkRoute, get_db, get_read_db, get_uow
+from export import export_response
 from auth.depends import get_current_user_obj as get_current_user
 from auth.models import User
 from .models import ApplicationDetails 
@@ -20,7 +21,7 @@ from .selectors import ApplicationDetailsSelector
 
 from typing import List
 
-router = APIRouter(prefix="/application-details", tags=["Application Details"])
+router = APIRouter(prefix="/application-details", tags=["Application Details"], route_class=UnitOfWorkRoute)
 
 
 
@@ -42,7 +43,7 @@ async def get_application_details(
 async def create_application_details(
     details_data: ApplicationDetailsCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
 
 
@@ -66,7 +67,7 @@ async def update_application_details(
     application_details :int , 
     details_data: ApplicationDetailsUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """به‌روزرسانی جزئیات درخواست"""
     details = await  ApplicationDetailsService.get_by_id(
@@ -102,7 +103,7 @@ async def update_application_details(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"خطا در به‌روزرسانی: {str(e)}"
@@ -115,7 +116,7 @@ async def patch_application_details(
     application_details: int,
     details_data: ApplicationDetailsUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
 
     # دریافت جزئیات کاربر
@@ -147,8 +148,6 @@ async def patch_application_details(
             details,
             details_data
         )
-        await db.commit()
-        await db.refresh(updated_details)
         return updated_details
 
     except HTTPException:
@@ -160,12 +159,12 @@ async def patch_application_details(
             detail=f"خطا در به‌روزرسانی: {str(e)}"
         )
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
-def delete_application_details(
+async def delete_application_details(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """حذف جزئیات درخواست"""
-    details = ApplicationDetailsService.get_by_user(db, current_user.id)
+    details = await ApplicationDetailsService.get_by_user(db, current_user.id)
     
     if not details:
         raise HTTPException(
@@ -174,14 +173,13 @@ def delete_application_details(
         )
     
     try:
-        ApplicationDetailsService.delete(db, details)
+        for item in details:
+            await ApplicationDetailsService.delete(db, item)
         
         # به‌روزرسانی applicant
 
-        db.commit()
-        
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"خطا در حذف: {str(e)}"
@@ -225,9 +223,26 @@ def get_all_application_details(
     return details
 
 
+@router.get("/admin/export/")
+async def export_application_details(
+    export_format: str = Query("csv", alias="format"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """خروجی CSV/XLSX جزئیات درخواست‌ها (فقط ادمین)"""
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="شما دسترسی به این بخش ندارید"
+        )
+    
+    query = ApplicationDetailsSelector.export_query()
+    return export_response(db, query, "application_details", export_format)
+
+
 @router.get("/statistics/")
-def get_application_details_statistics(
-    db: AsyncSession = Depends(get_db),
+async def get_application_details_statistics(
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """آمار کلی جزئیات درخواست (فقط ادمین)"""
@@ -237,5 +252,5 @@ def get_application_details_statistics(
             detail="شما دسترسی به این بخش ندارید"
         )
     
-    stats = ApplicationDetailsSelector.get_statistics(db)
+    stats = await ApplicationDetailsSelector.get_statistics(db)
     return stats
\ No newline at end of file
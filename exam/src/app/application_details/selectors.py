@@ -3,6 +3,7 @@ from sqlalchemy import select, and_, func
 from typing import Optional, Dict
 from datetime import datetime, date
 
+from aggregates import admin_stats_cache, count_if, facet_aggregate
 from .models import ApplicationDetails
 from app.applicant.models import Applicant
 from .enums import ConnectionTypeEnum, WorkScheduleEnum
@@ -17,6 +18,17 @@ class ApplicationDetailsSelector:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def export_query():
+        """ردیف‌های خروجی CSV/XLSX: همه ستون‌های جزئیات درخواست + نام متقاضی"""
+        return select(
+            Applicant.name.label("applicant_name"),
+            Applicant.family.label("applicant_family"),
+            *ApplicationDetails.__table__.columns,
+        ).outerjoin(
+            Applicant, Applicant.user_id == ApplicationDetails.user_id
+        ).order_by(ApplicationDetails.id)
+
     @staticmethod
     async def get_with_applicant(db: AsyncSession, user_id: int) -> Optional[tuple]:
         """دریافت جزئیات درخواست به همراه applicant"""
@@ -129,45 +141,37 @@ class ApplicationDetailsSelector:
     @staticmethod
     async def get_statistics(db: AsyncSession) -> Dict:
         """آمار کلی جزئیات درخواست"""
-        total_result = await db.execute(select(func.count(ApplicationDetails.id)))
-        total = total_result.scalar() or 0
-
-        connection_stats = {}
-        for conn_type in ConnectionTypeEnum:
-            count_result = await db.execute(
-                select(func.count(ApplicationDetails.id)).where(ApplicationDetails.connection_type == conn_type)
-            )
-            connection_stats[conn_type.value] = count_result.scalar() or 0
-
-        schedule_stats = {}
-        for schedule in WorkScheduleEnum:
-            count_result = await db.execute(
-                select(func.count(ApplicationDetails.id)).where(ApplicationDetails.preferred_work_schedule == schedule)
-            )
-            schedule_stats[schedule.value] = count_result.scalar() or 0
-
-        relatives_result = await db.execute(
-            select(func.count(ApplicationDetails.id)).where(ApplicationDetails.has_relatives_in_company == True)
-        )
-        health_result = await db.execute(
-            select(func.count(ApplicationDetails.id)).where(ApplicationDetails.has_health_issue == True)
-        )
-        criminal_result = await db.execute(
-            select(func.count(ApplicationDetails.id)).where(ApplicationDetails.has_criminal_record == True)
-        )
-        avg_salary_result = await db.execute(
-            select(func.avg(ApplicationDetails.expected_salary))
+        return await admin_stats_cache.get_or_compute(
+            "application_details", lambda: ApplicationDetailsSelector._compute_statistics(db)
         )
 
+    @staticmethod
+    async def _compute_statistics(db: AsyncSession) -> Dict:
+        stats = await facet_aggregate(db, ApplicationDetails, {
+            "by_connection_type": ApplicationDetails.connection_type,
+            "by_work_schedule": ApplicationDetails.preferred_work_schedule,
+        }, {
+            "total": func.count(),
+            "with_relatives_in_company": count_if(ApplicationDetails.has_relatives_in_company == True),
+            "with_health_issues": count_if(ApplicationDetails.has_health_issue == True),
+            "with_criminal_record": count_if(ApplicationDetails.has_criminal_record == True),
+            "average_expected_salary": func.avg(ApplicationDetails.expected_salary),
+        })
+
         return {
-            "total": total,
-            "by_connection_type": connection_stats,
-            "by_work_schedule": schedule_stats,
-            "with_relatives_in_company": relatives_result.scalar() or 0,
-            "with_health_issues": health_result.scalar() or 0,
-            "with_criminal_record": criminal_result.scalar() or 0,
-            "average_expected_salary": float(avg_salary_result.scalar() or 0)
+            "total": stats["total"],
+            "by_connection_type": {
+                conn_type.value: stats["by_connection_type"].get(conn_type, 0) for conn_type in ConnectionTypeEnum
+            },
+            "by_work_schedule": {
+                schedule.value: stats["by_work_schedule"].get(schedule, 0) for schedule in WorkScheduleEnum
+            },
+            "with_relatives_in_company": stats["with_relatives_in_company"],
+            "with_health_issues": stats["with_health_issues"],
+            "with_criminal_record": stats["with_criminal_record"],
+            "average_expected_salary": float(stats["average_expected_salary"] or 0)
         }
+    
     @staticmethod
     async def get_summery(
         details : list[ApplicationDetails],
@@ -80,8 +80,6 @@ class ApplicationDetailsService:
 
         db.add(new_details)                
         await db.flush()                    
-        await db.commit()                   
-        await db.refresh(new_details)     
         return new_details
 
     @staticmethod
@@ -101,8 +99,6 @@ class ApplicationDetailsService:
                 
         db.add(details)             
         await db.flush()               
-        await db.commit()            
-        await db.refresh(details)
         return details
 
     @staticmethod
@@ -41,7 +41,8 @@ class ContactInfo(AbstractModel):
     user_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     phone = Column(String(11), nullable=False)
@@ -62,7 +63,8 @@ class Address(AbstractModel):
     user_id = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     province = Column(String(50), nullable=False)
@@ -1,7 +1,7 @@
 # router.py for contact_information
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from database import get_db
+from database import UnitOfWorkRoute, get_db, get_uow
 from auth.depends import get_current_user_obj as get_current_user
 from .services import (
     create_contact,
@@ -30,12 +30,12 @@ from .schemas import (
 from auth.models import User
 from typing import List
 
-router = APIRouter(prefix="/contact", tags=["Contact"])
+router = APIRouter(prefix="/contact", tags=["Contact"], route_class=UnitOfWorkRoute)
 
 @router.post("/contact/")
 async def create_user_contact(
     data: ContactCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_uow),
     current_user: User = Depends(get_current_user),
 ):
     try:
@@ -66,7 +66,7 @@ async def get_my_contact(
 async def update_my_contact(
     contact :int , 
     data: ContactInfoUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_uow),
     current_user: User = Depends(get_current_user),
 ):
     try:
@@ -83,7 +83,7 @@ async def update_my_contact(
 @router.post("/address/",response_model=AddressResponse)
 async def create_user_address(
     data: AddressCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_uow),
     current_user: User = Depends(get_current_user),
 ):
     return await create_address(
@@ -103,7 +103,7 @@ async def get_my_addresses(
 @router.delete("/address/{address_id}/")
 async def delete_user_address(
     address_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_uow),
     current_user: User = Depends(get_current_user),
 ):
     address = await get_address_by_id(db, address_id)
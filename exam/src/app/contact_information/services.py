@@ -17,8 +17,7 @@ async def create_contact(
         email=email,
     )
     db.add(contact)
-    await db.commit()
-    await db.refresh(contact)
+    await db.flush()
     return contact
 
 
@@ -40,8 +39,7 @@ async def update_contact(
     for key, value in kwargs.items():
         setattr(contact, key, value)
 
-    await db.commit()
-    await db.refresh(contact)
+    await db.flush()
     return contact
 
 
@@ -65,8 +63,7 @@ async def create_address(
         ownership_duration=ownership_duration,
     )
     db.add(new_address)
-    await db.commit()
-    await db.refresh(new_address)
+    await db.flush()
     return new_address
 
 
@@ -76,4 +73,4 @@ async def delete_address(db: AsyncSession, address_id: int) -> None:
         raise ValueError("Address not found")
 
     await db.delete(address)
-    await db.commit()
\ No newline at end of file
+    await db.flush()
\ No newline at end of file
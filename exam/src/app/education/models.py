@@ -7,7 +7,8 @@ from sqlalchemy import (
     DateTime,
     Enum,
     Float,
-    Text
+    Text,
+    Index
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -35,4 +36,8 @@ class Education(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # relationships
-    user = relationship("User", backref="educations")
\ No newline at end of file
+    user = relationship("User", backref="educations")
+
+    __table_args__ = (
+        Index("ix_educations_user_id_degree", "user_id", "degree"),
+    )
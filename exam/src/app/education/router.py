@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 
-from database import get_db
+from database import UnitOfWorkRoute, get_db, get_uow
 from auth.depends import get_current_user_obj as get_current_user
 from auth.models import User
 from .schemas import (
@@ -17,7 +17,7 @@ from .schemas import (
 from .services import EducationService
 from .selectors import EducationSelector
 
-router = APIRouter(prefix="/education", tags=["Education"])
+router = APIRouter(prefix="/education", tags=["Education"], route_class=UnitOfWorkRoute)
 
 
 # ========== EDUCATION ==========
@@ -34,7 +34,7 @@ async def get_educations(
 async def create_education(
     education_data: EducationCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     
     try:
@@ -43,9 +43,6 @@ async def create_education(
         # TODO: تغییر وضعیت applicant
         # from app.applicant.services import update_applicant_status
         
-        await db.commit()
-        await db.refresh(new_education)
-        
         return new_education
         
     except Exception as e:
@@ -56,6 +53,24 @@ async def create_education(
         )
 
 
+@router.get("/highest-degree/",)
+async def get_highest_degree(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    highest = await EducationSelector.get_highest_degree(db, current_user.id)
+    return {'status':'in_develop'}
+
+
+@router.get("/statistics/")
+async def get_education_statistics(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    stats = await EducationSelector.get_statistics(db, current_user.id)
+    return stats
+
+
 @router.get("/{education_id}/", response_model=EducationResponse)
 async def get_education(
     education_id: int,
@@ -79,7 +94,7 @@ async def update_education(
     education_id: int,
     education_data: EducationUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     
     education = await EducationService.get_by_id(db, education_id, current_user.id)
@@ -93,9 +108,6 @@ async def update_education(
     try:
         updated_education = await EducationService.update(db, education, education_data)
         
-        await db.commit()
-        await db.refresh(updated_education)
-        
         return updated_education
         
     except Exception as e:
@@ -110,7 +122,7 @@ async def update_education(
 async def delete_education(
     education_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
 
     education = await EducationService.get_by_id(db, education_id, current_user.id)
@@ -123,7 +135,6 @@ async def delete_education(
     
     try:
         await EducationService.delete(db, education)
-        await db.commit()
         
     except Exception as e:
         await db.rollback()
@@ -133,31 +144,17 @@ async def delete_education(
         )
 
 
-@router.get("/highest-degree/",)
-async def get_highest_degree(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    highest = await EducationSelector.get_highest_degree(db, current_user.id)
-    return {'status':'in_develop'}
-
-
 @router.post("/bulk/", response_model=List[EducationResponse], status_code=status.HTTP_201_CREATED)
 async def create_educations_bulk(
     data: EducationBulkCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     try:
         new_educations = await EducationService.create_bulk(db, current_user.id, data)
         
         # TODO: تغییر وضعیت applicant
         
-        await db.commit()
-        
-        for edu in new_educations:
-            await db.refresh(edu)
-        
         return new_educations
         
     except Exception as e:
@@ -169,15 +166,6 @@ async def create_educations_bulk(
 
 
 # ========== Additional endpoints using selectors ==========
-@router.get("/statistics/")
-async def get_education_statistics(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    stats = await EducationSelector.get_statistics(db, current_user.id)
-    return stats
-
-
 @router.get("/by-degree/{degree}/")
 async def get_by_degree(
     degree: EducationDegreeEnum,
@@ -1,9 +1,10 @@
 # selectors.py for education
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, case, func
 from typing import List, Optional, Dict
 from datetime import datetime
 
+from aggregates import aggregate, count_by
 from .models import Education
 from .schemas import EducationDegreeEnum, EducationStudyStatusEnum
 
@@ -52,26 +53,30 @@ class EducationSelector:
         result = await db.execute(query)
         return result.scalars().all()
     
+    DEGREE_ORDER = {
+        EducationDegreeEnum.DIPLOMA: 1,
+        EducationDegreeEnum.ASSOCIATE: 2,
+        EducationDegreeEnum.BACHELOR: 3,
+        EducationDegreeEnum.MASTER: 4,
+        EducationDegreeEnum.PHD: 5,
+        EducationDegreeEnum.POST_DOC: 6
+    }
+
+    @staticmethod
+    def _highest_degree_query(user_id: int):
+        degree_rank = case(
+            *((Education.degree == degree, rank) for degree, rank in EducationSelector.DEGREE_ORDER.items()),
+            else_=0,
+        )
+        return select(Education).where(
+            Education.user_id == user_id
+        ).order_by(degree_rank.desc(), Education.id).limit(1)
+
     @staticmethod
     async def get_highest_degree(db: AsyncSession, user_id: int) -> Optional[Education]:
         """دریافت بالاترین مدرک تحصیلی"""
-        query = select(Education).where(Education.user_id == user_id)
-        result = await db.execute(query)
-        educations = result.scalars().all()
-        
-        if not educations:
-            return None
-        
-        degree_order = {
-            EducationDegreeEnum.DIPLOMA: 1,
-            EducationDegreeEnum.ASSOCIATE: 2,
-            EducationDegreeEnum.BACHELOR: 3,
-            EducationDegreeEnum.MASTER: 4,
-            EducationDegreeEnum.PHD: 5,
-            EducationDegreeEnum.POST_DOC: 6
-        }
-        
-        return max(educations, key=lambda x: degree_order.get(x.degree, 0))
+        result = await db.execute(EducationSelector._highest_degree_query(user_id))
+        return result.scalar_one_or_none()
     
     @staticmethod
     async def count_by_user(db: AsyncSession, user_id: int) -> int:
@@ -82,22 +87,17 @@ class EducationSelector:
     
     @staticmethod
     async def get_statistics(db: AsyncSession, user_id: int) -> Dict:
-        total_query = select(func.count()).select_from(Education).where(Education.user_id == user_id)
-        total = await db.execute(total_query)
-        
-        degree_stats = {}
-        for degree in EducationDegreeEnum:
-            count_query = select(func.count()).select_from(Education).where(
-                and_(Education.user_id == user_id, Education.degree == degree)
-            )
-            count = await db.execute(count_query)
-            degree_stats[degree.value] = count.scalar() or 0
-        
-        highest = await EducationSelector.get_highest_degree(db, user_id)
+        highest = EducationSelector._highest_degree_query(user_id).subquery()
+        stats = await aggregate(db, Education, Education.user_id == user_id, {
+            "total": func.count(),
+            "by_degree": count_by(Education.degree, EducationDegreeEnum),
+            "highest_degree": select(highest.c.degree).scalar_subquery(),
+            "highest_degree_field": select(highest.c.field).scalar_subquery(),
+        })
         
         return {
-            "total": total.scalar() or 0,
-            "by_degree": degree_stats,
-            "highest_degree": highest.degree.value if highest else None,
-            "highest_degree_field": highest.field if highest else None
-        }
\ No newline at end of file
+            "total": stats["total"],
+            "by_degree": stats["by_degree"],
+            "highest_degree": stats["highest_degree"].value if stats["highest_degree"] else None,
+            "highest_degree_field": stats["highest_degree_field"]
+        }
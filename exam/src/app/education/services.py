@@ -4,6 +4,7 @@ from sqlalchemy import select, and_
 from typing import List, Optional
 from datetime import datetime
 
+from bulk import bulk_insert, rows_for_user
 from .models import Education
 from .schemas import EducationCreate, EducationUpdate, EducationBulkCreate
 
@@ -48,25 +49,7 @@ class EducationService:
     @staticmethod
     async def create_bulk(db: AsyncSession, user_id: int, data: EducationBulkCreate) -> List[Education]:
         """ایجاد چند مدرک تحصیلی به صورت یکجا"""
-        new_educations = []
-        # TODO fix this dont use depubcate 
-        for edu in data.educations:
-            education = Education(
-                user_id=user_id,
-                degree=edu.degree,
-                field=edu.field,
-                university=edu.university,
-                average=edu.average,
-                start_year=edu.start_year,
-                end_year=edu.end_year,
-                study_status=edu.study_status,
-                description=edu.description
-            )
-            db.add(education)
-            new_educations.append(education)
-        
-        await db.flush()
-        return new_educations
+        return await bulk_insert(db, Education, rows_for_user(user_id, data.educations))
     
     @staticmethod
     async def update(db: AsyncSession, education: Education, data: EducationUpdate) -> Education:
@@ -40,7 +40,7 @@ class Spouse(AbstractModel):
     __tablename__ = "spouses"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     full_name = Column(String(200), nullable=False)
     job = Column(String(100), nullable=True)
 
@@ -50,7 +50,7 @@ class Child(AbstractModel):
     __tablename__ = "children"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     full_name = Column(String(200), nullable=False)
     age = Column(Integer, nullable=False)
     
@@ -62,7 +62,7 @@ class Sibling(AbstractModel):
     __tablename__ = "siblings"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"),  nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"),  nullable=False, index=True)
     full_name = Column(String(200), nullable=False)
     age = Column(Integer, nullable=False)
     
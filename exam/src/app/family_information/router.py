@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 
-from database import get_db
+from database import UnitOfWorkRoute, get_db, get_uow
 from auth.depends  import get_current_user_obj as get_current_user
 from auth.models import User
 from .schemas import (
@@ -14,7 +14,7 @@ from .schemas import (
 from .services import SpouseService, ChildService, SiblingService
 from .selectors import SpouseSelector, ChildSelector, SiblingSelector
 
-router = APIRouter(prefix="/family", tags=["Family Information"])
+router = APIRouter(prefix="/family", tags=["Family Information"], route_class=UnitOfWorkRoute)
 
 
 
@@ -32,7 +32,7 @@ async def get_spouse(
 async def create_spouse(
     spouse_data: SpouseCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
 
     try:
@@ -44,9 +44,6 @@ async def create_spouse(
         # if applicant.status == Applicant.StatusEnum.PERSONAL_COMPLETED: # must change 
         #     await ApplicantService.update_status(db, applicant, Applicant.StatusEnum.FAMILY_COMPLETED)
         
-        await db.commit()
-        await db.refresh(new_spouse)
-        
         return new_spouse
         
     except Exception as e:
@@ -61,7 +58,7 @@ async def create_spouse(
 async def update_spouse(
     spouse_data: SpouseUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     spouse = await SpouseService.get_by_user(db, current_user.id)
     if not spouse:
@@ -75,7 +72,6 @@ async def update_spouse(
         
         # به‌روزرسانی applicant
 
-        await db.refresh(updated_spouse)
         return updated_spouse
         
     except Exception as e:
@@ -89,7 +85,7 @@ async def update_spouse(
 @router.delete("/spouse/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_spouse(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """حذف اطلاعات همسر"""
     spouse = await SpouseService.get_by_user(db, current_user.id)
@@ -101,7 +97,6 @@ async def delete_spouse(
     
     try:
         await SpouseService.delete(db, spouse)
-        await db.commit()
         
     except Exception as e:
         await db.rollback()
@@ -126,7 +121,7 @@ async def get_children(
 async def create_child(
     child_data: ChildCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     try:
         new_child = await ChildService.create(db, current_user.id, child_data)
@@ -150,6 +145,16 @@ async def create_child(
         )
 
 
+@router.get("/children/statistics")
+async def get_children_statistics(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """دریافت آمار فرزندان"""
+    stats = await ChildSelector.get_statistics(db, current_user.id)
+    return stats
+
+
 @router.get("/children/{child_id}", response_model=ChildResponse)
 async def get_child(
     child_id: int,
@@ -173,7 +178,7 @@ async def update_child(
     child_id: int,
     child_data: ChildUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     child = await ChildService.get_by_id(db, child_id, current_user.id)
     
@@ -186,9 +191,6 @@ async def update_child(
     try:
         updated_child = await ChildService.update(db, child, child_data)
         
-
-        await db.refresh(updated_child)
-        
         return updated_child
         
     except Exception as e:
@@ -203,7 +205,7 @@ async def update_child(
 async def delete_child(
     child_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     child = await ChildService.get_by_id(db, child_id, current_user.id)
     
@@ -218,8 +220,6 @@ async def delete_child(
         # applicant.updated_at = datetime.utcnow()
         # db.add(applicant)
         
-        await db.commit()
-        
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -242,7 +242,7 @@ async def get_siblings(
 async def create_sibling(
     sibling_data: SiblingCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """اضافه کردن خواهر/برادر جدید"""
     try:
@@ -283,7 +283,7 @@ async def update_sibling(
     sibling_id: int,
     sibling_data: SiblingUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     sibling = await SiblingService.get_by_id(db, sibling_id, current_user.id)
     
@@ -300,9 +300,6 @@ async def update_sibling(
         # applicant.updated_at = datetime.utcnow()
         # db.add(applicant)
         
-        await db.commit()
-        await db.refresh(updated_sibling)
-        
         return updated_sibling
         
     except Exception as e:
@@ -317,7 +314,7 @@ async def update_sibling(
 async def delete_sibling(
     sibling_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """حذف خواهر/برادر"""
     sibling = await SiblingService.get_by_id(db, sibling_id, current_user.id)
@@ -332,8 +329,6 @@ async def delete_sibling(
         await SiblingService.delete(db, sibling)
 
         
-        await db.commit()
-        
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -343,16 +338,6 @@ async def delete_sibling(
 
 
 # ========== Additional endpoints using selectors ==========
-@router.get("/children/statistics")
-async def get_children_statistics(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """دریافت آمار فرزندان"""
-    stats = await ChildSelector.get_statistics(db, current_user.user_id)
-    return stats
-
-
 @router.get("/siblings/statistics")
 async def get_siblings_statistics(
     current_user: User = Depends(get_current_user),
@@ -3,6 +3,7 @@ from sqlalchemy import select, and_, or_, func
 from typing import List, Optional, Tuple
 from datetime import datetime
 
+from aggregates import aggregate, count_if
 from .models import Spouse, Child, Sibling
 from .schemas import ChildGenderEnum, SiblingTypeEnum, SiblingMaritalStatusEnum
 
@@ -81,29 +82,14 @@ class ChildSelector:
     
     @staticmethod
     async def get_statistics(db: AsyncSession, user_id: int) -> dict:
-       
-        total_query = select(func.count()).select_from(Child).where(Child.user_id == user_id)
-        total = await db.execute(total_query)
-        
-        male_query = select(func.count()).select_from(Child).where(
-            and_(Child.user_id == user_id, Child.gender == ChildGenderEnum.MALE)
-        )
-        male = await db.execute(male_query)
-        
-        female_query = select(func.count()).select_from(Child).where(
-            and_(Child.user_id == user_id, Child.gender == ChildGenderEnum.FEMALE)
-        )
-        female = await db.execute(female_query)
-        
-        avg_age_query = select(func.avg(Child.age)).where(Child.user_id == user_id)
-        avg_age = await db.execute(avg_age_query)
-        
-        return {
-            "total": total.scalar() or 0,
-            "male": male.scalar() or 0,
-            "female": female.scalar() or 0,
-            "average_age": round(avg_age.scalar() or 0, 1)
-        }
+        stats = await aggregate(db, Child, Child.user_id == user_id, {
+            "total": func.count(),
+            "male": count_if(Child.gender == ChildGenderEnum.MALE),
+            "female": count_if(Child.gender == ChildGenderEnum.FEMALE),
+            "average_age": func.avg(Child.age),
+        })
+        stats["average_age"] = round(stats["average_age"] or 0, 1)
+        return stats
 
 
 class SiblingSelector:
@@ -165,43 +151,13 @@ class SiblingSelector:
     @staticmethod
     async def get_statistics(db: AsyncSession, user_id: int) -> dict:
         """آمار خواهر/برادرها"""
-        # تعداد کل
-        total_query = select(func.count()).select_from(Sibling).where(Sibling.user_id == user_id)
-        total = await db.execute(total_query)
-        
-        # تعداد برادرها
-        brother_query = select(func.count()).select_from(Sibling).where(
-            and_(Sibling.user_id == user_id, Sibling.sibling_type == SiblingTypeEnum.BROTHER)
-        )
-        brothers = await db.execute(brother_query)
-        
-        # تعداد خواهرها
-        sister_query = select(func.count()).select_from(Sibling).where(
-            and_(Sibling.user_id == user_id, Sibling.sibling_type == SiblingTypeEnum.SISTER)
-        )
-        sisters = await db.execute(sister_query)
-        
-        # تعداد مجردها
-        single_query = select(func.count()).select_from(Sibling).where(
-            and_(Sibling.user_id == user_id, Sibling.marital_status == SiblingMaritalStatusEnum.SINGLE)
-        )
-        single = await db.execute(single_query)
-        
-        # تعداد متاهل‌ها
-        married_query = select(func.count()).select_from(Sibling).where(
-            and_(Sibling.user_id == user_id, Sibling.marital_status == SiblingMaritalStatusEnum.MARRIED)
-        )
-        married = await db.execute(married_query)
-        
-        # میانگین سن
-        avg_age_query = select(func.avg(Sibling.age)).where(Sibling.user_id == user_id)
-        avg_age = await db.execute(avg_age_query)
-        
-        return {
-            "total": total.scalar() or 0,
-            "brothers": brothers.scalar() or 0,
-            "sisters": sisters.scalar() or 0,
-            "single": single.scalar() or 0,
-            "married": married.scalar() or 0,
-            "average_age": round(avg_age.scalar() or 0, 1)
-        }
\ No newline at end of file
+        stats = await aggregate(db, Sibling, Sibling.user_id == user_id, {
+            "total": func.count(),
+            "brothers": count_if(Sibling.sibling_type == SiblingTypeEnum.BROTHER),
+            "sisters": count_if(Sibling.sibling_type == SiblingTypeEnum.SISTER),
+            "single": count_if(Sibling.marital_status == SiblingMaritalStatusEnum.SINGLE),
+            "married": count_if(Sibling.marital_status == SiblingMaritalStatusEnum.MARRIED),
+            "average_age": func.avg(Sibling.age),
+        })
+        stats["average_age"] = round(stats["average_age"] or 0, 1)
+        return stats
@@ -101,9 +101,6 @@ class ChildService:
             gender=data.gender
         )
         db.add(child)
-                
-        await db.commit()
-        await db.refresh(child)
         await db.flush()
         return child
     
@@ -167,8 +164,6 @@ class SiblingService:
             job=data.job
         )
         db.add(sibling)
-        await db.commit() 
-        await db.refresh(sibling)
         await db.flush()
         return sibling
     
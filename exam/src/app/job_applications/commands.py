@@ -0,0 +1,43 @@
+"""
+Maintenance commands for job applications.
+
+Run from the src directory:
+    python -m app.job_applications.commands reconcile-ranks
+"""
+import asyncio
+import sys
+
+from database import AsyncSessionLocal, dispose_engines
+from .services import JobApplicationService
+
+
+async def reconcile_ranks() -> int:
+    """Rebuild job_application_ranks and print any drift found"""
+    async with AsyncSessionLocal() as db:
+        report = await JobApplicationService.rebuild_ranks(db)
+    await dispose_engines()
+
+    print(f"applications: {report['applications']}  buckets: {report['buckets']}")
+    if not report["drift"]:
+        print("rank buckets are in sync")
+        return 0
+
+    print(f"drift in {len(report['drift'])} bucket(s):")
+    for item in report["drift"]:
+        print(
+            f"  job={item['job_id']:<6} score={item['score']:<5}"
+            f" expected={item['expected']} actual={item['actual']}"
+        )
+    return 1
+
+
+COMMANDS = {
+    "reconcile-ranks": reconcile_ranks,
+}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in COMMANDS:
+        print(f"usage: python -m app.job_applications.commands [{'|'.join(COMMANDS)}]")
+        sys.exit(2)
+    sys.exit(asyncio.run(COMMANDS[sys.argv[1]]()))
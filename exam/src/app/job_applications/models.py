@@ -7,7 +7,8 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     Float,
-    UniqueConstraint
+    UniqueConstraint,
+    Index
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -39,6 +40,11 @@ class JobApplication(Base):
     
     __table_args__ = (
         UniqueConstraint('user_id', 'job_id', name='unique_user_job'),
+        # applicants of a job, best score first
+        Index('ix_job_applications_job_id_score', 'job_id', score.desc()),
+        Index('ix_job_applications_user_id_priority', 'user_id', 'priority'),
+        # ranked list of a job filtered by priority
+        Index('ix_job_applications_job_id_priority_score', 'job_id', 'priority', score.desc(), 'id'),
     )
     
     # def validate_priority(self, key, priority):
@@ -49,4 +55,25 @@ class JobApplication(Base):
     # def validate_score(self, key, score):
     #     valid_scores = [5.1, 5.2, 5.3, 5.4]
     #     if score not in valid_scores:
-    #         raise ValueError(f"امتیاز باید یکی از {valid_scores} باشد")
\ No newline at end of file
+    #         raise ValueError(f"امتیاز باید یکی از {valid_scores} باشد")
+
+
+class JobApplicationRank(Base):
+    """
+    Ranked (not withdrawn) applications per job x score. The rank of an
+    application is 1 + the applications of its job with a higher score,
+    summed from these buckets instead of counting applications.
+    Maintained by JobApplicationService in the same transaction as the
+    application change, rebuilt by `python -m app.job_applications.commands`.
+    """
+
+    __tablename__ = "job_application_ranks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('job_id', 'score', name='unique_job_score_bucket'),
+    )
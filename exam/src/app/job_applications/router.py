@@ -1,15 +1,14 @@
 # router.py for job_applications
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List, Dict
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict, Optional
 from datetime import datetime
 
-from database import get_db
+from database import UnitOfWorkRoute, get_db, get_read_db, get_uow
+from export import export_response
+from pagination import CursorParams, Page
 from auth.depends import get_current_user_obj as get_current_user
 from auth.models import User
-from app.jobs_information.models import JobDB 
-from .models  import JobApplication
-from app.applicant.models import Applicant
 
 from .schemas import (
     JobApplicationBatch,
@@ -17,13 +16,16 @@ from .schemas import (
     JobApplicationUpdate,
     SingleJobApplication,
     AvailableJobResponse,
-    ApplicationsSummaryResponse
+    ApplicationsSummaryResponse,
+    RankedApplicationResponse,
+    ApplicationRankResponse
 )
+from .enums import JobApplicationStatus
 from .services import JobApplicationService
 from .selectors import JobApplicationSelector
 
 
-router = APIRouter(prefix="/job-applications", tags=["Job Applications"])
+router = APIRouter(prefix="/job-applications", tags=["Job Applications"], route_class=UnitOfWorkRoute)
 
 
 
@@ -33,73 +35,29 @@ router = APIRouter(prefix="/job-applications", tags=["Job Applications"])
 @router.get("/", response_model=List[JobApplicationResponse])
 async def get_my_job_applications(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """دریافت لیست درخواست‌های شغل کاربر"""
-    applications = await JobApplicationService.get_by_user(db, current_user.id)
-    
-    # اضافه کردن اطلاعات شغل به پاسخ
-    result = []
-    for app in applications:
-        job = await  db.query(JobDB).filter(JobDB.id == app.job_id).first()
-        app_data = JobApplicationResponse.from_orm(app)
-        if job:
-            app_data.job_title = job.title
-            app_data.company = job.company
-            app_data.location = job.location
-        result.append(app_data)
-    
-    return result
+    return await JobApplicationSelector.get_by_user_with_jobs(db, current_user.id)
 
 
 @router.post("/apply", response_model=List[JobApplicationResponse], status_code=status.HTTP_201_CREATED)
-def apply_for_jobs(
+async def apply_for_jobs(
     application_batch: JobApplicationBatch,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """ثبت درخواست برای ۳ شغل"""
     try:
-        # بررسی اینکه قبلاً درخواست نداده باشد
-        existing_count = JobApplicationSelector.count_by_user(db, current_user.id)
-        if existing_count > 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="شما قبلاً برای شغل‌ها درخواست داده‌اید"
-            )
-        
-        # بررسی وجود و اعتبار شغل‌ها
-        job_ids = [app.job_id for app in application_batch.applications]
-        jobs = JobApplicationService.validate_jobs(db, job_ids)
-        
-        # ایجاد درخواست‌ها
-        created_applications = JobApplicationService.create_batch(
-            db, current_user.id, application_batch
-        )
-        
-
-        db.commit()
-        
-        # برگرداندن پاسخ با اطلاعات کامل
-        result = []
-        for app in created_applications:
-            job = next(j for j in jobs if j.id == app.job_id)
-            app_data = JobApplicationResponse.from_orm(app)
-            app_data.job_title = job.title
-            app_data.company = job.company
-            app_data.location = job.location
-            result.append(app_data)
-        
-        return result
-        
+        return await JobApplicationService.apply_batch(db, current_user.id, application_batch)
     except ValueError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"خطا در ثبت درخواست‌ها: {str(e)}"
@@ -107,14 +65,14 @@ def apply_for_jobs(
 
 
 @router.put("/{application_id}", response_model=JobApplicationResponse)
-def update_job_application(
+async def update_job_application(
     application_id: int,
     update_data: JobApplicationUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """به‌روزرسانی درخواست شغل"""
-    application = JobApplicationService.get_by_id(db, application_id, current_user.id)
+    application = await JobApplicationService.get_by_id(db, application_id, current_user.id)
     
     if not application:
         raise HTTPException(
@@ -123,24 +81,14 @@ def update_job_application(
         )
     
     try:
-        updated_app = JobApplicationService.update(db, application, update_data)
+        updated_app = await JobApplicationService.update(db, application, update_data)
         
 
-        db.commit()
-        db.refresh(updated_app)
-        
         # اضافه کردن اطلاعات شغل
-        job = db.query(JobDB).filter(JobDB.id == updated_app.job_id).first()
-        response = JobApplicationResponse.from_orm(updated_app)
-        if job:
-            response.job_title = job.title
-            response.company = job.company
-            response.location = job.location
-        
-        return response
+        return await JobApplicationSelector.get_response_by_id(db, updated_app.id)
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"خطا در به‌روزرسانی: {str(e)}"
@@ -148,13 +96,13 @@ def update_job_application(
 
 
 @router.delete("/{application_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_job_application(
+async def delete_job_application(
     application_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """حذف درخواست شغل (انصراف)"""
-    application = JobApplicationService.get_by_id(db, application_id, current_user.id)
+    application = await JobApplicationService.get_by_id(db, application_id, current_user.id)
     
     if not application:
         raise HTTPException(
@@ -163,13 +111,11 @@ def delete_job_application(
         )
     
     try:
-        JobApplicationService.delete(db, application)
+        await JobApplicationService.delete(db, application)
         
         
-        db.commit()
-        
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"خطا در حذف: {str(e)}"
@@ -177,12 +123,12 @@ def delete_job_application(
 
 
 @router.get("/available-jobs", response_model=List[AvailableJobResponse])
-def get_available_jobs(
+async def get_available_jobs(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """دریافت لیست شغل‌های فعال و موجود"""
-    available_jobs = JobApplicationSelector.get_available_jobs(db, current_user.id)
+    available_jobs = await JobApplicationSelector.get_available_jobs(db, current_user.id)
     
     result = []
     for job in available_jobs:
@@ -202,19 +148,19 @@ def get_available_jobs(
 
 
 @router.get("/summary", response_model=ApplicationsSummaryResponse)
-def get_applications_summary(
+async def get_applications_summary(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """خلاصه درخواست‌های شغل کاربر"""
-    summary = JobApplicationSelector.get_summary(db, current_user.id)
+    summary = await JobApplicationSelector.get_summary(db, current_user.id)
     return summary
 
 
 # ========== ADMIN ENDPOINTS ==========
 @router.get("/admin/all", response_model=List[JobApplicationResponse])
-def get_all_applications(
-    db: Session = Depends(get_db),
+async def get_all_applications(
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """دریافت همه درخواست‌ها (فقط ادمین)"""
@@ -224,29 +170,31 @@ def get_all_applications(
             detail="شما دسترسی به این بخش ندارید"
         )
     
-    applications = db.query(JobApplication).all()
-    
-    # اضافه کردن اطلاعات شغل و کاربر
-    result = []
-    for app in applications:
-        job = db.query(JobDB).filter(JobDB.id == app.job_id).first()
-        user = db.query(User).filter(User.id == app.user_id).first()
-        applicant = db.query(Applicant).filter(Applicant.user_id == app.user_id).first()
-        
-        app_data = JobApplicationResponse.from_orm(app)
-        if job:
-            app_data.job_title = job.title
-            app_data.company = job.company
-        app_data.applicant_name = f"{applicant.name} {applicant.family}" if applicant else None
-        
-        result.append(app_data)
+    # یک کوئری با join روی شغل و متقاضی
+    return await JobApplicationSelector.get_all_with_details(db)
+
+
+@router.get("/admin/export")
+async def export_applications(
+    export_format: str = Query("csv", alias="format"),
+    job_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """خروجی CSV/XLSX درخواست‌ها همراه با اطلاعات شغل (فقط ادمین)"""
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="شما دسترسی به این بخش ندارید"
+        )
     
-    return result
+    query = JobApplicationSelector.export_query(job_id)
+    return export_response(db, query, "job_applications", export_format)
 
 
 @router.get("/statistics")
-def get_application_statistics(
-    db: Session = Depends(get_db),
+async def get_application_statistics(
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """آمار کلی درخواست‌ها (فقط ادمین)"""
@@ -256,5 +204,49 @@ def get_application_statistics(
             detail="شما دسترسی به این بخش ندارید"
         )
     
-    stats = JobApplicationSelector.get_statistics(db)
-    return stats
\ No newline at end of file
+    stats = await JobApplicationSelector.get_statistics(db)
+    return stats
+
+
+@router.get("/admin/jobs/{job_id}/ranking", response_model=Page[RankedApplicationResponse])
+async def get_job_ranking(
+    job_id: int,
+    priority: Optional[int] = Query(None, ge=1, le=3),
+    application_status: Optional[JobApplicationStatus] = Query(None, alias="status"),
+    params: CursorParams = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """لیست رتبه‌بندی متقاضیان یک شغل (فقط ادمین)"""
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="شما دسترسی به این بخش ندارید"
+        )
+    
+    return await JobApplicationSelector.get_ranked_page(
+        db, job_id, params, priority=priority, status=application_status
+    )
+
+
+@router.get("/admin/jobs/{job_id}/ranking/{user_id}", response_model=ApplicationRankResponse)
+async def get_applicant_rank(
+    job_id: int,
+    user_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """رتبه یک متقاضی در یک شغل (فقط ادمین)"""
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="شما دسترسی به این بخش ندارید"
+        )
+    
+    rank = await JobApplicationSelector.get_rank(db, job_id, user_id)
+    if not rank:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="درخواست شغل یافت نشد"
+        )
+    return rank
@@ -64,6 +64,9 @@ class JobApplicationResponse(JobApplicationBase):
     company: Optional[str] = None
     location: Optional[str] = None
     
+    # فیلد اضافه برای لیست ادمین
+    applicant_name: Optional[str] = None
+    
     class Config:
         from_attributes = True
 
@@ -85,4 +88,26 @@ class ApplicationsSummaryResponse(BaseModel):
     status_distribution: Dict[str, int]
     average_score: float
     last_application: Optional[datetime] = None
-    can_apply_more: bool
\ No newline at end of file
+    can_apply_more: bool
+
+
+class RankedApplicationResponse(BaseModel):
+    """An application in a job's ranked candidate list"""
+    rank: int  # 1 + ranked applications of the job with a higher score
+    id: int
+    user_id: int
+    applicant_name: Optional[str] = None
+    score: float
+    priority: int
+    status: str
+    applied_at: datetime
+
+
+class ApplicationRankResponse(BaseModel):
+    job_id: int
+    user_id: int
+    application_id: int
+    score: float
+    status: str
+    rank: Optional[int] = None  # None for a withdrawn application
+    ranked_applications: int
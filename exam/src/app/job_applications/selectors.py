@@ -1,81 +1,329 @@
 # selectors.py for job_applications
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
-from typing import List, Optional, Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import aliased
+from sqlalchemy import select, and_, or_, desc, func, case
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 
-from .models import JobApplication
+from aggregates import admin_stats_cache, facet_aggregate
+from pagination import CursorParams, Page, SortKey, encode_cursor, keyset_query
+from .enums import JobApplicationStatus
+from .models import JobApplication, JobApplicationRank
+from .schemas import ApplicationRankResponse, JobApplicationResponse, RankedApplicationResponse
 from app.jobs_information.models import JobDB
+from app.applicant.models import Applicant
 
 
 class JobApplicationSelector:
     @staticmethod
-    def get_by_id(db: Session, application_id: int, user_id: Optional[int] = None) -> Optional[JobApplication]:
+    async def get_by_id(db: AsyncSession, application_id: int, user_id: Optional[int] = None) -> Optional[JobApplication]:
         """دریافت درخواست با آیدی"""
-        query = db.query(JobApplication).filter(JobApplication.id == application_id)
+        query = select(JobApplication).where(JobApplication.id == application_id)
         if user_id:
-            query = query.filter(JobApplication.user_id == user_id)
-        return query.first()
+            query = query.where(JobApplication.user_id == user_id)
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
     
     @staticmethod
-    def get_by_user(db: Session, user_id: int) -> List[JobApplication]:
+    async def get_by_user(db: AsyncSession, user_id: int) -> List[JobApplication]:
         """دریافت درخواست‌های یک کاربر"""
-        return db.query(JobApplication).filter(
+        query = select(JobApplication).where(
             JobApplication.user_id == user_id
-        ).order_by(JobApplication.priority).all()
+        ).order_by(JobApplication.priority)
+        result = await db.execute(query)
+        return result.scalars().all()
     
     @staticmethod
-    def get_by_job(db: Session, job_id: int) -> List[JobApplication]:
+    async def get_by_job(db: AsyncSession, job_id: int) -> List[JobApplication]:
         """دریافت درخواست‌های یک شغل"""
-        return db.query(JobApplication).filter(
+        query = select(JobApplication).where(
             JobApplication.job_id == job_id
-        ).order_by(JobApplication.score.desc()).all()
+        ).order_by(JobApplication.score.desc())
+        result = await db.execute(query)
+        return result.scalars().all()
+    
+    # ---------- ranking (rank buckets in job_application_ranks) ----------
+    RANK_KEYS = [
+        SortKey(JobApplication.score, descending=True),
+        SortKey(JobApplication.id),
+    ]
+    
+    @staticmethod
+    async def get_score_ranks(db: AsyncSession, job_id: int) -> Dict[float, int]:
+        """Rank of every score present in a job (1 + applications with a higher score)"""
+        result = await db.execute(
+            select(JobApplicationRank.score, JobApplicationRank.count).where(
+                JobApplicationRank.job_id == job_id,
+                JobApplicationRank.count > 0,
+            ).order_by(JobApplicationRank.score.desc())
+        )
+        ranks, above = {}, 0
+        for score, count in result.all():
+            ranks[score] = above + 1
+            above += count
+        return ranks
+    
+    @staticmethod
+    async def get_ranked_page(
+        db: AsyncSession,
+        job_id: int,
+        params: CursorParams,
+        priority: Optional[int] = None,
+        status: Optional[JobApplicationStatus] = None,
+    ) -> Page:
+        """
+        Candidates of a job, best score first (earlier application first on
+        ties), with their rank in the whole job. Filters narrow the list
+        but do not change the ranks.
+        """
+        query = select(JobApplication, Applicant.name, Applicant.family).outerjoin(
+            Applicant, Applicant.user_id == JobApplication.user_id
+        ).where(
+            JobApplication.job_id == job_id,
+            JobApplication.status.is_distinct_from(JobApplicationStatus.WITHDRAWN.value),
+        )
+        if priority is not None:
+            query = query.where(JobApplication.priority == priority)
+        if status is not None:
+            query = query.where(JobApplication.status == status.value)
+        
+        result = await db.execute(keyset_query(query, JobApplicationSelector.RANK_KEYS, params))
+        rows = result.all()
+        has_more = len(rows) > params.limit
+        rows = rows[:params.limit]
+        
+        ranks = await JobApplicationSelector.get_score_ranks(db, job_id) if rows else {}
+        items = [
+            RankedApplicationResponse(
+                rank=ranks.get(application.score, 0),
+                id=application.id,
+                user_id=application.user_id,
+                applicant_name=f"{name} {family}" if name is not None else None,
+                score=application.score,
+                priority=application.priority,
+                status=application.status,
+                applied_at=application.applied_at,
+            )
+            for application, name, family in rows
+        ]
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1][0]
+            next_cursor = encode_cursor([last.score, last.id])
+        return Page(items=items, next_cursor=next_cursor, has_more=has_more)
+    
+    @staticmethod
+    async def get_rank(db: AsyncSession, job_id: int, user_id: int) -> Optional[ApplicationRankResponse]:
+        """
+        Rank of a user's application in a job: one lookup on the
+        (user_id, job_id) unique index plus a sum over the job's score
+        buckets, independent of how many applications the job has.
+        """
+        application = (await db.execute(
+            select(JobApplication).where(
+                JobApplication.user_id == user_id,
+                JobApplication.job_id == job_id,
+            )
+        )).scalar_one_or_none()
+        if application is None:
+            return None
+        
+        above, total = (await db.execute(
+            select(
+                func.coalesce(func.sum(case(
+                    (JobApplicationRank.score > application.score, JobApplicationRank.count), else_=0
+                )), 0),
+                func.coalesce(func.sum(JobApplicationRank.count), 0),
+            ).where(JobApplicationRank.job_id == job_id)
+        )).one()
+        
+        withdrawn = application.status == JobApplicationStatus.WITHDRAWN.value
+        return ApplicationRankResponse(
+            job_id=job_id,
+            user_id=user_id,
+            application_id=application.id,
+            score=application.score,
+            status=application.status,
+            rank=None if withdrawn else above + 1,
+            ranked_applications=total,
+        )
     
     @staticmethod
-    def get_by_status(db: Session, status: str, user_id: Optional[int] = None) -> List[JobApplication]:
+    async def get_by_status(db: AsyncSession, status: str, user_id: Optional[int] = None) -> List[JobApplication]:
         """دریافت درخواست‌ها بر اساس وضعیت"""
-        query = db.query(JobApplication).filter(JobApplication.status == status)
+        query = select(JobApplication).where(JobApplication.status == status)
         if user_id:
-            query = query.filter(JobApplication.user_id == user_id)
-        return query.all()
+            query = query.where(JobApplication.user_id == user_id)
+        result = await db.execute(query)
+        return result.scalars().all()
     
     @staticmethod
-    def check_exists(db: Session, user_id: int, job_id: int) -> bool:
+    async def check_exists(db: AsyncSession, user_id: int, job_id: int) -> bool:
         """بررسی وجود درخواست برای شغل خاص"""
-        return db.query(JobApplication).filter(
-            and_(
-                JobApplication.user_id == user_id,
-                JobApplication.job_id == job_id
-            )
-        ).first() is not None
+        result = await db.execute(
+            select(JobApplication.id).where(
+                and_(
+                    JobApplication.user_id == user_id,
+                    JobApplication.job_id == job_id
+                )
+            ).limit(1)
+        )
+        return result.first() is not None
     
     @staticmethod
-    def count_by_user(db: Session, user_id: int) -> int:
+    async def get_batch_apply_state(db: AsyncSession, user_id: int, job_ids: List[int]) -> Tuple[int, List[Row]]:
+        """
+        Everything a batch apply validates, in one query: how many
+        applications the user already has and, for each requested job that
+        exists, its active/expired flags and the user's application on it.
+        """
+        existing = select(func.count().label("existing")).select_from(JobApplication).where(
+            JobApplication.user_id == user_id
+        ).subquery()
+        own = aliased(JobApplication, name="application")
+        today = datetime.utcnow().date()
+        query = select(
+            existing.c.existing,
+            JobDB.id,
+            JobDB.title,
+            JobDB.company,
+            JobDB.location,
+            JobDB.is_active,
+            and_(JobDB.deadline.isnot(None), JobDB.deadline < today).label("expired"),
+            own,
+        ).select_from(existing).outerjoin(
+            JobDB, JobDB.id.in_(job_ids)
+        ).outerjoin(
+            own, and_(own.job_id == JobDB.id, own.user_id == user_id)
+        )
+        rows = (await db.execute(query)).all()
+        return rows[0].existing, [row for row in rows if row.id is not None]
+    
+    @staticmethod
+    async def count_by_user(db: AsyncSession, user_id: int) -> int:
         """تعداد درخواست‌های یک کاربر"""
-        return db.query(JobApplication).filter(JobApplication.user_id == user_id).count()
+        result = await db.execute(
+            select(func.count()).select_from(JobApplication).where(JobApplication.user_id == user_id)
+        )
+        return result.scalar() or 0
+    
+    # ---------- joined listings (one statement, no per-row lookups) ----------
+    @staticmethod
+    def _with_job_query():
+        return select(
+            JobApplication,
+            JobDB.title,
+            JobDB.company,
+            JobDB.location,
+        ).outerjoin(JobDB, JobDB.id == JobApplication.job_id)
     
     @staticmethod
-    def get_available_jobs(db: Session, user_id: int) -> List[JobDB]:
+    def _to_response(
+        application: JobApplication,
+        job_title: Optional[str],
+        company: Optional[str],
+        location: Optional[str],
+        applicant_name: Optional[str] = None,
+    ) -> JobApplicationResponse:
+        response = JobApplicationResponse.model_validate(application)
+        response.job_title = job_title
+        response.company = company
+        response.location = location
+        response.applicant_name = applicant_name
+        return response
+    
+    @staticmethod
+    async def get_response_by_id(db: AsyncSession, application_id: int) -> Optional[JobApplicationResponse]:
+        """دریافت یک درخواست همراه با اطلاعات شغل"""
+        query = JobApplicationSelector._with_job_query().where(
+            JobApplication.id == application_id
+        )
+        result = await db.execute(query)
+        row = result.first()
+        return JobApplicationSelector._to_response(*row) if row else None
+    
+    @staticmethod
+    async def get_by_user_with_jobs(db: AsyncSession, user_id: int) -> List[JobApplicationResponse]:
+        """درخواست‌های یک کاربر همراه با اطلاعات شغل"""
+        query = JobApplicationSelector._with_job_query().where(
+            JobApplication.user_id == user_id
+        ).order_by(JobApplication.priority)
+        result = await db.execute(query)
+        return [JobApplicationSelector._to_response(*row) for row in result.all()]
+    
+    @staticmethod
+    async def get_all_with_details(db: AsyncSession) -> List[JobApplicationResponse]:
+        """همه درخواست‌ها همراه با اطلاعات شغل و نام متقاضی"""
+        query = JobApplicationSelector._with_job_query().add_columns(
+            Applicant.name,
+            Applicant.family,
+        ).outerjoin(
+            Applicant, Applicant.user_id == JobApplication.user_id
+        ).order_by(JobApplication.id)
+        result = await db.execute(query)
+        
+        responses = []
+        for application, job_title, company, location, name, family in result.all():
+            applicant_name = f"{name} {family}" if name is not None else None
+            responses.append(
+                JobApplicationSelector._to_response(
+                    application, job_title, company, location, applicant_name
+                )
+            )
+        return responses
+    
+    @staticmethod
+    def export_query(job_id: Optional[int] = None):
+        """ردیف‌های خروجی CSV/XLSX: درخواست + شغل + نام متقاضی"""
+        query = select(
+            JobApplication.id,
+            JobApplication.user_id,
+            Applicant.name.label("applicant_name"),
+            Applicant.family.label("applicant_family"),
+            Applicant.national_code,
+            JobApplication.job_id,
+            JobDB.title.label("job_title"),
+            JobDB.company,
+            JobDB.location,
+            JobApplication.score,
+            JobApplication.priority,
+            JobApplication.status,
+            JobApplication.applied_at,
+        ).join(
+            JobDB, JobDB.id == JobApplication.job_id
+        ).outerjoin(
+            Applicant, Applicant.user_id == JobApplication.user_id
+        ).order_by(JobApplication.id)
+        if job_id is not None:
+            query = query.where(JobApplication.job_id == job_id)
+        return query
+    
+    @staticmethod
+    async def get_available_jobs(db: AsyncSession, user_id: int) -> List[JobDB]:
         """دریافت شغل‌های قابل درخواست برای کاربر"""
         # شغل‌هایی که کاربر قبلاً برای آنها درخواست نداده
-        applied_job_ids = db.query(JobApplication.job_id).filter(
+        applied_job_ids = select(JobApplication.job_id).where(
             JobApplication.user_id == user_id
-        ).subquery()
+        )
         
-        available_jobs = db.query(JobDB).filter(
+        query = select(JobDB).where(
             JobDB.is_active == True,
             JobDB.id.notin_(applied_job_ids),
             (JobDB.deadline.is_(None) | (JobDB.deadline >= datetime.utcnow().date()))
-        ).order_by(JobDB.posted_date.desc()).all()
-        
-        return available_jobs
+        ).order_by(JobDB.posted_date.desc())
+        result = await db.execute(query)
+        return result.scalars().all()
     
     @staticmethod
-    def get_summary(db: Session, user_id: int) -> Dict:
+    async def get_summary(db: AsyncSession, user_id: int) -> Dict:
         """خلاصه درخواست‌های شغل کاربر"""
-        applications = db.query(JobApplication).filter(
-            JobApplication.user_id == user_id
-        ).all()
+        result = await db.execute(
+            select(JobApplication).where(
+                JobApplication.user_id == user_id
+            ).order_by(JobApplication.applied_at, JobApplication.id)
+        )
+        applications = result.scalars().all()
         
         total_applications = len(applications)
         status_count = {
@@ -103,25 +351,27 @@ class JobApplicationSelector:
             "can_apply_more": total_applications < 3
         }
     
+    STATUSES = ["pending", "reviewed", "accepted", "rejected", "withdrawn"]
+    SCORES = [5.1, 5.2, 5.3, 5.4]
+
     @staticmethod
-    def get_statistics(db: Session) -> Dict:
+    async def get_statistics(db: AsyncSession) -> Dict:
         """آمار کلی درخواست‌ها"""
-        total = db.query(JobApplication).count()
-        
-        # آمار بر اساس وضعیت
-        status_stats = {}
-        for status in ["pending", "reviewed", "accepted", "rejected", "withdrawn"]:
-            count = db.query(JobApplication).filter(JobApplication.status == status).count()
-            status_stats[status] = count
-        
-        # آمار بر اساس امتیاز
-        score_stats = {}
-        for score in [5.1, 5.2, 5.3, 5.4]:
-            count = db.query(JobApplication).filter(JobApplication.score == score).count()
-            score_stats[str(score)] = count
+        return await admin_stats_cache.get_or_compute(
+            "job_applications", lambda: JobApplicationSelector._compute_statistics(db)
+        )
+
+    @staticmethod
+    async def _compute_statistics(db: AsyncSession) -> Dict:
+        stats = await facet_aggregate(db, JobApplication, {
+            "by_status": JobApplication.status,
+            "by_score": JobApplication.score,
+        }, {
+            "total_applications": func.count(),
+        })
         
         return {
-            "total_applications": total,
-            "by_status": status_stats,
-            "by_score": score_stats
-        }
\ No newline at end of file
+            "total_applications": stats["total_applications"],
+            "by_status": {status: stats["by_status"].get(status, 0) for status in JobApplicationSelector.STATUSES},
+            "by_score": {str(score): stats["by_score"].get(score, 0) for score in JobApplicationSelector.SCORES}
+        }
@@ -1,21 +1,188 @@
 # services.py for job_applications
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, update, delete, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import Counter
 
-from .models import JobApplication
+from .enums import JobApplicationStatus
+from .models import JobApplication, JobApplicationRank
 from .schemas import (
     JobApplicationBatch,
+    JobApplicationResponse,
     JobApplicationUpdate,
     SingleJobApplication
 )
+from .selectors import JobApplicationSelector
 
 from app.jobs_information.models import JobDB
-import datetime
+from datetime import datetime
+
+
+RankKey = Tuple[int, float]  # (job_id, score)
+
+
+def _rank_key(application: JobApplication) -> Optional[RankKey]:
+    """Rank bucket an application is counted in; withdrawn ones are not ranked"""
+    if application.status == JobApplicationStatus.WITHDRAWN.value:
+        return None
+    return (application.job_id, application.score)
+
+
+def _dialect_insert(db: AsyncSession):
+    """INSERT construct with ON CONFLICT support, or None for other databases"""
+    return {"postgresql": pg_insert, "sqlite": sqlite_insert}.get(db.bind.dialect.name)
+
+
+async def _apply_rank_changes(db: AsyncSession, changes: Counter) -> None:
+    """
+    Add per-bucket deltas to the rank buckets inside the caller's
+    transaction: one multi-row upsert on PostgreSQL and SQLite.
+    """
+    rows = [
+        {"job_id": key[0], "score": key[1], "count": delta}
+        for key, delta in changes.items()
+        if key is not None and delta
+    ]
+    if not rows:
+        return
+    
+    insert = _dialect_insert(db)
+    if insert is not None:
+        stmt = insert(JobApplicationRank).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["job_id", "score"],
+            set_={"count": JobApplicationRank.count + stmt.excluded.count},
+        )
+        await db.execute(stmt)
+        return
+    
+    for row in rows:
+        result = await db.execute(
+            update(JobApplicationRank)
+            .where(and_(JobApplicationRank.job_id == row["job_id"], JobApplicationRank.score == row["score"]))
+            .values(count=JobApplicationRank.count + row["count"])
+        )
+        if result.rowcount == 0:
+            db.add(JobApplicationRank(**row))
+
+
+async def add_to_ranks(db: AsyncSession, applications: Iterable[JobApplication]) -> None:
+    """Count newly created applications in their rank buckets"""
+    await _apply_rank_changes(db, Counter(_rank_key(application) for application in applications))
+
 
 class JobApplicationService:
     @staticmethod
-    def create_batch(
-        db: Session, 
+    async def apply_batch(
+        db: AsyncSession,
+        user_id: int,
+        application_batch: JobApplicationBatch
+    ) -> List[JobApplicationResponse]:
+        """
+        Submit a user's applications in two round trips: one query for all
+        validation, one multi-row INSERT (plain ORM inserts on databases
+        without ON CONFLICT). A retried submission (same jobs, already
+        stored) returns the stored applications; unique_user_job keeps
+        concurrent duplicates out.
+        """
+        requested = application_batch.applications
+        job_ids = [app_data.job_id for app_data in requested]
+        existing_count, rows = await JobApplicationSelector.get_batch_apply_state(db, user_id, job_ids)
+        jobs = {row.id: row for row in rows}
+        
+        if existing_count:
+            stored = [row.application for row in rows if row.application is not None]
+            if existing_count == len(job_ids) == len(stored):
+                return JobApplicationService._batch_responses(stored, jobs)
+            raise ValueError("شما قبلاً برای شغل‌ها درخواست داده‌اید")
+        
+        missing_ids = set(job_ids) - set(jobs)
+        if missing_ids:
+            raise ValueError(f"شغل‌های با آیدی {missing_ids} یافت نشد")
+        
+        inactive_jobs = [row.title for row in rows if not row.is_active]
+        if inactive_jobs:
+            raise ValueError(f"شغل‌های زیر غیرفعال هستند: {', '.join(inactive_jobs)}")
+        
+        expired_jobs = [row.title for row in rows if row.expired]
+        if expired_jobs:
+            raise ValueError(f"مهلت درخواست برای شغل‌های زیر به پایان رسیده: {', '.join(expired_jobs)}")
+        
+        values = [
+            {
+                "user_id": user_id,
+                "job_id": app_data.job_id,
+                "score": app_data.score,
+                "priority": app_data.priority,
+                "status": JobApplicationStatus.PENDING.value,
+            }
+            for app_data in requested
+        ]
+        insert = _dialect_insert(db)
+        if insert is not None:
+            result = await db.execute(
+                insert(JobApplication)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=["user_id", "job_id"])
+                .returning(JobApplication)
+            )
+            created = list(result.scalars().all())
+            conflict = len(created) < len(values)
+        else:
+            created = [JobApplication(**row) for row in values]
+            try:
+                async with db.begin_nested():
+                    db.add_all(created)
+                    await db.flush()
+                conflict = False
+            except IntegrityError:
+                created, conflict = [], True
+        
+        if conflict:
+            # a concurrent submission got in first (unique_user_job)
+            return await JobApplicationService._concurrent_batch(db, user_id, job_ids, created, jobs)
+        
+        await add_to_ranks(db, created)
+        return JobApplicationService._batch_responses(created, jobs)
+    
+    @staticmethod
+    async def _concurrent_batch(
+        db: AsyncSession,
+        user_id: int,
+        job_ids: List[int],
+        created: List[JobApplication],
+        jobs: Dict[int, Any]
+    ) -> List[JobApplicationResponse]:
+        """
+        The same batch stored by the other request counts as a retry;
+        anything else is rejected like any repeated submission (the caller
+        rolls back rows this request did insert).
+        """
+        stored = list((await db.execute(
+            select(JobApplication).where(JobApplication.user_id == user_id)
+        )).scalars().all())
+        if not created and sorted(application.job_id for application in stored) == sorted(job_ids):
+            return JobApplicationService._batch_responses(stored, jobs)
+        raise ValueError("شما قبلاً برای شغل‌ها درخواست داده‌اید")
+    
+    @staticmethod
+    def _batch_responses(applications: List[JobApplication], jobs: Dict[int, Any]) -> List[JobApplicationResponse]:
+        return [
+            JobApplicationSelector._to_response(
+                application,
+                jobs[application.job_id].title,
+                jobs[application.job_id].company,
+                jobs[application.job_id].location,
+            )
+            for application in sorted(applications, key=lambda application: application.priority)
+        ]
+    
+    @staticmethod
+    async def create_batch(
+        db: AsyncSession, 
         user_id: int, 
         application_batch: JobApplicationBatch
     ) -> List[JobApplication]:
@@ -33,12 +200,13 @@ class JobApplicationService:
             db.add(new_application)
             created_applications.append(new_application)
         
-        db.flush()
+        await db.flush()
+        await add_to_ranks(db, created_applications)
         return created_applications
     
     @staticmethod
-    def create_single(
-        db: Session,
+    async def create_single(
+        db: AsyncSession,
         user_id: int,
         application_data: SingleJobApplication
     ) -> JobApplication:
@@ -51,54 +219,69 @@ class JobApplicationService:
             status="pending"
         )
         db.add(new_application)
-        db.flush()
+        await db.flush()
+        await add_to_ranks(db, [new_application])
         return new_application
     
     @staticmethod
-    def get_by_id(db: Session, application_id: int, user_id: Optional[int] = None) -> Optional[JobApplication]:
+    async def get_by_id(db: AsyncSession, application_id: int, user_id: Optional[int] = None) -> Optional[JobApplication]:
         """دریافت درخواست با آیدی"""
-        query = db.query(JobApplication).filter(JobApplication.id == application_id)
+        query = select(JobApplication).where(JobApplication.id == application_id)
         if user_id:
-            query = query.filter(JobApplication.user_id == user_id)
-        return query.first()
+            query = query.where(JobApplication.user_id == user_id)
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
     
     @staticmethod
-    def get_by_user(db: Session, user_id: int) -> List[JobApplication]:
+    async def get_by_user(db: AsyncSession, user_id: int) -> List[JobApplication]:
         """دریافت درخواست‌های یک کاربر"""
-        return db.query(JobApplication).filter(JobApplication.user_id == user_id).all()
+        result = await db.execute(
+            select(JobApplication).where(JobApplication.user_id == user_id)
+        )
+        return result.scalars().all()
     
     @staticmethod
-    def update(
-        db: Session, 
+    async def update(
+        db: AsyncSession, 
         application: JobApplication, 
         update_data: JobApplicationUpdate
     ) -> JobApplication:
         """به‌روزرسانی درخواست شغل"""
         update_dict = update_data.dict(exclude_unset=True)
+        old_key = _rank_key(application)
         
         for field, value in update_dict.items():
             setattr(application, field, value)
         
+        new_key = _rank_key(application)
+        if new_key != old_key:
+            await _apply_rank_changes(db, Counter({old_key: -1, new_key: 1}))
+        
         application.updated_at = datetime.utcnow()
         db.add(application)
-        db.flush()
+        await db.flush()
         return application
     
     @staticmethod
-    def delete(db: Session, application: JobApplication) -> None:
+    async def delete(db: AsyncSession, application: JobApplication) -> None:
         """حذف درخواست شغل"""
-        db.delete(application)
-        db.flush()
+        await _apply_rank_changes(db, Counter({_rank_key(application): -1}))
+        await db.delete(application)
+        await db.flush()
     
     @staticmethod
-    def count_by_user(db: Session, user_id: int) -> int:
+    async def count_by_user(db: AsyncSession, user_id: int) -> int:
         """تعداد درخواست‌های یک کاربر"""
-        return db.query(JobApplication).filter(JobApplication.user_id == user_id).count()
+        result = await db.execute(
+            select(func.count()).select_from(JobApplication).where(JobApplication.user_id == user_id)
+        )
+        return result.scalar() or 0
     
     @staticmethod
-    def validate_jobs(db: Session, job_ids: List[int]) -> List[JobDB]:
+    async def validate_jobs(db: AsyncSession, job_ids: List[int]) -> List[JobDB]:
         """اعتبارسنجی شغل‌ها"""
-        jobs = db.query(JobDB).filter(JobDB.id.in_(job_ids)).all()
+        result = await db.execute(select(JobDB).where(JobDB.id.in_(job_ids)))
+        jobs = result.scalars().all()
         
         if len(jobs) != len(job_ids):
             missing_ids = set(job_ids) - {job.id for job in jobs}
@@ -118,4 +301,48 @@ class JobApplicationService:
         if expired_jobs:
             raise ValueError(f"مهلت درخواست برای شغل‌های زیر به پایان رسیده: {', '.join(expired_jobs)}")
         
-        return jobs
\ No newline at end of file
+        return jobs
+    
+    @staticmethod
+    async def rebuild_ranks(db: AsyncSession) -> Dict[str, Any]:
+        """
+        Recompute the rank buckets from job_applications, replace them and
+        report every bucket whose stored count had drifted.
+        """
+        expected = Counter()
+        rows = await db.execute(
+            select(JobApplication.job_id, JobApplication.score, func.count())
+            .where(JobApplication.status.is_distinct_from(JobApplicationStatus.WITHDRAWN.value))
+            .group_by(JobApplication.job_id, JobApplication.score)
+        )
+        for job_id, score, count in rows:
+            expected[(job_id, score)] = count
+        
+        actual = Counter()
+        for bucket in (await db.execute(select(JobApplicationRank))).scalars():
+            actual[(bucket.job_id, bucket.score)] += bucket.count
+        
+        drift = [
+            {
+                "job_id": key[0],
+                "score": key[1],
+                "expected": expected.get(key, 0),
+                "actual": actual.get(key, 0),
+            }
+            for key in sorted(set(expected) | set(actual))
+            if expected.get(key, 0) != actual.get(key, 0)
+        ]
+        
+        await db.execute(delete(JobApplicationRank))
+        if expected:
+            db.add_all(
+                JobApplicationRank(job_id=job_id, score=score, count=count)
+                for (job_id, score), count in expected.items()
+            )
+        await db.commit()
+        
+        return {
+            "applications": sum(expected.values()),
+            "buckets": len(expected),
+            "drift": drift,
+        }
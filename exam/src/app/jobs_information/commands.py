@@ -0,0 +1,34 @@
+"""
+Maintenance commands for jobs.
+
+Run from the src directory:
+    python -m app.jobs_information.commands rebuild-search
+"""
+import asyncio
+import sys
+
+from database import dispose_engines, engine
+from .search import rebuild_search_index, search_backend
+
+
+async def rebuild_search() -> int:
+    """Recreate the job search index from jobs"""
+    async with engine.begin() as conn:
+        await conn.run_sync(search_backend.create)
+        total = await conn.run_sync(rebuild_search_index)
+    await dispose_engines()
+
+    print(f"indexed {total} job(s) with the {search_backend.name} backend")
+    return 0
+
+
+COMMANDS = {
+    "rebuild-search": rebuild_search,
+}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in COMMANDS:
+        print(f"usage: python -m app.jobs_information.commands [{'|'.join(COMMANDS)}]")
+        sys.exit(2)
+    sys.exit(asyncio.run(COMMANDS[sys.argv[1]]()))
@@ -1,69 +1,73 @@
 # router.py for jobs_information
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import date
 
-from database import get_db
-from auth.depends import get_current_user
+from database import UnitOfWorkRoute, get_db, get_read_db, get_uow
+from pagination import CursorParams, Page
+from auth.depends import get_current_user_obj as get_current_user
 from auth.models import User
-from .schemas import JobCreate, JobUpdate, JobResponse
+from .schemas import JobCreate, JobUpdate, JobResponse, JobSearchResponse
 from .services import JobService, AdminJobAssignmentService
 from .selectors import JobSelector, AdminJobAssignmentSelector
 
-router = APIRouter(prefix="/job", tags=["Jobs Information"])
+router = APIRouter(prefix="/job", tags=["Jobs Information"], route_class=UnitOfWorkRoute)
 
 
 # ========== JOB ==========
 @router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
-def create_job(
+async def create_job(
     job: JobCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_uow),
     current_user: User = Depends(get_current_user)
 ):
     try:
-        db_job = JobService.create(db, job)
+        db_job = await JobService.create(db, job)
         
-        AdminJobAssignmentService.create(db, current_user.id, db_job.id)
-        
-        db.commit()
-        db.refresh(db_job)
+        await AdminJobAssignmentService.create(db, current_user.id, db_job.id)
         
         return db_job
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"خطا در ایجاد شغل: {str(e)}"
         )
 
 
-@router.get("/", response_model=List[JobResponse])
-def get_jobs(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100),
+@router.get("/", response_model=Page[JobResponse])
+async def get_jobs(
+    pagination: CursorParams = Depends(),
     active_only: bool = True,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """دریافت لیست شغل‌ها"""
     # اگر ادمین است، فقط شغل‌های خودش را ببیند
-    if current_user.role == "admin":
-        jobs = JobService.get_by_admin(db, current_user.id, skip, limit, active_only)
-    else:
-        jobs = JobService.get_all(db, skip, limit, active_only)
-    
-    return jobs
+    admin_id = current_user.id if current_user.role == "admin" else None
+    return await JobService.get_page(db, pagination, active_only, admin_id)
+
+
+# ========== STATISTICS ==========
+# registered before /{job_id}, which would otherwise match "/statistics"
+@router.get("/statistics")
+async def get_job_statistics(
+    db: AsyncSession = Depends(get_db)
+):
+    """دریافت آمار شغل‌ها"""
+    stats = await JobSelector.get_statistics(db)
+    return stats
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-def get_job(
+async def get_job(
     job_id: int, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """دریافت اطلاعات یک شغل خاص"""
-    job = JobService.get_by_id(db, job_id)
+    job = await JobService.get_by_id(db, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -73,14 +77,14 @@ def get_job(
 
 
 @router.put("/{job_id}", response_model=JobResponse)
-def update_job(
+async def update_job(
     job_id: int, 
     job_update: JobUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_uow),
     current_user: User = Depends(get_current_user)
 ):
     """به‌روزرسانی اطلاعات شغل"""
-    job = JobService.get_by_id(db, job_id)
+    job = await JobService.get_by_id(db, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -89,7 +93,7 @@ def update_job(
     
     # بررسی دسترسی ادمین
     if current_user.role == "admin":
-        is_assigned = AdminJobAssignmentSelector.check_assignment(db, current_user.id, job_id)
+        is_assigned = await AdminJobAssignmentSelector.check_assignment(db, current_user.id, job_id)
         if not is_assigned:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -97,13 +101,11 @@ def update_job(
             )
     
     try:
-        updated_job = JobService.update(db, job, job_update)
-        db.commit()
-        db.refresh(updated_job)
+        updated_job = await JobService.update(db, job, job_update)
         return updated_job
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"خطا در به‌روزرسانی: {str(e)}"
@@ -111,13 +113,13 @@ def update_job(
 
 
 @router.delete("/{job_id}")
-def delete_job(
+async def delete_job(
     job_id: int, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_uow),
     current_user: User = Depends(get_current_user)
 ):
     """حذف شغل"""
-    job = JobService.get_by_id(db, job_id)
+    job = await JobService.get_by_id(db, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -126,7 +128,7 @@ def delete_job(
     
     # بررسی دسترسی ادمین
     if current_user.role == "admin":
-        is_assigned = AdminJobAssignmentSelector.check_assignment(db, current_user.id, job_id)
+        is_assigned = await AdminJobAssignmentSelector.check_assignment(db, current_user.id, job_id)
         if not is_assigned:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -135,15 +137,14 @@ def delete_job(
     
     try:
         # حذف انتساب‌ها
-        AdminJobAssignmentService.delete_by_job(db, job_id)
+        await AdminJobAssignmentService.delete_by_job(db, job_id)
         # حذف شغل
-        JobService.delete(db, job)
-        db.commit()
+        await JobService.delete(db, job)
         
         return {"message": "شغل با موفقیت حذف شد"}
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"خطا در حذف: {str(e)}"
@@ -151,63 +152,56 @@ def delete_job(
 
 
 # ========== SEARCH ==========
-@router.get("/search/", response_model=List[JobResponse])
-def search_jobs(
+@router.get("/search/", response_model=JobSearchResponse)
+async def search_jobs(
     q: Optional[str] = Query(None, min_length=2, description="کلمه کلیدی"),
     location: Optional[str] = None,
     company: Optional[str] = None,
     job_type: Optional[str] = None,
-    db: Session = Depends(get_db)
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10000),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """جستجوی شغل‌ها"""
-    jobs = JobSelector.search_jobs(
+    """جستجوی شغل‌ها به ترتیب ارتباط، همراه با شمارش location/company/job_type"""
+    return await JobSelector.search_jobs(
         db, 
         search_term=q, 
         location=location, 
         company=company,
-        job_type=job_type
+        job_type=job_type,
+        limit=limit,
+        offset=offset
     )
-    return jobs
 
 
 # ========== ACTIVE JOBS ==========
 @router.get("/active/", response_model=List[JobResponse])
-def get_active_jobs(
-    db: Session = Depends(get_db)
+async def get_active_jobs(
+    db: AsyncSession = Depends(get_db)
 ):
     """دریافت شغل‌های فعال"""
-    jobs = JobSelector.get_active_jobs(db)
+    jobs = await JobSelector.get_active_jobs(db)
     return jobs
 
 
 # ========== UPCOMING DEADLINES ==========
 @router.get("/deadlines/upcoming", response_model=List[JobResponse])
-def get_upcoming_deadlines(
+async def get_upcoming_deadlines(
     days: int = Query(7, ge=1, le=30),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """دریافت شغل‌هایی که مهلت آنها نزدیک است"""
-    jobs = JobSelector.get_upcoming_deadlines(db, days)
+    jobs = await JobSelector.get_upcoming_deadlines(db, days)
     return jobs
 
 
-# ========== STATISTICS ==========
-@router.get("/statistics")
-def get_job_statistics(
-    db: Session = Depends(get_db)
-):
-    """دریافت آمار شغل‌ها"""
-    stats = JobSelector.get_statistics(db)
-    return stats
-
-
 # ========== BY DATE RANGE ==========
 @router.get("/by-date/", response_model=List[JobResponse])
-def get_jobs_by_date_range(
+async def get_jobs_by_date_range(
     start_date: date,
     end_date: date,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """دریافت شغل‌ها در بازه زمانی"""
-    jobs = JobSelector.get_jobs_by_date_range(db, start_date, end_date)
+    jobs = await JobSelector.get_jobs_by_date_range(db, start_date, end_date)
     return jobs
\ No newline at end of file
@@ -1,7 +1,7 @@
 # schemas.py for jobs_information
 from pydantic import BaseModel, Field, validator
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 
 class JobBase(BaseModel):
@@ -49,6 +49,14 @@ class JobResponse(JobBase):
         from_attributes = True
 
 
+class JobSearchResponse(BaseModel):
+    items: List[JobResponse]
+    total: int
+    facets: Dict[str, Dict[str, int]]  # facet -> value -> تعداد
+    limit: int
+    offset: int
+
+
 class AdminJobAssignmentBase(BaseModel):
     admin_id: int
     job_id: int
@@ -0,0 +1,220 @@
+"""
+Job search index.
+
+Title, description and requirements of every job are kept, normalized,
+in the `job_search` inverted index, written in the same flush as the job:
+
+- SQLite: FTS5 table (unicode61 words, prefix match), ranked with bm25
+- PostgreSQL: weighted tsvector with a GIN index, ranked with ts_rank
+- anything else: no index, LIKE over the job columns and no ranking
+
+Rebuild it with `python -m app.jobs_information.commands rebuild-search`.
+"""
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import column, delete, event, func, inspect, literal, literal_column, or_, select, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+
+from database import engine
+from persian import normalize_persian
+from .models import JobDB
+
+
+SEARCH_TABLE = "job_search"
+SEARCH_FIELDS = ("title", "description", "requirements")
+# relevance weight of a match in each field
+FIELD_WEIGHTS = {"title": 10.0, "description": 1.0, "requirements": 2.0}
+REBUILD_BATCH_SIZE = 1000
+
+_WORD_RE = re.compile(r"\w+")
+
+Document = Tuple[int, str, str, str]  # job id + normalized SEARCH_FIELDS
+
+
+def search_terms(search: Optional[str]) -> List[str]:
+    """Normalized words of a search box; every word has to match"""
+    return _WORD_RE.findall(normalize_persian(search))
+
+
+def job_document(job_id: int, values: Sequence[Optional[str]]) -> Document:
+    return (job_id, *(normalize_persian(value) for value in values))
+
+
+class LikeJobSearchBackend:
+    """No index: LIKE over the job columns, every match ranks the same"""
+
+    name = "like"
+
+    def exists(self, connection: Connection) -> bool:
+        return True
+
+    def create(self, connection: Connection) -> None:
+        pass
+
+    def clear(self, connection: Connection) -> None:
+        pass
+
+    def upsert(self, connection: Connection, documents: Sequence[Document]) -> None:
+        pass
+
+    def remove(self, connection: Connection, job_id: int) -> None:
+        pass
+
+    def matches(self, terms: List[str]) -> Select:
+        """(job_id, rank) of the matching jobs; a higher rank is more relevant"""
+        return select(JobDB.id.label("job_id"), literal(0.0).label("rank")).where(*(
+            or_(*(getattr(JobDB, field).contains(term, autoescape=True) for field in SEARCH_FIELDS))
+            for term in terms
+        ))
+
+
+class SqliteFtsJobSearchBackend(LikeJobSearchBackend):
+    """FTS5 table keyed by rowid = job id"""
+
+    name = "sqlite-fts5"
+    index = table(SEARCH_TABLE, column("rowid"))
+
+    def exists(self, connection: Connection) -> bool:
+        return connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+            {"name": SEARCH_TABLE},
+        ).first() is not None
+
+    def create(self, connection: Connection) -> None:
+        connection.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE}"
+            f" USING fts5({', '.join(SEARCH_FIELDS)}, tokenize='unicode61 remove_diacritics 2')"
+        ))
+
+    def clear(self, connection: Connection) -> None:
+        connection.execute(delete(self.index))
+
+    def upsert(self, connection: Connection, documents: Sequence[Document]) -> None:
+        connection.execute(
+            text(
+                f"INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_FIELDS)})"
+                " VALUES (:id, :title, :description, :requirements)"
+            ),
+            [dict(zip(("id", *SEARCH_FIELDS), document)) for document in documents],
+        )
+
+    def remove(self, connection: Connection, job_id: int) -> None:
+        connection.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :id"), {"id": job_id})
+
+    def matches(self, terms: List[str]) -> Select:
+        fts = literal_column(SEARCH_TABLE)
+        query = " ".join(f'"{term}"*' for term in terms)
+        # bm25() is lower for better matches
+        rank = -func.bm25(fts, *(FIELD_WEIGHTS[field] for field in SEARCH_FIELDS))
+        return select(
+            self.index.c.rowid.label("job_id"), rank.label("rank")
+        ).where(fts.op("MATCH")(query))
+
+
+class PostgresJobSearchBackend(LikeJobSearchBackend):
+    """Weighted tsvector per job (title A, requirements B, description C)"""
+
+    name = "postgresql-tsvector"
+    index = table(SEARCH_TABLE, column("job_id"), column("document"))
+
+    def exists(self, connection: Connection) -> bool:
+        return connection.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": SEARCH_TABLE}
+        ).scalar()
+
+    def create(self, connection: Connection) -> None:
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+            f" job_id INTEGER PRIMARY KEY REFERENCES {JobDB.__tablename__} (id) ON DELETE CASCADE,"
+            " document TSVECTOR NOT NULL)"
+        ))
+        connection.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_document"
+            f" ON {SEARCH_TABLE} USING gin (document)"
+        ))
+
+    def clear(self, connection: Connection) -> None:
+        connection.execute(delete(self.index))
+
+    def upsert(self, connection: Connection, documents: Sequence[Document]) -> None:
+        connection.execute(
+            text(
+                f"INSERT INTO {SEARCH_TABLE} (job_id, document) VALUES (:id,"
+                " setweight(to_tsvector('simple', :title), 'A')"
+                " || setweight(to_tsvector('simple', :requirements), 'B')"
+                " || setweight(to_tsvector('simple', :description), 'C'))"
+                " ON CONFLICT (job_id) DO UPDATE SET document = EXCLUDED.document"
+            ),
+            [dict(zip(("id", *SEARCH_FIELDS), document)) for document in documents],
+        )
+
+    def remove(self, connection: Connection, job_id: int) -> None:
+        connection.execute(delete(self.index).where(self.index.c.job_id == job_id))
+
+    def matches(self, terms: List[str]) -> Select:
+        query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        return select(
+            self.index.c.job_id,
+            func.ts_rank(self.index.c.document, query).label("rank"),
+        ).where(self.index.c.document.op("@@")(query))
+
+
+def backend_for(dialect_name: str) -> LikeJobSearchBackend:
+    if dialect_name == "sqlite":
+        return SqliteFtsJobSearchBackend()
+    if dialect_name == "postgresql":
+        return PostgresJobSearchBackend()
+    return LikeJobSearchBackend()
+
+
+search_backend = backend_for(engine.dialect.name)
+
+
+def ensure_search_index(connection: Connection) -> None:
+    """Create the index if needed and fill it from jobs on first creation"""
+    if search_backend.exists(connection):
+        return
+    search_backend.create(connection)
+    rebuild_search_index(connection)
+
+
+def rebuild_search_index(connection: Connection) -> int:
+    """Replace the index contents from jobs; returns the job count"""
+    search_backend.clear(connection)
+    fields = [getattr(JobDB, field) for field in SEARCH_FIELDS]
+    result = connection.execute(
+        select(JobDB.id, *fields).execution_options(yield_per=REBUILD_BATCH_SIZE)
+    )
+    total = 0
+    for rows in result.partitions():
+        search_backend.upsert(connection, [job_document(row[0], row[1:]) for row in rows])
+        total += len(rows)
+    return total
+
+
+@event.listens_for(JobDB.__table__, "after_create")
+def _create_with_table(target, connection, **kw):
+    search_backend.create(connection)
+
+
+def _document(job: JobDB) -> Document:
+    return job_document(job.id, [getattr(job, field) for field in SEARCH_FIELDS])
+
+
+@event.listens_for(JobDB, "after_insert")
+def _index_inserted(mapper, connection, target):
+    search_backend.upsert(connection, [_document(target)])
+
+
+@event.listens_for(JobDB, "after_update")
+def _index_updated(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in SEARCH_FIELDS):
+        search_backend.upsert(connection, [_document(target)])
+
+
+@event.listens_for(JobDB, "after_delete")
+def _index_deleted(mapper, connection, target):
+    search_backend.remove(connection, target.id)
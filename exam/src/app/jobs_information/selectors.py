@@ -1,88 +1,130 @@
 # selectors.py for jobs_information
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc,func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_, or_, desc, func, case, literal, union_all
 from typing import List, Optional, Dict
-from datetime import date
+from datetime import date, timedelta
 
 from .models import JobDB
+from .search import search_backend, search_terms
 from app.admin.models import AdminJobAssignment
 from auth.models import User
 
 
 class JobSelector:
     @staticmethod
-    def get_by_id(db: Session, job_id: int) -> Optional[JobDB]:
-        return db.query(JobDB).filter(JobDB.id == job_id).first()
+    async def get_by_id(db: AsyncSession, job_id: int) -> Optional[JobDB]:
+        result = await db.execute(select(JobDB).where(JobDB.id == job_id))
+        return result.scalar_one_or_none()
     
     @staticmethod
-    def get_active_jobs(db: Session) -> List[JobDB]:
+    async def get_active_jobs(db: AsyncSession) -> List[JobDB]:
         """دریافت شغل‌های فعال"""
-        return db.query(JobDB).filter(JobDB.is_active == True).order_by(desc(JobDB.posted_date)).all()
+        query = select(JobDB).where(JobDB.is_active == True).order_by(desc(JobDB.posted_date))
+        result = await db.execute(query)
+        return result.scalars().all()
     
     @staticmethod
-    def get_jobs_by_admin(db: Session, admin_id: int, active_only: bool = True) -> List[JobDB]:
+    async def get_jobs_by_admin(db: AsyncSession, admin_id: int, active_only: bool = True) -> List[JobDB]:
         """دریافت شغل‌های یک ادمین خاص"""
-        query = db.query(JobDB).filter(
+        query = select(JobDB).where(
             JobDB.id.in_(
-                db.query(AdminJobAssignment.job_id).filter(
+                select(AdminJobAssignment.job_id).where(
                     AdminJobAssignment.admin_id == admin_id
                 )
             )
         )
         
         if active_only:
-            query = query.filter(JobDB.is_active == True)
+            query = query.where(JobDB.is_active == True)
         
-        return query.order_by(desc(JobDB.posted_date)).all()
+        result = await db.execute(query.order_by(desc(JobDB.posted_date)))
+        return result.scalars().all()
+    
+    FACETS = ("location", "company", "job_type")
+    FACET_SIZE = 20
     
     @staticmethod
-    def search_jobs(
-        db: Session,
+    async def search_jobs(
+        db: AsyncSession,
         search_term: Optional[str] = None,
         location: Optional[str] = None,
         company: Optional[str] = None,
         job_type: Optional[str] = None,
-        active_only: bool = True
-    ) -> List[JobDB]:
-        """جستجوی شغل‌ها"""
-        query = db.query(JobDB)
-        
-        if active_only:
-            query = query.filter(JobDB.is_active == True)
-        
+        active_only: bool = True,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Dict:
+        """
+        جستجوی شغل‌ها با رتبه‌بندی و شمارش فیلترها (facet).
+        نتایج به ترتیب ارتباط، سپس تاریخ انتشار.
+        """
         filters = []
-        if search_term:
-            filters.append(
-                or_(
-                    JobDB.title.contains(search_term),
-                    JobDB.description.contains(search_term),
-                    JobDB.requirements.contains(search_term)
-                )
-            )
-        
+        if active_only:
+            filters.append(JobDB.is_active == True)
         if location:
             filters.append(JobDB.location.contains(location))
-        
         if company:
             filters.append(JobDB.company.contains(company))
-        
         if job_type:
             filters.append(JobDB.job_type == job_type)
         
-        if filters:
-            query = query.filter(and_(*filters))
+        terms = search_terms(search_term)
+        if terms:
+            hits = search_backend.matches(terms).subquery("hits")
+            matched = select(
+                JobDB.id, hits.c.rank, *(getattr(JobDB, facet) for facet in JobSelector.FACETS)
+            ).join(hits, hits.c.job_id == JobDB.id)
+        else:
+            matched = select(
+                JobDB.id, literal(0.0).label("rank"), *(getattr(JobDB, facet) for facet in JobSelector.FACETS)
+            )
+        matched = matched.where(*filters).cte("matched")
+        
+        page = await db.execute(
+            select(JobDB)
+            .join(matched, matched.c.id == JobDB.id)
+            .order_by(desc(matched.c.rank), desc(JobDB.posted_date), desc(JobDB.id))
+            .limit(limit)
+            .offset(offset)
+        )
+        
+        # همه facetها در یک کوئری روی همان مجموعه نتایج
+        facet_rows = await db.execute(
+            union_all(*(
+                select(
+                    literal(facet).label("facet"),
+                    matched.c[facet].label("value"),
+                    func.count().label("count"),
+                ).group_by(matched.c[facet])
+                for facet in JobSelector.FACETS
+            ))
+        )
+        facets = {facet: {} for facet in JobSelector.FACETS}
+        total = 0
+        for facet, value, count in sorted(facet_rows.all(), key=lambda row: -row[2]):
+            # location is NOT NULL, so its buckets add up to the match count
+            if facet == "location":
+                total += count
+            if value is not None and len(facets[facet]) < JobSelector.FACET_SIZE:
+                facets[facet][value] = count
         
-        return query.order_by(desc(JobDB.posted_date)).all()
+        return {
+            "items": page.scalars().all(),
+            "total": total,
+            "facets": facets,
+            "limit": limit,
+            "offset": offset,
+        }
     
     @staticmethod
-    def get_jobs_by_date_range(
-        db: Session,
+    async def get_jobs_by_date_range(
+        db: AsyncSession,
         start_date: date,
         end_date: date,
         active_only: bool = True
     ) -> List[JobDB]:
         """دریافت شغل‌ها در بازه زمانی"""
-        query = db.query(JobDB).filter(
+        query = select(JobDB).where(
             and_(
                 JobDB.posted_date >= start_date,
                 JobDB.posted_date <= end_date
@@ -90,49 +132,53 @@ class JobSelector:
         )
         
         if active_only:
-            query = query.filter(JobDB.is_active == True)
+            query = query.where(JobDB.is_active == True)
         
-        return query.order_by(desc(JobDB.posted_date)).all()
+        result = await db.execute(query.order_by(desc(JobDB.posted_date)))
+        return result.scalars().all()
     
     @staticmethod
-    def get_upcoming_deadlines(db: Session, days: int = 7) -> List[JobDB]:
-
-        from datetime import timedelta
+    async def get_upcoming_deadlines(db: AsyncSession, days: int = 7) -> List[JobDB]:
         today = date.today()
         deadline_threshold = today + timedelta(days=days)
         
-        return db.query(JobDB).filter(
+        query = select(JobDB).where(
             and_(
                 JobDB.is_active == True,
                 JobDB.deadline.isnot(None),
                 JobDB.deadline <= deadline_threshold,
                 JobDB.deadline >= today
             )
-        ).order_by(JobDB.deadline).all()
+        ).order_by(JobDB.deadline)
+        result = await db.execute(query)
+        return result.scalars().all()
     
     @staticmethod
-    def get_statistics(db: Session) -> Dict:
+    async def get_statistics(db: AsyncSession) -> Dict:
         """آمار کلی شغل‌ها"""
-        total_jobs = db.query(JobDB).count()
-        active_jobs = db.query(JobDB).filter(JobDB.is_active == True).count()
+        totals = await db.execute(
+            select(
+                func.count(JobDB.id),
+                func.count(case((JobDB.is_active == True, 1))),
+            )
+        )
+        total_jobs, active_jobs = totals.one()
         
         # آمار بر اساس نوع شغل
-        job_type_stats = {}
-        job_types = db.query(JobDB.job_type, func.count(JobDB.id)).filter(
-            JobDB.job_type.isnot(None)
-        ).group_by(JobDB.job_type).all()
-        
-        for job_type, count in job_types:
-            job_type_stats[job_type] = count
+        job_types = await db.execute(
+            select(JobDB.job_type, func.count(JobDB.id)).where(
+                JobDB.job_type.isnot(None)
+            ).group_by(JobDB.job_type)
+        )
+        job_type_stats = {job_type: count for job_type, count in job_types.all()}
         
         # آمار بر اساس شرکت
-        company_stats = {}
-        companies = db.query(JobDB.company, func.count(JobDB.id)).group_by(
-            JobDB.company
-        ).order_by(desc(func.count(JobDB.id))).limit(10).all()
-        
-        for company, count in companies:
-            company_stats[company] = count
+        companies = await db.execute(
+            select(JobDB.company, func.count(JobDB.id)).group_by(
+                JobDB.company
+            ).order_by(desc(func.count(JobDB.id))).limit(10)
+        )
+        company_stats = {company: count for company, count in companies.all()}
         
         return {
             "total_jobs": total_jobs,
@@ -145,25 +191,30 @@ class JobSelector:
 
 class AdminJobAssignmentSelector:
     @staticmethod
-    def get_by_admin(db: Session, admin_id: int) -> List[AdminJobAssignment]:
+    async def get_by_admin(db: AsyncSession, admin_id: int) -> List[AdminJobAssignment]:
         """دریافت انتساب‌های یک ادمین"""
-        return db.query(AdminJobAssignment).filter(
-            AdminJobAssignment.admin_id == admin_id
-        ).all()
+        result = await db.execute(
+            select(AdminJobAssignment).where(AdminJobAssignment.admin_id == admin_id)
+        )
+        return result.scalars().all()
     
     @staticmethod
-    def get_by_job(db: Session, job_id: int) -> List[AdminJobAssignment]:
+    async def get_by_job(db: AsyncSession, job_id: int) -> List[AdminJobAssignment]:
         """دریافت انتساب‌های یک شغل"""
-        return db.query(AdminJobAssignment).filter(
-            AdminJobAssignment.job_id == job_id
-        ).all()
+        result = await db.execute(
+            select(AdminJobAssignment).where(AdminJobAssignment.job_id == job_id)
+        )
+        return result.scalars().all()
     
     @staticmethod
-    def check_assignment(db: Session, admin_id: int, job_id: int) -> bool:
+    async def check_assignment(db: AsyncSession, admin_id: int, job_id: int) -> bool:
         """بررسی وجود انتساب"""
-        return db.query(AdminJobAssignment).filter(
-            and_(
-                AdminJobAssignment.admin_id == admin_id,
-                AdminJobAssignment.job_id == job_id
-            )
-        ).first() is not None
\ No newline at end of file
+        result = await db.execute(
+            select(AdminJobAssignment.id).where(
+                and_(
+                    AdminJobAssignment.admin_id == admin_id,
+                    AdminJobAssignment.job_id == job_id
+                )
+            ).limit(1)
+        )
+        return result.first() is not None
@@ -1,8 +1,10 @@
 # services.py for jobs_information
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, func
 from typing import List, Optional
 
 
+from pagination import CursorParams, Page, SortKey, paginate
 from .models import JobDB
 from app.admin.models import AdminJobAssignment
 from auth.models import User
@@ -14,97 +16,130 @@ from .schemas import JobCreate, JobUpdate
 class JobService:
 
     @staticmethod
-    def create(db: Session, job_data: JobCreate) -> JobDB:
+    async def create(db: AsyncSession, job_data: JobCreate) -> JobDB:
         db_job = JobDB(**job_data.dict())
         db.add(db_job)
-        db.flush()
+        await db.flush()
         return db_job
     
     @staticmethod
-    def get_by_id(db: Session, job_id: int) -> Optional[JobDB]:
-        return db.query(JobDB).filter(JobDB.id == job_id).first()
+    async def get_by_id(db: AsyncSession, job_id: int) -> Optional[JobDB]:
+        result = await db.execute(select(JobDB).where(JobDB.id == job_id))
+        return result.scalar_one_or_none()
     
     @staticmethod
-    def get_all(
-        db: Session, 
+    async def get_all(
+        db: AsyncSession, 
         skip: int = 0, 
         limit: int = 50,
         active_only: bool = True
     ) -> List[JobDB]:
-        query = db.query(JobDB)
+        query = select(JobDB)
         if active_only:
-            query = query.filter(JobDB.is_active == True)
-        return query.order_by(JobDB.posted_date.desc()).offset(skip).limit(limit).all()
+            query = query.where(JobDB.is_active == True)
+        query = query.order_by(JobDB.posted_date.desc()).offset(skip).limit(limit)
+        result = await db.execute(query)
+        return result.scalars().all()
     
     @staticmethod
-    def get_by_admin(
-        db: Session,
+    async def get_by_admin(
+        db: AsyncSession,
         admin_id: int,
         skip: int = 0,
         limit: int = 50,
         active_only: bool = True
     ) -> List[JobDB]:
-        query = db.query(JobDB).filter(
+        query = select(JobDB).where(
             JobDB.id.in_(
-                db.query(AdminJobAssignment.job_id).filter(
+                select(AdminJobAssignment.job_id).where(
                     AdminJobAssignment.admin_id == admin_id
                 )
             )
         )
         
         if active_only:
-            query = query.filter(JobDB.is_active == True)
+            query = query.where(JobDB.is_active == True)
         
-        return query.order_by(JobDB.posted_date.desc()).offset(skip).limit(limit).all()
+        query = query.order_by(JobDB.posted_date.desc()).offset(skip).limit(limit)
+        result = await db.execute(query)
+        return result.scalars().all()
+    
+    LISTING_ORDER = [
+        SortKey(JobDB.posted_date, descending=True),
+        SortKey(JobDB.id, descending=True),
+    ]
+    
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        params: CursorParams,
+        active_only: bool = True,
+        admin_id: Optional[int] = None
+    ) -> Page:
+        """لیست شغل‌ها با صفحه‌بندی keyset (posted_date DESC, id DESC)"""
+        query = select(JobDB)
+        if admin_id is not None:
+            query = query.where(
+                JobDB.id.in_(
+                    select(AdminJobAssignment.job_id).where(
+                        AdminJobAssignment.admin_id == admin_id
+                    )
+                )
+            )
+        if active_only:
+            query = query.where(JobDB.is_active == True)
+        return await paginate(db, query, JobService.LISTING_ORDER, params)
     
     @staticmethod
-    def update(db: Session, job: JobDB, job_data: JobUpdate) -> JobDB:
+    async def update(db: AsyncSession, job: JobDB, job_data: JobUpdate) -> JobDB:
         update_data = job_data.dict(exclude_unset=True)
         for field, value in update_data.items():
             if value is not None:
                 setattr(job, field, value)
         
         db.add(job)
-        db.flush()
+        await db.flush()
         return job
     
     @staticmethod
-    def delete(db: Session, job: JobDB) -> None:
-        db.delete(job)
-        db.flush()
+    async def delete(db: AsyncSession, job: JobDB) -> None:
+        await db.delete(job)
+        await db.flush()
     
     @staticmethod
-    def count(db: Session, active_only: bool = True) -> int:
-        query = db.query(JobDB)
+    async def count(db: AsyncSession, active_only: bool = True) -> int:
+        query = select(func.count()).select_from(JobDB)
         if active_only:
-            query = query.filter(JobDB.is_active == True)
-        return query.count()
+            query = query.where(JobDB.is_active == True)
+        result = await db.execute(query)
+        return result.scalar() or 0
 
 
 class AdminJobAssignmentService:
     @staticmethod
-    def create(db: Session, admin_id: int, job_id: int) -> AdminJobAssignment:
+    async def create(db: AsyncSession, admin_id: int, job_id: int) -> AdminJobAssignment:
         admin_job_assignment = AdminJobAssignment(
             admin_id=admin_id,
             job_id=job_id
         )
         db.add(admin_job_assignment)
-        db.flush()
+        await db.flush()
         return admin_job_assignment
     
     @staticmethod
-    def delete(db: Session, assignment_id: int) -> None:
-        assignment = db.query(AdminJobAssignment).filter(
-            AdminJobAssignment.id == assignment_id
-        ).first()
+    async def delete(db: AsyncSession, assignment_id: int) -> None:
+        result = await db.execute(
+            select(AdminJobAssignment).where(AdminJobAssignment.id == assignment_id)
+        )
+        assignment = result.scalar_one_or_none()
         if assignment:
-            db.delete(assignment)
-            db.flush()
+            await db.delete(assignment)
+            await db.flush()
     
     @staticmethod
-    def delete_by_job(db: Session, job_id: int) -> None:
+    async def delete_by_job(db: AsyncSession, job_id: int) -> None:
         """حذف همه انتساب‌های یک شغل"""
-        db.query(AdminJobAssignment).filter(
-            AdminJobAssignment.job_id == job_id
-        ).delete()
-        db.flush()
\ No newline at end of file
+        await db.execute(
+            delete(AdminJobAssignment).where(AdminJobAssignment.job_id == job_id)
+        )
+        await db.flush()
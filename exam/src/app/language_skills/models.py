@@ -6,7 +6,8 @@ from sqlalchemy import (
     String,
     ForeignKey,
     DateTime,
-    Enum
+    Enum,
+    Index
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -35,4 +36,8 @@ class LanguageSkill(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # relationships
-    user= relationship("User", backref="language_skills")
\ No newline at end of file
+    user= relationship("User", backref="language_skills")
+
+    __table_args__ = (
+        Index("ix_language_skills_user_id_language", "user_id", "language"),
+    )
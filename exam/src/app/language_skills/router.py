@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from database import get_db
+from database import UnitOfWorkRoute, get_db, get_uow
 from auth.depends import get_current_user_obj as get_current_user
 from auth.models import User
 from .schemas import (
@@ -13,7 +13,7 @@ from .schemas import (
 from .services import LanguageService
 from .selectors import LanguageSelector
 
-router = APIRouter(prefix="/languages", tags=["Language Skills"])
+router = APIRouter(prefix="/languages", tags=["Language Skills"], route_class=UnitOfWorkRoute)
 
 
 # ========== LANGUAGE SKILLS ==========
@@ -31,7 +31,7 @@ async def get_language_skills(
 async def create_language_skill(
     language_data: LanguageSkillCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """اضافه کردن مهارت زبانی جدید"""
     try:
@@ -53,9 +53,6 @@ async def create_language_skill(
         
         # TODO: تغییر وضعیت applicant (اگر نیاز است)
         
-        await db.commit()
-        await db.refresh(new_language)
-        
         return new_language
         
     except HTTPException:
@@ -68,6 +65,26 @@ async def create_language_skill(
         )
 
 
+@router.get("/proficiency-summary/", response_model=ProficiencySummaryResponse)
+async def get_proficiency_summary(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """خلاصه مهارت‌های زبانی بر اساس تسلط"""
+    summary = await LanguageSelector.get_proficiency_summary(db, current_user.id)
+    return summary
+
+
+@router.get("/statistics/")
+async def get_language_statistics(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """دریافت آمار مهارت‌های زبانی"""
+    stats = await LanguageSelector.get_statistics(db, current_user.id)
+    return stats
+
+
 @router.get("/{language_id}/", response_model=LanguageSkillResponse)
 async def get_language_skill(
     language_id: int,
@@ -91,7 +108,7 @@ async def update_language_skill(
     language_id: int,
     language_data: LanguageSkillUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """به‌روزرسانی اطلاعات مهارت زبانی"""
     language = await LanguageService.get_by_id(db, language_id, current_user.id)
@@ -121,9 +138,6 @@ async def update_language_skill(
         
         updated_language = await LanguageService.update(db, language, language_data)
         
-        await db.commit()
-        await db.refresh(updated_language)
-        
         return updated_language
         
     except HTTPException:
@@ -140,7 +154,7 @@ async def update_language_skill(
 async def delete_language_skill(
     language_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """حذف مهارت زبانی"""
     language = await LanguageService.get_by_id(db, language_id, current_user.id)
@@ -153,7 +167,6 @@ async def delete_language_skill(
     
     try:
         await LanguageService.delete(db, language)
-        await db.commit()
         
     except Exception as e:
         await db.rollback()
@@ -163,52 +176,44 @@ async def delete_language_skill(
         )
 
 
-@router.get("/proficiency-summary/", response_model=ProficiencySummaryResponse)
-async def get_proficiency_summary(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """خلاصه مهارت‌های زبانی بر اساس تسلط"""
-    summary = await LanguageSelector.get_proficiency_summary(db, current_user.id)
-    return summary
-
-
 @router.post("/bulk/", response_model=List[LanguageSkillResponse], status_code=status.HTTP_201_CREATED)
 async def create_language_skills_bulk(
     bulk_data: LanguageSkillBulkCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """ثبت چند مهارت زبانی به صورت همزمان"""
     created_skills = []
 
     try:
-        # بررسی تکراری بودن هر کدام
-        for skill_data in bulk_data.skills:
-            is_duplicate = await LanguageSelector.check_duplicate(
-                db, 
-                current_user.id, 
-                skill_data.language,
-                skill_data.other_language
+        # بررسی تکراری بودن همه موارد با یک کوئری
+        duplicates = await LanguageSelector.find_duplicates(
+            db,
+            current_user.id,
+            bulk_data.skills
+        )
+        
+        if duplicates:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"زبان {duplicates[0].language.value} قبلاً ثبت شده است"
             )
-            
-            if is_duplicate:
+        
+        seen = set()
+        for skill_data in bulk_data.skills:
+            key = (skill_data.language, skill_data.other_language)
+            if key in seen:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"زبان {skill_data.language} قبلاً ثبت شده است"
+                    detail=f"زبان {skill_data.language.value} در لیست تکراری است"
                 )
+            seen.add(key)
         
         # ایجاد رکوردها
         created_skills = await LanguageService.create_bulk(db, current_user.id, bulk_data)
         
         # TODO: تغییر وضعیت applicant (اگر نیاز است)
         
-        await db.commit()
-
-        # ریفرش رکوردها
-        for skill in created_skills:
-            await db.refresh(skill)
-        
         return created_skills
 
     except HTTPException:
@@ -223,16 +228,6 @@ async def create_language_skills_bulk(
 
 
 # ========== Additional endpoints using selectors ==========
-@router.get("/statistics/")
-async def get_language_statistics(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """دریافت آمار مهارت‌های زبانی"""
-    stats = await LanguageSelector.get_statistics(db, current_user.id)
-    return stats
-
-
 @router.get("/by-language/{language}/")
 async def get_by_language(
     language: LanguageEnum,
@@ -1,10 +1,11 @@
 # selectors.py for language_skills
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func , or_
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 
+from aggregates import aggregate, count_by
 from .models import LanguageSkill
-from .schemas import LanguageEnum, ProficiencyEnum
+from .schemas import LanguageEnum, ProficiencyEnum, LanguageSkillCreate
 
 
 class LanguageSelector:
@@ -101,6 +102,41 @@ class LanguageSelector:
         result = await db.execute(query)
         return result.first() is not None
     
+    @staticmethod
+    async def find_duplicates(
+        db: AsyncSession,
+        user_id: int,
+        skills: Sequence[LanguageSkillCreate]
+    ) -> List[LanguageSkillCreate]:
+        """
+        مواردی از لیست که زبانشان قبلاً ثبت شده است؛ همان قاعده check_duplicate
+        ولی با یک کوئری برای کل لیست
+        """
+        languages = {skill.language for skill in skills}
+        if not languages:
+            return []
+
+        result = await db.execute(
+            select(LanguageSkill.language, LanguageSkill.other_language).where(
+                and_(
+                    LanguageSkill.user_id == user_id,
+                    LanguageSkill.language.in_(languages)
+                )
+            )
+        )
+        existing = result.all()
+        existing_languages = {row.language for row in existing}
+        existing_other = {row.other_language for row in existing if row.language == LanguageEnum.OTHER}
+
+        duplicates = []
+        for skill in skills:
+            if skill.language == LanguageEnum.OTHER and skill.other_language:
+                if skill.other_language in existing_other:
+                    duplicates.append(skill)
+            elif skill.language in existing_languages:
+                duplicates.append(skill)
+        return duplicates
+    
     @staticmethod
     async def get_proficiency_summary(db: AsyncSession, user_id: int) -> Dict[str, List[Dict[str, Any]]]:
         """خلاصه مهارت‌های زبانی بر اساس تسلط"""
@@ -157,20 +193,7 @@ class LanguageSelector:
     @staticmethod
     async def get_statistics(db: AsyncSession, user_id: int) -> Dict:
         """آمار مهارت‌های زبانی"""
-        # تعداد کل
-        total_query = select(func.count()).select_from(LanguageSkill).where(LanguageSkill.user_id == user_id)
-        total = await db.execute(total_query)
-        
-        # آمار بر اساس زبان
-        language_stats = {}
-        for lang in LanguageEnum:
-            count_query = select(func.count()).select_from(LanguageSkill).where(
-                and_(LanguageSkill.user_id == user_id, LanguageSkill.language == lang)
-            )
-            count = await db.execute(count_query)
-            language_stats[lang.value] = count.scalar() or 0
-        
-        return {
-            "total": total.scalar() or 0,
-            "by_language": language_stats
-        }
\ No newline at end of file
+        return await aggregate(db, LanguageSkill, LanguageSkill.user_id == user_id, {
+            "total": func.count(),
+            "by_language": count_by(LanguageSkill.language, LanguageEnum),
+        })
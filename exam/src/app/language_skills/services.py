@@ -4,6 +4,7 @@ from sqlalchemy import select, and_
 from typing import List, Optional
 from datetime import datetime
 
+from bulk import bulk_insert, rows_for_user
 from .models import LanguageSkill
 from .schemas import LanguageSkillCreate, LanguageSkillUpdate, LanguageSkillBulkCreate
 
@@ -51,23 +52,7 @@ class LanguageService:
         data: LanguageSkillBulkCreate
     ) -> List[LanguageSkill]:
         """ایجاد چند مهارت زبانی به صورت یکجا"""
-        new_languages = []
-        
-        for lang_data in data.skills:
-            language = LanguageSkill(
-                user_id=user_id,
-                language=lang_data.language,
-                other_language=lang_data.other_language,
-                reading=lang_data.reading,
-                writing=lang_data.writing,
-                speaking=lang_data.speaking,
-                listening=lang_data.listening
-            )
-            db.add(language)
-            new_languages.append(language)
-        
-        await db.flush()
-        return new_languages
+        return await bulk_insert(db, LanguageSkill, rows_for_user(user_id, data.skills))
     
     @staticmethod
     async def update(
@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import datetime
 
-from database import get_db
+from database import UnitOfWorkRoute, get_db, get_uow
 from auth.depends import get_current_user_obj as get_current_user
 from auth.models import User
 from .schemas import (
@@ -17,7 +17,7 @@ from .selectors import MilitarySelector
 
 from typing import List
 
-router = APIRouter(prefix="/military", tags=["Military Service"])
+router = APIRouter(prefix="/military", tags=["Military Service"], route_class=UnitOfWorkRoute)
 
 
 @router.get("/", response_model=List[MilitaryServiceResponse])
@@ -34,7 +34,7 @@ async def get_military_service(
 async def create_military_service(
     military_data: MilitaryServiceCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
 
 
@@ -45,9 +45,6 @@ async def create_military_service(
         # TODO: تغییر وضعیت applicant
         # from app.applicant.services import update_applicant_status
         
-        await db.commit()
-        await db.refresh(new_military)
-        
         return new_military
         
     except Exception as e:
@@ -63,7 +60,7 @@ async def update_military_service(
     military_service : int , 
     military_data: MilitaryServiceUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """به‌روزرسانی اطلاعات نظام وظیفه"""
     military = await MilitaryServiceService.get_by_user_id(
@@ -80,9 +77,6 @@ async def update_military_service(
     try:
         updated_military = await MilitaryServiceService.update(db, military, military_data)
         
-        await db.commit()
-        await db.refresh(updated_military)
-        
         return updated_military
         
     except Exception as e:
@@ -96,7 +90,7 @@ async def update_military_service(
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_military_service(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """حذف اطلاعات نظام وظیفه"""
     military = await MilitaryServiceService.get_by_user(db, current_user.id)
@@ -108,7 +102,6 @@ async def delete_military_service(
     
     try:
         await MilitaryServiceService.delete(db, military)
-        await db.commit()
         
     except Exception as e:
         await db.rollback()
@@ -7,7 +7,8 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     Enum,
-    Text
+    Text,
+    Index
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -35,4 +36,8 @@ class Skill(Base):
     # relationships
     # applicant = relationship("Applicant", back_populates="skills")
     user = relationship("User", backref="Skill")
-    
\ No newline at end of file
+
+    __table_args__ = (
+        Index("ix_skills_user_id_skill_level", "user_id", "skill_level"),
+    )
+    
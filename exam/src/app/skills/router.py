@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime
 
-from database import get_db
+from database import UnitOfWorkRoute, get_db, get_uow
 from auth.depends import get_current_user_obj as get_current_user
 from auth.models import User
 from .schemas import (
@@ -14,7 +14,7 @@ from .schemas import (
 from .services import SkillService
 from .selectors import SkillSelector
 
-router = APIRouter(prefix="/skills", tags=["Skills"])
+router = APIRouter(prefix="/skills", tags=["Skills"], route_class=UnitOfWorkRoute)
 
 
 # ========== SKILLS ==========
@@ -32,7 +32,7 @@ async def get_skills(
 async def create_skill(
     skill_data: SkillCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """اضافه کردن مهارت جدید"""
     try:
@@ -52,9 +52,6 @@ async def create_skill(
         # TODO: تغییر وضعیت applicant
         # from app.applicant.services import update_applicant_status
         
-        await db.commit()
-        await db.refresh(new_skill)
-        
         return new_skill
         
     except HTTPException:
@@ -67,6 +64,16 @@ async def create_skill(
         )
 
 
+@router.get("/statistics/")
+async def get_skills_statistics(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """دریافت آمار مهارت‌ها"""
+    stats = await SkillSelector.get_statistics(db, current_user.id)
+    return stats
+
+
 @router.get("/{skill_id}/", response_model=SkillResponse)
 async def get_skill(
     skill_id: int,
@@ -90,7 +97,7 @@ async def update_skill(
     skill_id: int,
     skill_data: SkillUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """به‌روزرسانی اطلاعات مهارت"""
     skill = await SkillService.get_by_id(db, skill_id, current_user.id)
@@ -116,9 +123,6 @@ async def update_skill(
         
         updated_skill = await SkillService.update(db, skill, skill_data)
         
-        await db.commit()
-        await db.refresh(updated_skill)
-        
         return updated_skill
         
     except HTTPException:
@@ -135,7 +139,7 @@ async def update_skill(
 async def delete_skill(
     skill_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """حذف مهارت"""
     skill = await SkillService.get_by_id(db, skill_id, current_user.id)
@@ -148,7 +152,6 @@ async def delete_skill(
     
     try:
         await SkillService.delete(db, skill)
-        await db.commit()
         
     except Exception as e:
         await db.rollback()
@@ -172,28 +175,35 @@ async def get_skills_by_level(
 async def create_skills_bulk(
     skills_data: SkillBulkCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
-    added_skills = []
-    
     try:
-        for skill_data in skills_data.skills:
-
-            
-            new_skill = await SkillService.create(db, current_user.id, skill_data)
-            added_skills.append(new_skill)
-
-        if added_skills:
-            # TODO: تغییر وضعیت applicant
-            
-            await db.commit()
+        # بررسی تکراری بودن همه مهارت‌ها با یک کوئری
+        names = [skill_data.skill_name for skill_data in skills_data.skills]
+        duplicates = await SkillSelector.find_duplicates(db, current_user.id, names)
+        
+        seen = set()
+        for name in names:
+            if name.lower() in duplicates:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"مهارت {name} قبلاً ثبت شده است"
+                )
+            if name.lower() in seen:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"مهارت {name} در لیست تکراری است"
+                )
+            seen.add(name.lower())
+        
+        added_skills = await SkillService.create_bulk(db, current_user.id, skills_data)
 
-            # ریفرش تمام رکوردها
-            for skill in added_skills:
-                await db.refresh(skill)
+        # TODO: تغییر وضعیت applicant
 
         return added_skills
 
+    except HTTPException:
+        raise
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -202,16 +212,6 @@ async def create_skills_bulk(
         )
 
 
-@router.get("/statistics/")
-async def get_skills_statistics(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """دریافت آمار مهارت‌ها"""
-    stats = await SkillSelector.get_statistics(db, current_user.id)
-    return stats
-
-
 @router.get("/check-duplicate/{skill_name}/")
 async def check_duplicate_skill(
     skill_name: str,
@@ -1,8 +1,9 @@
 # selectors.py for skills
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Sequence, Set
 
+from aggregates import aggregate, count_by
 from .models import Skill
 from .schemas import SkillLevelEnum
 
@@ -92,34 +93,43 @@ class SkillSelector:
         result = await db.execute(query)
         return result.first() is not None
     
+    @staticmethod
+    async def find_duplicates(db: AsyncSession, user_id: int, skill_names: Sequence[str]) -> Set[str]:
+        """نام مهارت‌هایی از لیست که قبلاً ثبت شده‌اند (با یک کوئری، lowercase)"""
+        names = {name.lower() for name in skill_names}
+        if not names:
+            return set()
+
+        result = await db.execute(
+            select(func.lower(Skill.skill_name)).where(
+                and_(
+                    Skill.user_id == user_id,
+                    func.lower(Skill.skill_name).in_(names)
+                )
+            )
+        )
+        return set(result.scalars().all())
+    
     @staticmethod
     async def get_statistics(db: AsyncSession, user_id: int) -> Dict:
         """آمار مهارت‌ها"""
-        # تعداد کل
-        total_query = select(func.count()).select_from(Skill).where(Skill.user_id == user_id)
-        total = await db.execute(total_query)
-        
-        # آمار بر اساس سطح
-        level_stats = {}
-        for level in SkillLevelEnum:
-            count_query = select(func.count()).select_from(Skill).where(
-                and_(Skill.user_id == user_id, Skill.skill_level == level)
-            )
-            count = await db.execute(count_query)
-            level_stats[level.value] = count.scalar() or 0
-        
         # پرتجربه‌ترین مهارت
-        most_exp_query = select(Skill).where(
+        most_exp = select(Skill).where(
             Skill.user_id == user_id
-        ).order_by(Skill.years_of_experience.desc()).limit(1)
-        most_exp = await db.execute(most_exp_query)
-        most_exp_skill = most_exp.scalar_one_or_none()
-        
+        ).order_by(Skill.years_of_experience.desc()).limit(1).subquery()
+
+        stats = await aggregate(db, Skill, Skill.user_id == user_id, {
+            "total": func.count(),
+            "by_level": count_by(Skill.skill_level, SkillLevelEnum),
+            "name": select(most_exp.c.skill_name).scalar_subquery(),
+            "years": select(most_exp.c.years_of_experience).scalar_subquery(),
+        })
+
         return {
-            "total": total.scalar() or 0,
-            "by_level": level_stats,
+            "total": stats["total"],
+            "by_level": stats["by_level"],
             "most_experienced": {
-                "name": most_exp_skill.skill_name if most_exp_skill else None,
-                "years": most_exp_skill.years_of_experience if most_exp_skill else 0
+                "name": stats["name"],
+                "years": stats["years"] if stats["name"] is not None else 0
             }
-        }
\ No newline at end of file
+        }
@@ -4,6 +4,7 @@ from sqlalchemy import select, and_
 from typing import List, Optional
 from datetime import datetime
 
+from bulk import bulk_insert, rows_for_user
 from .models import Skill
 from .schemas import SkillCreate, SkillUpdate, SkillBulkCreate
 
@@ -45,21 +46,7 @@ class SkillService:
     @staticmethod
     async def create_bulk(db: AsyncSession, user_id: int, data: SkillBulkCreate) -> List[Skill]:
         """ایجاد چند مهارت به صورت یکجا"""
-        new_skills = []
-        
-        for skill_data in data.skills:
-            skill = Skill(
-                user_id=user_id,
-                skill_name=skill_data.skill_name,
-                skill_level=skill_data.skill_level,
-                years_of_experience=skill_data.years_of_experience,
-                description=skill_data.description
-            )
-            db.add(skill)
-            new_skills.append(skill)
-        
-        await db.flush()
-        return new_skills
+        return await bulk_insert(db, Skill, rows_for_user(user_id, data.skills))
     
     @staticmethod
     async def update(db: AsyncSession, skill: Skill, data: SkillUpdate) -> Skill:
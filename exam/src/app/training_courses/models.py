@@ -8,7 +8,8 @@ from sqlalchemy import (
     DateTime,
     Date,
     Text,
-    Boolean
+    Boolean,
+    Index
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -41,4 +42,8 @@ class TrainingCourse(Base):
     
     # applicant = relationship("Applicant", back_populates="training_courses")
     
-    user = relationship("User", backref="TrainingCourse")
\ No newline at end of file
+    user = relationship("User", backref="TrainingCourse")
+
+    __table_args__ = (
+        Index("ix_training_courses_user_id_start_date", "user_id", "start_date"),
+    )
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from database import get_db
+from database import UnitOfWorkRoute, get_db, get_uow
 from auth.depends import get_current_user_obj as  get_current_user
 from auth.models import User
 from .schemas import (
@@ -13,7 +13,7 @@ from .schemas import (
 from .services import TrainingService
 from .selectors import TrainingSelector
 
-router = APIRouter(prefix="/training", tags=["Training Courses"])
+router = APIRouter(prefix="/training", tags=["Training Courses"], route_class=UnitOfWorkRoute)
 
 
 # ========== TRAINING COURSES ==========
@@ -31,7 +31,7 @@ async def get_training_courses(
 async def create_training_course(
     training_data: TrainingCourseCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """اضافه کردن دوره آموزشی جدید"""
     try:
@@ -39,9 +39,6 @@ async def create_training_course(
         
         # TODO: تغییر وضعیت applicant (اگر نیاز است)
         
-        await db.commit()
-        await db.refresh(new_course)
-        
         return new_course
         
     except Exception as e:
@@ -52,6 +49,26 @@ async def create_training_course(
         )
 
 
+@router.get("/with-certificate/", response_model=List[TrainingCourseResponse])
+async def get_courses_with_certificate(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """دریافت دوره‌هایی که گواهینامه دارند"""
+    courses = await TrainingSelector.get_with_certificate(db, current_user.id)
+    return courses
+
+
+@router.get("/statistics/")
+async def get_training_statistics(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """دریافت آمار دوره‌های آموزشی"""
+    stats = await TrainingSelector.get_statistics(db, current_user.id)
+    return stats
+
+
 @router.get("/{course_id}/", response_model=TrainingCourseResponse)
 async def get_training_course(
     course_id: int,
@@ -75,7 +92,7 @@ async def update_training_course(
     course_id: int,
     training_data: TrainingCourseUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """به‌روزرسانی اطلاعات دوره آموزشی"""
     course = await TrainingService.get_by_id(db, course_id, current_user.id)
@@ -89,9 +106,6 @@ async def update_training_course(
     try:
         updated_course = await TrainingService.update(db, course, training_data)
         
-        await db.commit()
-        await db.refresh(updated_course)
-        
         return updated_course
         
     except Exception as e:
@@ -106,7 +120,7 @@ async def update_training_course(
 async def delete_training_course(
     course_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """حذف دوره آموزشی"""
     course = await TrainingService.get_by_id(db, course_id, current_user.id)
@@ -119,7 +133,6 @@ async def delete_training_course(
     
     try:
         await TrainingService.delete(db, course)
-        await db.commit()
         
     except Exception as e:
         await db.rollback()
@@ -129,16 +142,6 @@ async def delete_training_course(
         )
 
 
-@router.get("/with-certificate/", response_model=List[TrainingCourseResponse])
-async def get_courses_with_certificate(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """دریافت دوره‌هایی که گواهینامه دارند"""
-    courses = await TrainingSelector.get_with_certificate(db, current_user.id)
-    return courses
-
-
 @router.get("/stats/summary/", response_model=TrainingSummaryResponse)
 async def get_training_summary(
     current_user: User = Depends(get_current_user),
@@ -153,7 +156,7 @@ async def get_training_summary(
 async def create_training_courses_bulk(
     trainings_data: List[TrainingCourseCreate],
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """اضافه کردن چند دوره آموزشی به‌صورت Bulk"""
     try:
@@ -161,12 +164,6 @@ async def create_training_courses_bulk(
         
         # TODO: تغییر وضعیت applicant (اگر نیاز است)
         
-        await db.commit()
-        
-        # Refresh رکوردها
-        for course in created_courses:
-            await db.refresh(course)
-        
         return created_courses
         
     except Exception as e:
@@ -178,16 +175,6 @@ async def create_training_courses_bulk(
 
 
 # ========== Additional endpoints using selectors ==========
-@router.get("/statistics/")
-async def get_training_statistics(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """دریافت آمار دوره‌های آموزشی"""
-    stats = await TrainingSelector.get_statistics(db, current_user.id)
-    return stats
-
-
 @router.get("/by-institute/{institute}/")
 async def get_by_institute(
     institute: str,
@@ -5,6 +5,7 @@ from typing import List, Optional, Dict, Any
 from datetime import date
 import re
 
+from aggregates import aggregate, count_if
 from .models import TrainingCourse
 
 
@@ -115,35 +116,16 @@ class TrainingSelector:
     @staticmethod
     async def get_statistics(db: AsyncSession, user_id: int) -> Dict:
         """آمار دوره‌های آموزشی"""
-        # تعداد کل
-        total_query = select(func.count()).select_from(TrainingCourse).where(TrainingCourse.user_id == user_id)
-        total = await db.execute(total_query)
+        courses = select(TrainingCourse).where(TrainingCourse.user_id == user_id)
+        # قدیمی‌ترین و جدیدترین دوره
+        oldest = courses.order_by(TrainingCourse.start_date.asc()).limit(1).subquery()
+        newest = courses.order_by(TrainingCourse.start_date.desc()).limit(1).subquery()
         
-        # تعداد با گواهینامه
-        cert_query = select(func.count()).select_from(TrainingCourse).where(
-            and_(TrainingCourse.user_id == user_id, TrainingCourse.has_certificate == True)
-        )
-        cert = await db.execute(cert_query)
-        
-        # قدیمی‌ترین دوره
-        oldest_query = select(TrainingCourse).where(
-            TrainingCourse.user_id == user_id
-        ).order_by(TrainingCourse.start_date.asc()).limit(1)
-        oldest = await db.execute(oldest_query)
-        oldest_course = oldest.scalar_one_or_none()
-        
-        # جدیدترین دوره
-        newest_query = select(TrainingCourse).where(
-            TrainingCourse.user_id == user_id
-        ).order_by(TrainingCourse.start_date.desc()).limit(1)
-        newest = await db.execute(newest_query)
-        newest_course = newest.scalar_one_or_none()
-        
-        return {
-            "total": total.scalar() or 0,
-            "with_certificate": cert.scalar() or 0,
-            "oldest_course": oldest_course.title if oldest_course else None,
-            "oldest_course_date": oldest_course.start_date if oldest_course else None,
-            "newest_course": newest_course.title if newest_course else None,
-            "newest_course_date": newest_course.start_date if newest_course else None
-        }
\ No newline at end of file
+        return await aggregate(db, TrainingCourse, TrainingCourse.user_id == user_id, {
+            "total": func.count(),
+            "with_certificate": count_if(TrainingCourse.has_certificate == True),
+            "oldest_course": select(oldest.c.title).scalar_subquery(),
+            "oldest_course_date": select(oldest.c.start_date).scalar_subquery(),
+            "newest_course": select(newest.c.title).scalar_subquery(),
+            "newest_course_date": select(newest.c.start_date).scalar_subquery(),
+        })
@@ -4,6 +4,7 @@ from sqlalchemy import select, and_
 from typing import List, Optional
 from datetime import datetime
 
+from bulk import bulk_insert, rows_for_user
 from .models import TrainingCourse
 from .schemas import TrainingCourseCreate, TrainingCourseUpdate, TrainingCourseBulkCreate
 
@@ -56,28 +57,7 @@ class TrainingService:
         data: List[TrainingCourseCreate]
     ) -> List[TrainingCourse]:
         """ایجاد چند دوره آموزشی به صورت یکجا"""
-        new_courses = []
-        
-        for course_data in data:
-            course = TrainingCourse(
-                user_id=user_id,
-                title=course_data.title,
-                institute=course_data.institute,
-                duration=course_data.duration,
-                start_date=course_data.start_date,
-                end_date=course_data.end_date,
-                has_certificate=course_data.has_certificate,
-                certificate_id=course_data.certificate_id,
-                certificate_date=course_data.certificate_date,
-                description=course_data.description,
-                skills_learned=course_data.skills_learned,
-                instructor=course_data.instructor
-            )
-            db.add(course)
-            new_courses.append(course)
-        
-        await db.flush()
-        return new_courses
+        return await bulk_insert(db, TrainingCourse, rows_for_user(user_id, data))
     
     @staticmethod
     async def update(
@@ -8,7 +8,8 @@ from sqlalchemy import (
     Date,
     Text,
     Boolean,
-    Numeric
+    Numeric,
+    Index
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -35,4 +36,9 @@ class WorkExperience(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # relationships
-    # applicant = relationship("Applicant", back_populates="apli")
\ No newline at end of file
+    # applicant = relationship("Applicant", back_populates="apli")
+    user = relationship("User", backref="work_experiences")
+
+    __table_args__ = (
+        Index("ix_work_experiences_user_id_currently_working", "user_id", "currently_working"),
+    )
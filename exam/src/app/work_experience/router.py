@@ -4,8 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime
 
-from database import get_db
-from auth.depends import get_current_user
+from database import UnitOfWorkRoute, get_db, get_uow
+from auth.depends import get_current_user_obj as get_current_user
 from auth.models import User
 from .schemas import (
     WorkExperienceCreate, WorkExperienceUpdate, WorkExperienceResponse,
@@ -14,7 +14,7 @@ from .schemas import (
 from .services import WorkExperienceService
 from .selectors import WorkExperienceSelector
 
-router = APIRouter(prefix="/work-experience/", tags=["Work Experience"])
+router = APIRouter(prefix="/work-experience", tags=["Work Experience"], route_class=UnitOfWorkRoute)
 
 
 # ========== WORK EXPERIENCE ==========
@@ -31,7 +31,7 @@ async def get_work_experiences(
 async def create_work_experience(
     work_data: WorkExperienceCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """اضافه کردن سابقه کاری جدید"""
     try:
@@ -40,9 +40,6 @@ async def create_work_experience(
         # TODO: تغییر وضعیت applicant
         # from app.applicant.services import update_applicant_status
         
-        await db.commit()
-        await db.refresh(new_work)
-        
         return new_work
         
     except Exception as e:
@@ -53,6 +50,34 @@ async def create_work_experience(
         )
 
 
+@router.get("/total-experience/", response_model=TotalExperienceResponse)
+async def calculate_total_experience(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """محاسبه کل سابقه کاری به ماه"""
+    total = await WorkExperienceSelector.calculate_total_experience(db, current_user.id)
+    return total
+
+
+@router.get("/statistics/")
+async def get_work_experience_statistics(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    stats = await WorkExperienceSelector.get_statistics(db, current_user.id)
+    return stats
+
+
+@router.get("/current/")
+async def get_current_jobs(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    jobs = await WorkExperienceSelector.get_current_jobs(db, current_user.id)
+    return jobs
+
+
 @router.get("/{work_id}/", response_model=WorkExperienceResponse)
 async def get_work_experience(
     work_id: int,
@@ -76,7 +101,7 @@ async def update_work_experience(
     work_id: int,
     work_data: WorkExperienceUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """به‌روزرسانی اطلاعات سابقه کاری"""
     work_exp = await WorkExperienceService.get_by_id(db, work_id, current_user.id)
@@ -90,9 +115,6 @@ async def update_work_experience(
     try:
         updated_work = await WorkExperienceService.update(db, work_exp, work_data)
         
-        await db.commit()
-        await db.refresh(updated_work)
-        
         return updated_work
         
     except Exception as e:
@@ -107,7 +129,7 @@ async def update_work_experience(
 async def delete_work_experience(
     work_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """حذف سابقه کاری"""
     work_exp = await WorkExperienceService.get_by_id(db, work_id, current_user.id)
@@ -120,7 +142,6 @@ async def delete_work_experience(
     
     try:
         await WorkExperienceService.delete(db, work_exp)
-        await db.commit()
         
     except Exception as e:
         await db.rollback()
@@ -130,21 +151,11 @@ async def delete_work_experience(
         )
 
 
-@router.get("/total-experience/", response_model=TotalExperienceResponse)
-async def calculate_total_experience(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """محاسبه کل سابقه کاری به ماه"""
-    total = await WorkExperienceSelector.calculate_total_experience(db, current_user.id)
-    return total
-
-
 @router.post("/bulk/", response_model=List[WorkExperienceResponse], status_code=status.HTTP_201_CREATED)
 async def create_work_experiences_bulk(
     data: WorkExperienceBulkCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_uow)
 ):
     """ثبت چند سابقه کاری به صورت یکجا"""
     try:
@@ -152,11 +163,6 @@ async def create_work_experiences_bulk(
         
         # TODO: تغییر وضعیت applicant
         
-        await db.commit()
-        
-        for exp in new_experiences:
-            await db.refresh(exp)
-        
         return new_experiences
         
     except Exception as e:
@@ -164,23 +170,4 @@ async def create_work_experiences_bulk(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"خطا در ثبت سوابق کاری: {str(e)}"
-        )
-
-
-# ========== Additional endpoints using selectors ==========
-@router.get("/statistics/")
-async def get_work_experience_statistics(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    stats = await WorkExperienceSelector.get_statistics(db, current_user.id)
-    return stats
-
-
-@router.get("/current/")
-async def get_current_jobs(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    jobs = await WorkExperienceSelector.get_current_jobs(db, current_user.id)
-    return jobs
\ No newline at end of file
+        )
\ No newline at end of file
@@ -1,9 +1,11 @@
 # selectors.py for work_experience
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, case, extract, func
+from sqlalchemy.sql import ColumnElement
 from typing import List, Optional, Dict
 from datetime import datetime, date
 
+from aggregates import aggregate, count_if
 from .models import WorkExperience
 
 
@@ -77,26 +79,19 @@ class WorkExperienceSelector:
         return result.scalar()
     
     @staticmethod
-    async def calculate_total_experience(db: AsyncSession, user_id: int) -> Dict:
-
-        query = select(WorkExperience).where(WorkExperience.user_id == user_id)
-        result = await db.execute(query)
-        experiences = result.scalars().all()
-        
-        total_months = 0
+    def _experience_months() -> ColumnElement:
+        """مجموع ماه‌های سابقه؛ شغل فعلی تا امروز، سابقه بدون تاریخ پایان صفر"""
         today = datetime.utcnow().date()
-        
-        for work in experiences:
-            if work.currently_working:
-                end_date = today
-            elif work.end_date:
-                end_date = work.end_date
-            else:
-                continue
-            
-            delta = (end_date.year - work.start_date.year) * 12 + (end_date.month - work.start_date.month)
-            total_months += max(0, delta)
-        
+        start = extract("year", WorkExperience.start_date) * 12 + extract("month", WorkExperience.start_date)
+        end = case(
+            (WorkExperience.currently_working == True, today.year * 12 + today.month),
+            else_=extract("year", WorkExperience.end_date) * 12 + extract("month", WorkExperience.end_date),
+        )
+        return func.coalesce(func.sum(case((end > start, end - start), else_=0)), 0)
+
+    @staticmethod
+    def _format_experience(total_months: int) -> Dict:
+        total_months = int(total_months)  # extract() is numeric on PostgreSQL
         years = total_months // 12
         months = total_months % 12
         
@@ -107,25 +102,25 @@ class WorkExperienceSelector:
             "formatted": f"{years} سال و {months} ماه"
         }
     
+    @staticmethod
+    async def calculate_total_experience(db: AsyncSession, user_id: int) -> Dict:
+        stats = await aggregate(db, WorkExperience, WorkExperience.user_id == user_id, {
+            "total_months": WorkExperienceSelector._experience_months(),
+        })
+        return WorkExperienceSelector._format_experience(stats["total_months"])
+    
     @staticmethod
     async def get_statistics(db: AsyncSession, user_id: int) -> Dict:
-
-        total_query = select(func.count()).select_from(WorkExperience).where(WorkExperience.user_id == user_id)
-        total = await db.execute(total_query)
-        
-        current_query = select(func.count()).select_from(WorkExperience).where(
-            and_(WorkExperience.user_id == user_id, WorkExperience.currently_working == True)
-        )
-        current = await db.execute(current_query)
-        
-        max_salary_query = select(func.max(WorkExperience.salary)).where(WorkExperience.user_id == user_id)
-        max_salary = await db.execute(max_salary_query)
-        
-        total_exp = await WorkExperienceSelector.calculate_total_experience(db, user_id)
+        stats = await aggregate(db, WorkExperience, WorkExperience.user_id == user_id, {
+            "total": func.count(),
+            "current_jobs": count_if(WorkExperience.currently_working == True),
+            "max_salary": func.max(WorkExperience.salary),
+            "total_months": WorkExperienceSelector._experience_months(),
+        })
         
         return {
-            "total": total.scalar() or 0,
-            "current_jobs": current.scalar() or 0,
-            "max_salary": max_salary.scalar(),
-            "total_experience": total_exp
-        }
\ No newline at end of file
+            "total": stats["total"],
+            "current_jobs": stats["current_jobs"],
+            "max_salary": stats["max_salary"],
+            "total_experience": WorkExperienceSelector._format_experience(stats["total_months"])
+        }
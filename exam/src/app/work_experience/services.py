@@ -4,6 +4,7 @@ from sqlalchemy import select, and_
 from typing import List, Optional
 from datetime import datetime
 
+from bulk import bulk_insert, rows_for_user
 from .models import WorkExperience
 from .schemas import WorkExperienceCreate, WorkExperienceUpdate, WorkExperienceBulkCreate
 
@@ -52,26 +53,7 @@ class WorkExperienceService:
         user_id: int, 
         data: WorkExperienceBulkCreate
     ) -> List[WorkExperience]:
-
-        new_experiences = []
-        
-        for work in data.experiences:
-            experience = WorkExperience(
-                user_id=user_id,
-                company=work.company,
-                position=work.position,
-                start_date=work.start_date,
-                end_date=work.end_date,
-                currently_working=work.currently_working,
-                job_description=work.job_description,
-                leaving_reason=work.leaving_reason,
-                salary=work.salary
-            )
-            db.add(experience)
-            new_experiences.append(experience)
-        
-        await db.flush()
-        return new_experiences
+        return await bulk_insert(db, WorkExperience, rows_for_user(user_id, data.experiences))
     
     @staticmethod
     async def update(
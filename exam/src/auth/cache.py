@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+from .config import settings
+from .enums import RoleEnum
+from .models import User
+
+
+class UserSnapshot(NamedTuple):
+    """Lightweight, detached view of a user for authorization checks."""
+
+    id: int
+    role: Optional[RoleEnum]
+    is_active: bool
+    is_verified: bool
+
+
+class UserCache:
+    """
+    In-process TTL + LRU cache of user snapshots keyed by user id.
+
+    Each worker process has its own cache, so a change made through another
+    worker becomes visible here after at most `ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        ttl: int = settings.USER_CACHE_TTL_SECONDS,
+        max_size: int = settings.USER_CACHE_MAX_SIZE,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, tuple[float, UserSnapshot]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, user_id: int) -> Optional[UserSnapshot]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return snapshot
+
+    def put(self, user: User) -> UserSnapshot:
+        snapshot = UserSnapshot(
+            id=user.id,
+            role=user.role,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+        )
+        if self.ttl <= 0 or self.max_size <= 0:
+            return snapshot
+
+        self._entries[user.id] = (time.monotonic() + self.ttl, snapshot)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return snapshot
+
+    def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+user_cache = UserCache()
@@ -6,10 +6,27 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_DECODE_CACHE_SIZE: int = 4096  # 0 disables the verified-token cache
+
+    # Password hashing policy. Stored hashes that use another scheme or
+    # other cost parameters are transparently re-hashed on the next login.
+    PASSWORD_HASH_SCHEME: str = "bcrypt"  # "bcrypt" or "argon2" (needs argon2-cffi)
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 19456  # KiB
+    ARGON2_PARALLELISM: int = 1
+
+    # Password hashing worker pool
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # waiting jobs beyond this get a 503
 
     # Database settings
     DATABASE_URL: str = "sqlite+aiosqlite:///./exam.db"
     SQL_ECHO: bool = False
+
+    # Authenticated-user cache (per process)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10_000
     
     class Config:
         env_file = ".env"
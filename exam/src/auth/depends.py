@@ -11,8 +11,9 @@ from .exceptions import ForbiddenException
 from .jwt_handler import jwt_handler
 from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
-from .models import User
-from .selectors import get_user_by_id , get_user_admin
+from .cache import UserSnapshot, user_cache
+from .enums import RoleEnum
+from .selectors import get_user_by_id
 
 
 http_bearer = HTTPBearer(auto_error=True)
@@ -68,26 +69,28 @@ async def get_current_user_with_refresh(
     return str(user_id)
 
 
+async def _get_user_snapshot(db: AsyncSession, user_id: int) -> UserSnapshot:
+    snapshot = user_cache.get(user_id)
+    if snapshot is None:
+        user = await get_user_by_id(db, user_id)
+        if not user:
+            raise ForbiddenException("User not found")
+        snapshot = user_cache.put(user)
+    return snapshot
+
+
 async def get_current_user_obj(
     db: AsyncSession = Depends(get_db),
     user_id: str = Depends(get_current_user),
-) -> User:
-    user = await get_user_by_id(db, int(user_id))
-    if not user:
-        raise ForbiddenException("User not found")
-    return user
+) -> UserSnapshot:
+    return await _get_user_snapshot(db, int(user_id))
 
 async def get_current_user_obj_admin(
     db: AsyncSession = Depends(get_db),
-    user_id :User = Depends(get_current_user)
-)->User:
-    user = await get_user_admin(
-        db ,
-        user_id
-    )
-    print("user" , user)
-    if not user : 
+    user_id: str = Depends(get_current_user)
+) -> UserSnapshot:
+    user = await _get_user_snapshot(db, int(user_id))
+    if user.role != RoleEnum.MANGER:
         raise ForbiddenException("Invalid user for admin access")
     
-    else : 
-        return user
\ No newline at end of file
+    return user
@@ -10,3 +10,7 @@ class AuthenticationException(HTTPException):
     def __init__(self, detail: str = "Authentication failed"):
         super().__init__(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail)
 
+
+class ServiceUnavailableException(HTTPException):
+    def __init__(self, detail: str = "Service temporarily unavailable"):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
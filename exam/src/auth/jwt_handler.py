@@ -1,6 +1,9 @@
+import hashlib
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import jwt
 
@@ -49,12 +52,20 @@ class JWTHandler(BaseJWTHandler):
         algorithm: str = settings.ALGORITHM,
         access_token_expire_minutes: int = settings.ACCESS_TOKEN_EXPIRE_MINUTES,
         refresh_token_expire_days: int = settings.REFRESH_TOKEN_EXPIRE_DAYS,
+        decode_cache_size: int = settings.JWT_DECODE_CACHE_SIZE,
     ):
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
 
+        # Verified payloads keyed by sha256(token), evicted LRU-first.
+        # Entries are only served until the token's own `exp`.
+        self.decode_cache_size = decode_cache_size
+        self._decode_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.decode_cache_hits = 0
+        self.decode_cache_misses = 0
+
     def encode(
         self,
         payload: Dict[str, Any],
@@ -73,7 +84,32 @@ class JWTHandler(BaseJWTHandler):
 
         return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
-    def decode(self, token: str) -> Dict[str, Any]:
+    def decode(self, token: str, use_cache: bool = True) -> Dict[str, Any]:
+        if not use_cache or self.decode_cache_size <= 0:
+            return self._verify(token)
+
+        digest = hashlib.sha256(token.encode()).digest()
+        entry = self._decode_cache.get(digest)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > time.time():
+                self._decode_cache.move_to_end(digest)
+                self.decode_cache_hits += 1
+                return dict(payload)
+            del self._decode_cache[digest]
+
+        self.decode_cache_misses += 1
+        payload = self._verify(token)
+
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            self._decode_cache[digest] = (float(exp), dict(payload))
+            while len(self._decode_cache) > self.decode_cache_size:
+                self._decode_cache.popitem(last=False)
+
+        return payload
+
+    def _verify(self, token: str) -> Dict[str, Any]:
         try:
             payload = jwt.decode(
                 token,
@@ -86,6 +122,19 @@ class JWTHandler(BaseJWTHandler):
         except jwt.InvalidTokenError as exc:
             raise AuthenticationException("Invalid token") from exc
 
+    def clear_decode_cache(self) -> None:
+        self._decode_cache.clear()
+
+    def decode_cache_stats(self) -> Dict[str, float]:
+        lookups = self.decode_cache_hits + self.decode_cache_misses
+        return {
+            "size": len(self._decode_cache),
+            "max_size": self.decode_cache_size,
+            "hits": self.decode_cache_hits,
+            "misses": self.decode_cache_misses,
+            "hit_ratio": round(self.decode_cache_hits / lookups, 4) if lookups else 0.0,
+        }
+
     def create_access_token(
         self,
         user_id: str,
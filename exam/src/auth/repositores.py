@@ -1,7 +1,8 @@
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .models import User
-from .security import get_password_hash
+from .security import get_password_hash_async
 
 async def create_user(
     db: AsyncSession,
@@ -16,7 +17,7 @@ async def create_user(
     user = User(
         mobile=mobile,
         email=email,
-        password_hash=get_password_hash(password),
+        password_hash=await get_password_hash_async(password),
         role=role,
         is_active=is_active,
         is_verified=is_verified
@@ -31,10 +32,22 @@ async def update_user_password(
     new_password: str
 ) -> User:
     """به‌روزرسانی رمز عبور"""
-    user.password_hash = get_password_hash(new_password)
+    user.password_hash = await get_password_hash_async(new_password)
     await db.flush()
     return user
 
+async def set_password_hash(
+    db: AsyncSession,
+    user_id: int,
+    password_hash: str
+) -> None:
+    """جایگزینی هش رمز عبور بدون بارگذاری کاربر"""
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(password_hash=password_hash)
+    )
+
 async def verify_user_account(
     db: AsyncSession,
     user: User
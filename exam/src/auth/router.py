@@ -1,8 +1,17 @@
 from fastapi import APIRouter, Depends, status, Response, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
-from .depends import get_current_user_obj
+from database import (
+    engine,
+    get_db,
+    read_engine,
+    read_pool_metrics,
+    replica_engine,
+    replica_guard,
+    replica_pool_metrics,
+)
+from db_pool import pool_stats
+from .depends import get_current_user_obj, get_current_user_obj_admin
 from .models import User
 from .schemas import (
     UserResponse,
@@ -16,12 +25,58 @@ from .services import (
     login_user as login_user_service,
     update_user_password as update_user_password_service,
 )
+from .cache import UserSnapshot, user_cache
+from .jwt_handler import jwt_handler
+from .security import get_async_password_hasher
+from .selectors import get_user_by_id, list_users_page
 from .utils import set_cookie
 from config import settings
+from pagination import CursorParams, Page
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
+@router.get("/", response_model=Page[UserResponse])
+async def list_users_endpoint(
+    pagination: CursorParams = Depends(),
+    current_user: User = Depends(get_current_user_obj_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    return await list_users_page(db, pagination)
+
+
+@router.get("/cache-stats/")
+async def user_cache_stats_endpoint(
+    current_user: UserSnapshot = Depends(get_current_user_obj_admin),
+):
+    return {
+        **user_cache.stats(),
+        "jwt_decode": jwt_handler.decode_cache_stats(),
+    }
+
+
+@router.get("/hasher-stats/")
+async def password_hasher_stats_endpoint(
+    current_user: UserSnapshot = Depends(get_current_user_obj_admin),
+):
+    return get_async_password_hasher().stats()
+
+
+@router.get("/pool-stats/")
+async def db_pool_stats_endpoint(
+    current_user: UserSnapshot = Depends(get_current_user_obj_admin),
+):
+    stats = {"writer": pool_stats(engine.sync_engine)}
+    if read_engine is not None:
+        stats["reader"] = pool_stats(read_engine.sync_engine, read_pool_metrics)
+    if replica_engine is not None:
+        stats["replica"] = {
+            **pool_stats(replica_engine.sync_engine, replica_pool_metrics),
+            "lag": replica_guard.stats(),
+        }
+    return stats
+
+
 @router.post("/create/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register_user_endpoint(
     user_data: UserCreate,
@@ -67,11 +122,12 @@ async def login_user_endpoint(
 @router.put("/update-password/")
 async def update_password(
     password_data: PasswordUpdate,
-    current_user: User = Depends(get_current_user_obj),
+    current_user: UserSnapshot = Depends(get_current_user_obj),
     db: AsyncSession = Depends(get_db),
 ):
     print('user is ', current_user)
-    await update_user_password_service(db, current_user, password_data)
+    user = await get_user_by_id(db, current_user.id)
+    await update_user_password_service(db, user, password_data)
     return {"message": "رمز عبور با موفقیت تغییر کرد"}
 
 
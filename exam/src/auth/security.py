@@ -1,13 +1,72 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
 from passlib.context import CryptContext
+from passlib.hash import argon2 as passlib_argon2
 
+from .config import settings
+from .exceptions import ServiceUnavailableException
 from .jwt_handler import jwt_handler
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+T = TypeVar("T")
+
+
+SUPPORTED_HASH_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_crypt_context(
+    scheme: str = settings.PASSWORD_HASH_SCHEME,
+    bcrypt_rounds: int = settings.BCRYPT_ROUNDS,
+    argon2_time_cost: int = settings.ARGON2_TIME_COST,
+    argon2_memory_cost: int = settings.ARGON2_MEMORY_COST,
+    argon2_parallelism: int = settings.ARGON2_PARALLELISM,
+) -> CryptContext:
+    """
+    Build the CryptContext for a hashing policy.
+
+    New hashes use `scheme` with the given cost. Hashes made with the other
+    scheme, or with different cost parameters, still verify but are
+    reported by needs_update / verify_and_update so they can be upgraded.
+    """
+    if scheme not in SUPPORTED_HASH_SCHEMES:
+        raise ValueError(f"Unsupported PASSWORD_HASH_SCHEME: {scheme!r}")
+
+    argon2_available = passlib_argon2.has_backend()
+    if scheme == "argon2" and not argon2_available:
+        raise RuntimeError("PASSWORD_HASH_SCHEME=argon2 requires the argon2-cffi package")
+
+    schemes = [scheme]
+    if scheme == "argon2":
+        schemes.append("bcrypt")
+    elif argon2_available:
+        schemes.append("argon2")
+
+    options: Dict[str, Any] = {
+        "bcrypt__default_rounds": bcrypt_rounds,
+        "bcrypt__min_desired_rounds": bcrypt_rounds,
+        "bcrypt__max_desired_rounds": bcrypt_rounds,
+    }
+    if "argon2" in schemes:
+        options.update(
+            argon2__time_cost=argon2_time_cost,
+            argon2__memory_cost=argon2_memory_cost,
+            argon2__parallelism=argon2_parallelism,
+        )
+
+    return CryptContext(
+        schemes=schemes,
+        default=scheme,
+        deprecated="auto",
+        **options,
+    )
+
+
+pwd_context = build_crypt_context()
 
 
 class PasswordHasher(ABC):
@@ -19,8 +78,21 @@ class PasswordHasher(ABC):
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         ...
 
+    def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str,
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and, when the stored hash is outdated, return a
+        replacement hash. Hashers without upgrade support never return one.
+        """
+        return self.verify(plain_password, hashed_password), None
+
 
 class BcryptPasswordHasher(PasswordHasher):
+    """CryptContext-backed hasher (bcrypt or argon2, per the context policy)."""
+
     def __init__(self, context: CryptContext) -> None:
         self._ctx = context
 
@@ -30,8 +102,107 @@ class BcryptPasswordHasher(PasswordHasher):
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         return self._ctx.verify(plain_password, hashed_password)
 
+    def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str,
+    ) -> Tuple[bool, Optional[str]]:
+        return self._ctx.verify_and_update(plain_password, hashed_password)
+
+
+class AsyncPasswordHasher:
+    """
+    Runs a (CPU-bound) PasswordHasher in a dedicated, size-limited thread
+    pool so bcrypt never blocks the event loop.
+
+    At most `workers` hashes run at once and at most `max_queue` more wait
+    for a worker; beyond that calls fail fast with a 503 instead of piling
+    up behind a login burst.
+    """
+
+    def __init__(
+        self,
+        hasher: PasswordHasher,
+        workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_queue: int = settings.PASSWORD_HASH_MAX_QUEUE,
+    ) -> None:
+        self.hasher = hasher
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hasher",
+        )
+        self._in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._in_flight - self.workers)
+
+    async def _submit(self, func: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise ServiceUnavailableException(
+                "سرور مشغول است، لطفاً چند لحظه دیگر تلاش کنید"
+            )
+
+        def run():
+            started_at = time.perf_counter()
+            result = func(*args)
+            return result, started_at, time.perf_counter()
+
+        submitted_at = time.perf_counter()
+        self._in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        try:
+            loop = asyncio.get_running_loop()
+            result, started_at, finished_at = await loop.run_in_executor(self._executor, run)
+        finally:
+            self._in_flight -= 1
+
+        # counters are only touched on the event loop thread
+        self.completed += 1
+        self.total_wait_seconds += started_at - submitted_at
+        self.total_run_seconds += finished_at - started_at
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self.hasher.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(self.hasher.verify, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str,
+    ) -> Tuple[bool, Optional[str]]:
+        return await self._submit(self.hasher.verify_and_update, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_in_flight": self.peak_in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(1000 * self.total_wait_seconds / self.completed, 2) if self.completed else 0.0,
+            "avg_run_ms": round(1000 * self.total_run_seconds / self.completed, 2) if self.completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
 
 _password_hasher: PasswordHasher = BcryptPasswordHasher(pwd_context)
+_async_password_hasher: AsyncPasswordHasher = AsyncPasswordHasher(_password_hasher)
 
 
 def get_password_hasher() -> PasswordHasher:
@@ -43,6 +214,25 @@ def get_password_hasher() -> PasswordHasher:
     return _password_hasher
 
 
+def get_async_password_hasher() -> AsyncPasswordHasher:
+    """
+    Pool-backed hasher for use inside async handlers.
+    """
+
+    return _async_password_hasher
+
+
+def set_password_hasher(hasher: PasswordHasher) -> None:
+    """
+    Swap the hasher implementation (sync and pool-backed variants).
+    """
+
+    global _password_hasher, _async_password_hasher
+    _async_password_hasher.shutdown()
+    _password_hasher = hasher
+    _async_password_hasher = AsyncPasswordHasher(hasher)
+
+
 def get_password_hash(password: str) -> str:
     """
     Hash a password using the configured hasher.
@@ -67,6 +257,34 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return get_password_hasher().verify(plain_password, hashed_password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password on the hashing worker pool.
+    """
+
+    return await get_async_password_hasher().hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the hashing worker pool.
+    """
+
+    return await get_async_password_hasher().verify(plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str,
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password on the worker pool; also returns a new hash when the
+    stored one does not match the current hashing policy.
+    """
+
+    return await get_async_password_hasher().verify_and_update(plain_password, hashed_password)
+
+
 def create_access_token(
     data: Dict[str, str],
     expires_delta: Optional[timedelta] = None,
@@ -1,6 +1,7 @@
 from typing import Optional, List
-from sqlalchemy import select, or_ , and_
+from sqlalchemy import Row, select, or_ , and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from pagination import CursorParams, Page, SortKey, paginate
 from .models import User
 from .enums import RoleEnum
 
@@ -15,6 +16,25 @@ async def get_user_by_mobile(db: AsyncSession, mobile: str) -> Optional[User]:
     result = await db.execute(select(User).where(User.mobile == mobile))
     return result.scalar_one_or_none()
 
+async def get_login_credentials(db: AsyncSession, mobile: str) -> Optional[Row]:
+    """
+    ستون‌های لازم برای ورود (بدون ساخت شیء ORM و identity map)
+    """
+    result = await db.execute(
+        select(
+            User.id,
+            User.mobile,
+            User.email,
+            User.password_hash,
+            User.role,
+            User.is_active,
+            User.is_verified,
+            User.is_verified_phone,
+            User.created_at,
+        ).where(User.mobile == mobile)
+    )
+    return result.first()
+
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     """یافتن کاربر با ایمیل"""
     result = await db.execute(select(User).where(User.email == email))
@@ -54,6 +74,14 @@ async def list_users(
     return list(result.scalars().all())
 
 
+async def list_users_page(
+    db: AsyncSession,
+    params: CursorParams,
+) -> Page:
+    """لیست کاربران با صفحه‌بندی keyset روی id"""
+    return await paginate(db, select(User), [SortKey(User.id)], params)
+
+
 async def get_user_admin(
     db: AsyncSession,
     user_id: int
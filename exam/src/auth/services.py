@@ -2,12 +2,20 @@ from fastapi import HTTPException, status  # TODO remove fastapi layer from serv
 
 from typing import Optional
 
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .cache import user_cache
 from .models import User
 from .schemas import UserCreate, UserUpdate, UserLogin, PasswordUpdate
 
-from .security import get_password_hash, verify_password, create_access_token
+from .security import (
+    get_password_hash_async,
+    verify_password_async,
+    verify_and_update_password_async,
+    create_access_token,
+)
 from . import selectors as user_selector
 from . import repositores as user_repository
 
@@ -16,7 +24,7 @@ async def create_user(db: AsyncSession, user_in: UserCreate) -> User:
     user = User(
         mobile=user_in.mobile,
         email=user_in.email,
-        password_hash=get_password_hash(user_in.password),
+        password_hash=await get_password_hash_async(user_in.password),
         role=user_in.role,
         is_active=user_in.is_active,
         is_verified=user_in.is_verified,
@@ -42,16 +50,19 @@ async def update_user(
         setattr(user, field, value)
 
     if password is not None:
-        user.password_hash = get_password_hash(password)
+        user.password_hash = await get_password_hash_async(password)
 
     await db.commit()
+    user_cache.invalidate(user.id)
     await db.refresh(user)
     return user
 
 
 async def delete_user(db: AsyncSession, user: User) -> None:
+    user_id = user.id
     await db.delete(user)
     await db.commit()
+    user_cache.invalidate(user_id)
 
 
 async def set_user_active(
@@ -61,6 +72,7 @@ async def set_user_active(
 ) -> User:
     user.is_active = is_active
     await db.commit()
+    user_cache.invalidate(user.id)
     await db.refresh(user)
     return user
 
@@ -73,25 +85,7 @@ async def register_user(
     
     print("checking user")
 
-    existing_user = await user_selector.check_existing_user(
-        db, 
-        mobile=user_data.mobile,
-        email=user_data.email
-    )
-
-    if existing_user:
-        if existing_user.mobile == user_data.mobile:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="کاربر با این شماره موبایل قبلاً ثبت‌نام کرده است"
-            )
-        if user_data.email and existing_user.email == user_data.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="این ایمیل قبلاً ثبت شده است"
-            )
-    
-    # ایجاد کاربر جدید
+    # ایجاد کاربر جدید؛ یکتایی موبایل/ایمیل را قیدهای unique تضمین می‌کنند
     try:
         user = await user_repository.create_user(
             db,
@@ -101,8 +95,20 @@ async def register_user(
             role=user_data.role
         )
         await db.commit()
-        await db.refresh(user)
         return user
+    except IntegrityError as e:
+        await db.rollback()
+        if "email" in str(e.orig).lower():
+            detail = "این ایمیل قبلاً ثبت شده است"
+        else:
+            detail = "کاربر با این شماره موبایل قبلاً ثبت‌نام کرده است"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+    except HTTPException:
+        await db.rollback()
+        raise
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -113,11 +119,11 @@ async def register_user(
 async def login_user(
     db: AsyncSession,
     login_data: UserLogin
-) -> tuple[User, str]:
+) -> tuple[Row, str]:
     """ورود کاربر"""
     
-    # پیدا کردن کاربر
-    user = await user_selector.get_user_by_mobile(db, login_data.mobile)
+    # پیدا کردن کاربر (فقط ستون‌های لازم)
+    user = await user_selector.get_login_credentials(db, login_data.mobile)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -131,13 +137,20 @@ async def login_user(
             detail="حساب کاربری غیرفعال است"
         )
     
-    # بررسی رمز عبور
-    if not verify_password(login_data.password, user.password_hash):
+    # بررسی رمز عبور (و ارتقای هش قدیمی در همان مرحله)
+    is_valid, new_hash = await verify_and_update_password_async(
+        login_data.password, user.password_hash
+    )
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="شماره موبایل یا رمز عبور نادرست است"
         )
     
+    if new_hash:
+        await user_repository.set_password_hash(db, user.id, new_hash)
+        await db.commit()
+    
     # تولید توکن
     access_token = create_access_token(
         data={"sub": str(user.id), "mobile": user.mobile}
@@ -153,7 +166,7 @@ async def update_user_password(
     """تغییر رمز عبور"""
     
     # بررسی رمز فعلی
-    if not verify_password(password_data.old_password, current_user.password_hash):
+    if not await verify_password_async(password_data.old_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="رمز عبور فعلی نادرست است"
@@ -173,6 +186,10 @@ async def update_user_password(
             new_password=password_data.new_password
         )
         await db.commit()
+        user_cache.invalidate(current_user.id)
+    except HTTPException:
+        await db.rollback()
+        raise
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -0,0 +1,34 @@
+from typing import Any, Dict, List, Mapping, Sequence, Type, TypeVar
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+M = TypeVar("M")
+
+
+async def bulk_insert(
+    db: AsyncSession,
+    model: Type[M],
+    rows: Sequence[Mapping[str, Any]],
+) -> List[M]:
+    """
+    Insert `rows` with one INSERT ... VALUES (...), (...) RETURNING statement
+    (SQLAlchemy insertmanyvalues) and return the new ORM objects, ordered
+    by primary key. Server defaults such as created_at come back with
+    RETURNING, so no refresh is needed.
+
+    All rows should carry the same keys, otherwise they are split into one
+    batch per key set.
+    """
+    if not rows:
+        return []
+
+    result = await db.execute(insert(model).returning(model), list(rows))
+    objects = list(result.scalars().all())
+    return sorted(objects, key=lambda obj: obj.id)
+
+
+def rows_for_user(user_id: int, items: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Turn pydantic create-schemas into insert rows owned by `user_id`"""
+    return [{**item.model_dump(), "user_id": user_id} for item in items]
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -11,6 +13,41 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite+aiosqlite:///./exam.db"
     SQL_ECHO: bool = False
 
+    # Engine / connection pool (ignored for SQLite, which has no server pool).
+    # Size workers so that workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays
+    # below the server's max_connections.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 disables
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements; 0 for pgbouncer
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # PostgreSQL statement_timeout; 0 disables
+
+    # SQLite profile (file databases only). Writes go through a single
+    # writer connection, reads through SQLITE_READERS read-only connections.
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 20_000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_READERS: int = 4  # 0 sends reads to the writer as well
+
+    # Read replica for get_read_db (e.g. a PostgreSQL hot standby). When the
+    # replica lags more than REPLICA_MAX_LAG_SECONDS or cannot be reached,
+    # reads fall back to the primary.
+    DATABASE_REPLICA_URL: Optional[str] = None
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 2.0
+
+    # Latency objective of GET /applicants/dossier/{user_id}/
+    DOSSIER_P99_TARGET_MS: float = 250.0
+    # users per batch in the NDJSON dossier export (one query per section each)
+    DOSSIER_EXPORT_CHUNK_SIZE: int = 500
+
+    # Admin-wide statistics are cached per process for this long; 0 disables
+    ADMIN_STATS_CACHE_TTL_SECONDS: float = 30.0
+
     # Auth cookie settings
     AUTH_TOKEN_NAME: str = "Access-Token"
     HTTP_ONLY: bool = True
@@ -1,22 +1,261 @@
-from typing import AsyncGenerator
+import time
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.sql import Select
 
 from config import settings
+from db_pool import InstrumentedQueuePool, PoolMetrics, instrument_pool
 
 
-Base = declarative_base()
+class _EagerDefaults:
+    # hydrate server-generated columns (created_at, updated_at) through
+    # INSERT/UPDATE ... RETURNING instead of a refresh() SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=_EagerDefaults)
+
+
+@lru_cache(maxsize=None)
+def _update_only_columns(cls) -> tuple:
+    return tuple(
+        prop.key
+        for prop in inspect(cls).column_attrs
+        if prop.columns[0].onupdate is not None
+        and prop.columns[0].default is None
+        and prop.columns[0].server_default is None
+    )
+
+
+@event.listens_for(Base, "init", propagate=True)
+def _preset_update_only_columns(target, args, kwargs):
+    # columns such as updated_at are NULL after INSERT; setting them up front
+    # keeps eager_defaults from SELECTing them back
+    for key in _update_only_columns(type(target)):
+        if key not in kwargs:
+            setattr(target, key, None)
+
+
+def is_sqlite_file(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    create_async_engine() keyword arguments for the configured pool profile.
+    In-memory SQLite keeps SQLAlchemy's default pool; server databases get a
+    sized, instrumented queue pool and per-connection statement settings.
+    """
+    url = make_url(database_url)
+    options: Dict[str, Any] = {"echo": settings.SQL_ECHO, "future": True}
+    if url.get_backend_name() == "sqlite":
+        if is_sqlite_file(url):
+            # one writer connection: writers queue in the pool instead of
+            # failing with "database is locked"
+            options.update(
+                poolclass=InstrumentedQueuePool,
+                pool_size=1,
+                max_overflow=0,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+            )
+        return options
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+    connect_args: Dict[str, Any] = {}
+    driver = url.get_driver_name()
+    if driver == "asyncpg":
+        connect_args["prepared_statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+        if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+            }
+    elif driver in ("psycopg", "psycopg2") and settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def apply_sqlite_pragmas(engine: AsyncEngine, read_only: bool = False) -> None:
+    """Run the SQLite profile pragmas on every new connection of `engine`"""
+    pragmas = [
+        f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}",
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_read_engine(database_url: str) -> Optional[AsyncEngine]:
+    """Read-only connection pool next to the single SQLite writer"""
+    url = make_url(database_url)
+    if not is_sqlite_file(url) or settings.SQLITE_READERS <= 0:
+        return None
+    return create_async_engine(
+        url,
+        echo=settings.SQL_ECHO,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.SQLITE_READERS,
+        max_overflow=0,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
 
 
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.SQL_ECHO,
-    future=True,
+    **engine_options(settings.DATABASE_URL),
 )
+instrument_pool(engine.sync_engine)
+
+read_engine = create_read_engine(settings.DATABASE_URL)
+read_pool_metrics = PoolMetrics()
+if read_engine is not None:
+    instrument_pool(read_engine.sync_engine, read_pool_metrics)
+
+if is_sqlite_file(engine.url):
+    apply_sqlite_pragmas(engine)
+    if read_engine is not None:
+        apply_sqlite_pragmas(read_engine, read_only=True)
+
+
+class RoutingSession(Session):
+    """
+    Sends plain SELECTs to `read_engine` and everything else to `engine`.
+
+    Once a transaction has written, it stays on the writer until it ends,
+    so a session always reads its own uncommitted changes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if read_engine is None:
+            return engine.sync_engine
+        if (
+            not self._flushing
+            and not self.info.get("writer")
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            return read_engine.sync_engine
+        self.info["writer"] = True
+        return engine.sync_engine
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _release_writer(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("writer", None)
+
+
+class ReplicaLagGuard:
+    """
+    Decides whether the replica is fresh enough to serve reads.
+    The lag is measured at most once per `interval` seconds.
+    """
+
+    def __init__(self, replica: AsyncEngine, max_lag: float, interval: float):
+        self.replica = replica
+        self.max_lag = max_lag
+        self.interval = interval
+        self.last_lag: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.fallbacks = 0
+        self._usable = False
+        self._next_check = 0.0
+
+    async def _lag_seconds(self) -> float:
+        async with self.replica.connect() as conn:
+            if conn.dialect.name != "postgresql":
+                await conn.execute(text("SELECT 1"))
+                return 0.0
+            lag = await conn.execute(text(
+                "SELECT CASE"
+                " WHEN NOT pg_is_in_recovery() THEN 0"
+                " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+                " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+                " END"
+            ))
+            return float(lag.scalar() or 0)
+
+    async def is_usable(self) -> bool:
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.interval
+            try:
+                self.last_lag = await self._lag_seconds()
+                self.last_error = None
+                self._usable = self.last_lag <= self.max_lag
+            except Exception as e:
+                self.last_lag = None
+                self.last_error = str(e)
+                self._usable = False
+        if not self._usable:
+            self.fallbacks += 1
+        return self._usable
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "usable": self._usable,
+            "lag_seconds": self.last_lag,
+            "max_lag_seconds": self.max_lag,
+            "fallbacks": self.fallbacks,
+            "last_error": self.last_error,
+        }
+
+
+replica_engine: Optional[AsyncEngine] = None
+replica_guard: Optional[ReplicaLagGuard] = None
+replica_pool_metrics = PoolMetrics()
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        **engine_options(settings.DATABASE_REPLICA_URL),
+    )
+    instrument_pool(replica_engine.sync_engine, replica_pool_metrics)
+    replica_guard = ReplicaLagGuard(
+        replica_engine,
+        max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+        interval=settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+    )
+
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+)
+
+# read sessions are pinned to one engine, no per-statement routing
+ReadSessionLocal = sessionmaker(
     class_=AsyncSession,
     expire_on_commit=False,
 )
@@ -25,3 +264,61 @@ AsyncSessionLocal = sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_db(db: AsyncSession = Depends(get_db)) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Read-only session for selectors: the replica while it is within the
+    lag tolerance, else the SQLite readers, else the primary.
+    Data written moments ago may not be visible yet.
+    """
+    if replica_guard is not None and await replica_guard.is_usable():
+        bind = replica_engine
+    elif read_engine is not None:
+        bind = read_engine
+    else:
+        # no separate reader: share the request session rather than take a
+        # second connection from a pool that may hold only the writer
+        yield db
+        return
+    async with ReadSessionLocal(bind=bind) as session:
+        yield session
+
+
+async def get_uow(request: Request, db: AsyncSession = Depends(get_db)) -> AsyncSession:
+    """
+    Unit-of-work session: services only add/flush, and UnitOfWorkRoute
+    commits once after the endpoint returns successfully. Anything left
+    uncommitted is rolled back when the session closes.
+
+    It is the request's get_db session, so the auth lookup and the writes
+    share one connection (SQLite has a single writer connection).
+    """
+    request.state.uow = db
+    return db
+
+
+class UnitOfWorkRoute(APIRoute):
+    """
+    Route class for routers using get_uow. The commit runs before the
+    response is sent, so a failed commit still turns into an error response.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            response = await handler(request)
+            session = getattr(request.state, "uow", None)
+            if session is not None and response.status_code < 400:
+                await session.commit()
+            return response
+
+        return route_handler
+
+
+async def dispose_engines() -> None:
+    """Close pooled connections (aiosqlite worker threads keep the process alive)"""
+    for pooled in (engine, read_engine, replica_engine):
+        if pooled is not None:
+            await pooled.dispose()
@@ -0,0 +1,159 @@
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+WAIT_MS_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 30, 50, 75, 100, 150, 200)
+
+
+class Histogram:
+    """Fixed-bucket histogram; `buckets` are inclusive upper bounds."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th percentile (max for +Inf)"""
+        if not self.total:
+            return None
+        rank = q / 100 * self.total
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {
+            "count": self.total,
+            "sum": round(self.sum, 3),
+            "max": round(self.max, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class PoolMetrics:
+    """
+    Connection pool counters and histograms for one engine.
+
+    `checked_out` and `overflow` are sampled on every checkout, so their
+    histograms show how close the pool runs to its limits under load.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.wait_ms = Histogram(WAIT_MS_BUCKETS)
+        self.checked_out_hist = Histogram(COUNT_BUCKETS)
+        self.overflow_hist = Histogram(COUNT_BUCKETS)
+
+    def on_checkout(self, overflow: Optional[int]) -> None:
+        self.checkouts += 1
+        self.checked_out += 1
+        self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+        self.checked_out_hist.observe(self.checked_out)
+        if overflow is not None:
+            self.overflow_hist.observe(max(overflow, 0))
+
+    def on_checkin(self) -> None:
+        self.checkins += 1
+        self.checked_out = max(self.checked_out - 1, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "checked_out": self.checked_out,
+            "peak_checked_out": self.peak_checked_out,
+            "wait_ms": self.wait_ms.snapshot(),
+            "checked_out_histogram": self.checked_out_hist.snapshot(),
+            "overflow_histogram": self.overflow_hist.snapshot(),
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long a checkout waits."""
+
+    metrics = pool_metrics
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.wait_ms.observe((time.perf_counter() - started) * 1000)
+
+
+def instrument_pool(engine: Engine, metrics: PoolMetrics = pool_metrics) -> None:
+    """Attach checkout/checkin listeners of `metrics` to a sync engine's pool"""
+    pool = engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        pool.metrics = metrics
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        overflow = getattr(engine.pool, "overflow", None)
+        metrics.on_checkout(overflow() if overflow else None)
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.on_checkin()
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+
+def pool_stats(engine: Engine, metrics: PoolMetrics = pool_metrics) -> Dict[str, Any]:
+    """Live pool status plus the collected metrics"""
+    pool = engine.pool
+    live: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        getter = getattr(pool, name, None)
+        if callable(getter):
+            live[name] = getter()
+    return {**live, **metrics.stats()}
@@ -0,0 +1,142 @@
+import csv
+import io
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, AsyncIterator, List, Sequence
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from starlette.concurrency import run_in_threadpool
+
+
+EXPORT_FORMATS = ("csv", "xlsx")
+EXPORT_BATCH_SIZE = 1000  # rows per fetch from the server-side cursor
+FILE_CHUNK_SIZE = 64 * 1024
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# spreadsheet apps evaluate cells starting with these as formulas
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def export_columns(query: Select) -> List[str]:
+    """Header row: the labels of the selected columns"""
+    return [column.key for column in query.selected_columns]
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        # applicant-entered text: keep it from being run as a formula
+        return "'" + value
+    return value
+
+
+async def stream_rows(
+    db: AsyncSession,
+    query: Select,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[Sequence[Sequence[Any]]]:
+    """
+    Rows of `query` in batches of `batch_size`, read through a server-side
+    cursor, so only one batch is held in memory at a time.
+    """
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield [[_cell(value) for value in row] for row in partition]
+
+
+async def csv_chunks(header: List[str], batches: AsyncIterator) -> AsyncIterator[bytes]:
+    """
+    UTF-8 CSV with a BOM, so Excel shows Persian text correctly.
+    One chunk per batch.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(header)
+    async for rows in batches:
+        for row in rows:
+            writer.writerow(
+                value.isoformat() if isinstance(value, (date, datetime)) else value
+                for value in row
+            )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def xlsx_chunks(
+    header: List[str],
+    batches: AsyncIterator,
+    sheet_title: str,
+) -> AsyncIterator[bytes]:
+    """
+    XLSX written with openpyxl's write-only workbook. Rows go straight to
+    the workbook's temporary files and the saved file is streamed from
+    disk, so memory does not grow with the row count.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_title[:31])
+    sheet.append(header)
+    async for rows in batches:
+        for row in rows:
+            sheet.append(
+                value.replace(tzinfo=None) if isinstance(value, datetime) else value
+                for value in row
+            )
+
+    with tempfile.TemporaryFile() as output:
+        await run_in_threadpool(workbook.save, output)
+        output.seek(0)
+        while chunk := await run_in_threadpool(output.read, FILE_CHUNK_SIZE):
+            yield chunk
+
+
+def export_response(
+    db: AsyncSession,
+    query: Select,
+    filename: str,
+    export_format: str = "csv",
+) -> StreamingResponse:
+    """Stream the result of `query` as `filename`.csv or `filename`.xlsx"""
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"فرمت خروجی باید یکی از {', '.join(EXPORT_FORMATS)} باشد",
+        )
+
+    header = export_columns(query)
+    batches = stream_rows(db, query)
+    if export_format == "xlsx":
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="خروجی اکسل نیاز به نصب openpyxl دارد",
+            )
+        body = xlsx_chunks(header, batches, filename)
+        media_type = XLSX_MEDIA_TYPE
+    else:
+        body = csv_chunks(header, batches)
+        media_type = "text/csv"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+        },
+    )
@@ -0,0 +1,172 @@
+"""
+Index advisor: replays the per-user/per-job selector queries under EXPLAIN
+and flags full table scans. Sorts that need a temporary b-tree are listed
+as notes; they are fine on small per-user result sets.
+
+Run from the src directory:
+    python -m index_advisor
+
+SQLite plans come from EXPLAIN QUERY PLAN. On PostgreSQL sequential scans
+are disabled for the check, so a "Seq Scan" means no index can serve the
+query at all, whatever the table size.
+"""
+import asyncio
+import json
+import re
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+import app  # noqa: F401  registers every model
+from database import Base, dispose_engines, engine
+from pagination import CursorParams
+
+from app.applicant.models import Applicant
+from app.applicant.selectors import get_applicants_page
+from app.contact_information.selectors import get_addresses_by_user_id, get_contact_by_user_all
+from app.education.models import Education
+from app.education.selectors import EducationSelector
+from app.family_information.selectors import ChildSelector, SiblingSelector, SpouseSelector
+from app.job_applications.selectors import JobApplicationSelector
+from app.jobs_information.selectors import AdminJobAssignmentSelector, JobSelector
+from app.language_skills.models import LanguageSkill
+from app.language_skills.selectors import LanguageSelector
+from app.military_service.selectors import MilitarySelector
+from app.application_details.selectors import ApplicationDetailsSelector
+from app.skills.models import Skill
+from app.skills.selectors import SkillSelector
+from app.training_courses.selectors import TrainingSelector
+from app.work_experience.selectors import WorkExperienceSelector
+
+
+USER_ID = JOB_ID = ADMIN_ID = 1
+
+
+def _first(column) -> Any:
+    """Any valid value of an Enum column"""
+    return next(iter(column.type.enum_class))
+
+
+PROBES: Dict[str, Callable[[AsyncSession], Awaitable[Any]]] = {
+    "skills.by_user": lambda db: SkillSelector.get_by_user_id(db, USER_ID),
+    "skills.by_level": lambda db: SkillSelector.get_by_level(db, USER_ID, _first(Skill.skill_level)),
+    "skills.duplicates": lambda db: SkillSelector.find_duplicates(db, USER_ID, ["python"]),
+    "language_skills.by_user": lambda db: LanguageSelector.get_by_user_id(db, USER_ID),
+    "language_skills.by_language": lambda db: LanguageSelector.get_by_language(
+        db, USER_ID, _first(LanguageSkill.language)
+    ),
+    "educations.by_user": lambda db: EducationSelector.get_by_user_id(db, USER_ID),
+    "educations.by_degree": lambda db: EducationSelector.get_by_degree(db, USER_ID, _first(Education.degree)),
+    "work_experiences.by_user": lambda db: WorkExperienceSelector.get_by_user_id(db, USER_ID),
+    "work_experiences.current": lambda db: WorkExperienceSelector.get_current_jobs(db, USER_ID),
+    "training_courses.by_user": lambda db: TrainingSelector.get_by_user_id(db, USER_ID),
+    "training_courses.summary": lambda db: TrainingSelector.get_summary(db, USER_ID),
+    "spouses.by_user": lambda db: SpouseSelector.get_by_user_id(db, USER_ID),
+    "children.by_user": lambda db: ChildSelector.get_by_user_id(db, USER_ID),
+    "siblings.by_user": lambda db: SiblingSelector.get_by_user_id(db, USER_ID),
+    "contact_infos.by_user": lambda db: get_contact_by_user_all(db, USER_ID),
+    "addresses.by_user": lambda db: get_addresses_by_user_id(db, USER_ID, 1),
+    "military_services.by_user": lambda db: MilitarySelector.get_by_user_id(db, USER_ID),
+    "application_details.by_user": lambda db: ApplicationDetailsSelector.get_by_user_id(db, USER_ID),
+    "job_applications.by_user": lambda db: JobApplicationSelector.get_by_user_with_jobs(db, USER_ID),
+    "job_applications.by_job": lambda db: JobApplicationSelector.get_by_job(db, JOB_ID),
+    "job_applications.batch_apply_state": lambda db: JobApplicationSelector.get_batch_apply_state(
+        db, USER_ID, [JOB_ID, JOB_ID + 1]
+    ),
+    "job_applications.rank": lambda db: JobApplicationSelector.get_rank(db, JOB_ID, USER_ID),
+    "job_applications.ranked_page": lambda db: JobApplicationSelector.get_ranked_page(
+        db, JOB_ID, CursorParams(cursor=None, limit=50), priority=1
+    ),
+    "jobs.by_admin": lambda db: JobSelector.get_jobs_by_admin(db, ADMIN_ID),
+    "admin_jobs.by_job": lambda db: AdminJobAssignmentSelector.get_by_job(db, JOB_ID),
+    "admin_jobs.check": lambda db: AdminJobAssignmentSelector.check_assignment(db, ADMIN_ID, JOB_ID),
+    "applicants.page_by_status": lambda db: get_applicants_page(
+        db, CursorParams(cursor=None, limit=50), _first(Applicant.status)
+    ),
+}
+
+SQLITE_SCAN_RE = re.compile(r"^SCAN (\S+)(.*)$")
+
+
+async def capture(conn: AsyncConnection, probe) -> List[Tuple[str, Any]]:
+    """Run one probe and return the SQL statements it executed"""
+    statements: List[Tuple[str, Any]] = []
+
+    def _record(connection, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(conn.sync_connection, "before_cursor_execute", _record)
+    try:
+        async with AsyncSession(bind=conn) as db:
+            await probe(db)
+    finally:
+        event.remove(conn.sync_connection, "before_cursor_execute", _record)
+    return statements
+
+
+def _sqlite_findings(rows) -> List[str]:
+    findings = []
+    for row in rows:
+        detail = row[-1]
+        if detail.startswith("USE TEMP B-TREE"):
+            findings.append(f"note: {detail}")
+            continue
+        match = SQLITE_SCAN_RE.match(detail)
+        if match and match.group(1) in Base.metadata.tables and "INDEX" not in match.group(2):
+            findings.append(detail)
+    return findings
+
+
+def _postgres_findings(plan: Dict[str, Any]) -> List[str]:
+    findings = []
+    if plan.get("Node Type") == "Seq Scan":
+        findings.append(f"Seq Scan on {plan.get('Relation Name')}")
+    for child in plan.get("Plans", []):
+        findings.extend(_postgres_findings(child))
+    return findings
+
+
+async def explain(conn: AsyncConnection, statement: str, parameters: Any) -> List[str]:
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return _sqlite_findings(result.all())
+    if dialect == "postgresql":
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return _postgres_findings(plan[0]["Plan"])
+    raise NotImplementedError(f"no EXPLAIN support for {dialect}")
+
+
+async def advise() -> int:
+    flagged = 0
+    try:
+        async with engine.connect() as conn:
+            trans = await conn.begin()
+            try:
+                for name, probe in PROBES.items():
+                    findings: List[str] = []
+                    for statement, parameters in await capture(conn, probe):
+                        findings.extend(await explain(conn, statement, parameters))
+                    scans = [finding for finding in findings if not finding.startswith("note:")]
+                    flagged += bool(scans)
+                    print(f"{'SCAN' if scans else 'ok':<6}{name}")
+                    for finding in dict.fromkeys(findings):
+                        print(f"        {finding}")
+            finally:
+                await trans.rollback()
+    finally:
+        # also on errors: aiosqlite worker threads would keep the process alive
+        await dispose_engines()
+
+    print(f"{len(PROBES)} probes, {flagged} flagged")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(advise()))
@@ -7,7 +7,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from auth.router import router
 from auth.models import Base
 from config import settings
-from database import engine
+from database import dispose_engines, engine
+from app.applicant import search as applicant_search
+from app.jobs_information import search as job_search
 
 from fastapi import FastAPI
 from app import routers
@@ -18,7 +20,10 @@ app = FastAPI()
 async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(applicant_search.ensure_search_index)
+        await conn.run_sync(job_search.ensure_search_index)
     yield
+    await dispose_engines()
 
 
 app = FastAPI(title="Recruitment System API", lifespan=lifespan)
@@ -0,0 +1,372 @@
+"""baseline: the schema create_all built before migrations existed
+
+`alembic upgrade head` builds a new database from here. Databases the
+app created before migrations existed already have these tables; mark
+them with `alembic stamp 0001_baseline`, then upgrade.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_baseline"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# in creation order (foreign keys first); dropped in reverse
+TABLES = [
+    "jobs",
+    "users",
+    "UsersDetails",
+    "addresses",
+    "admin_jobs",
+    "application_details",
+    "children",
+    "contact_infos",
+    "educations",
+    "job_applications",
+    "language_skills",
+    "military_services",
+    "siblings",
+    "skills",
+    "spouses",
+    "training_courses",
+    "user_logs",
+]
+
+# PostgreSQL enum types the tables above create
+ENUM_TYPES = [
+    "bloodtypeenum",
+    "connectiontypeenum",
+    "educationdegreeenum",
+    "educationstudystatusenum",
+    "genderenum",
+    "housing_status_enum",
+    "languageenum",
+    "maritalstatusenum",
+    "militaryexemptiontypeenum",
+    "proficiencyenum",
+    "roleenum",
+    "siblingtypeenum",
+    "skilllevelenum",
+    "workscheduleenum",
+]
+
+
+def upgrade() -> None:
+    op.create_table("jobs",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("title", sa.String(length=200), nullable=False),
+    sa.Column("company", sa.String(length=200), nullable=False),
+    sa.Column("location", sa.String(length=100), nullable=False),
+    sa.Column("posted_date", sa.Date(), nullable=False),
+    sa.Column("deadline", sa.Date(), nullable=True),
+    sa.Column("description", sa.Text(), nullable=False),
+    sa.Column("requirements", sa.Text(), nullable=True),
+    sa.Column("salary", sa.String(length=100), nullable=True),
+    sa.Column("is_active", sa.Boolean(), nullable=True),
+    sa.Column("job_type", sa.String(length=50), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_jobs_id"), "jobs", ["id"], unique=False)
+
+    op.create_table("users",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("mobile", sa.String(length=11), nullable=False),
+    sa.Column("email", sa.String(length=100), nullable=True),
+    sa.Column("password_hash", sa.String(length=255), nullable=False),
+    sa.Column("role", sa.Enum("ADMIN", "USER", "MANGER", name="roleenum"), nullable=True),
+    sa.Column("is_active", sa.Boolean(), nullable=False),
+    sa.Column("is_verified", sa.Boolean(), nullable=False),
+    sa.Column("is_verified_phone", sa.Boolean(), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
+    op.create_index(op.f("ix_users_mobile"), "users", ["mobile"], unique=True)
+
+    op.create_table("UsersDetails",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("name", sa.String(length=200), nullable=False),
+    sa.Column("family", sa.String(length=200), nullable=False),
+    sa.Column("national_code", sa.String(length=10), nullable=False),
+    sa.Column("father_name", sa.String(length=100), nullable=False),
+    sa.Column("id_number", sa.String(length=20), nullable=False),
+    sa.Column("insurance_number", sa.String(length=30), nullable=True),
+    sa.Column("id_place", sa.String(length=100), nullable=False),
+    sa.Column("father_job", sa.String(length=100), nullable=True),
+    sa.Column("birth_date", sa.Date(), nullable=False),
+    sa.Column("nationality", sa.String(length=50), nullable=True),
+    sa.Column("birth_place", sa.String(length=100), nullable=False),
+    sa.Column("religion", sa.String(length=50), nullable=True),
+    sa.Column("gender", sa.Enum("MALE", "FEMALE", name="genderenum"), nullable=False),
+    sa.Column("blood_type", sa.Enum("A_POSITIVE", "A_NEGATIVE", "B_POSITIVE", "B_NEGATIVE", "AB_POSITIVE", "AB_NEGATIVE", "O_POSITIVE", "O_NEGATIVE", name="bloodtypeenum"), nullable=True),
+    sa.Column("marital_status", sa.Enum("SINGLE", "MARRIED", name="maritalstatusenum"), nullable=False),
+    sa.Column("marriage_date", sa.Date(), nullable=True),
+    sa.Column("tracking_code", sa.String(length=20), nullable=True),
+    sa.Column("submitted_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id"),
+    sa.UniqueConstraint("tracking_code"),
+    sa.UniqueConstraint("user_id")
+    )
+    op.create_index(op.f("ix_UsersDetails_id"), "UsersDetails", ["id"], unique=False)
+    op.create_index(op.f("ix_UsersDetails_national_code"), "UsersDetails", ["national_code"], unique=True)
+
+    op.create_table("addresses",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("province", sa.String(length=50), nullable=False),
+    sa.Column("city", sa.String(length=50), nullable=False),
+    sa.Column("address", sa.Text(), nullable=False),
+    sa.Column("postal_code", sa.String(length=10), nullable=True),
+    sa.Column("housing_status", sa.Enum("OWNER", "TENANT", "PARENTS_HOUSE", "OTHER", name="housing_status_enum"), nullable=False),
+    sa.Column("ownership_duration", sa.Integer(), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+
+    op.create_table("admin_jobs",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("admin_id", sa.Integer(), nullable=False),
+    sa.Column("job_id", sa.Integer(), nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(["admin_id"], ["users.id"], ondelete="CASCADE"),
+    sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_admin_jobs_id"), "admin_jobs", ["id"], unique=False)
+
+    op.create_table("application_details",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("connection_type", sa.Enum("INTERNET", "ADS", "PERSONAL", "JOB_AGENCY", "REFERRAL", name="connectiontypeenum"), nullable=False),
+    sa.Column("referrer_name", sa.String(length=200), nullable=True),
+    sa.Column("referrer_relationship", sa.String(length=100), nullable=True),
+    sa.Column("referrer_phone", sa.String(length=11), nullable=True),
+    sa.Column("has_relatives_in_company", sa.Boolean(), nullable=True),
+    sa.Column("relative_name", sa.String(length=200), nullable=True),
+    sa.Column("relative_position", sa.String(length=100), nullable=True),
+    sa.Column("relative_relationship", sa.String(length=100), nullable=True),
+    sa.Column("available_from_date", sa.Date(), nullable=False),
+    sa.Column("preferred_work_schedule", sa.Enum("FULL_TIME", "PART_TIME", "DAY_SHIFT", "SHIFT_BASED", "FLEXIBLE", name="workscheduleenum"), nullable=False),
+    sa.Column("expected_salary", sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column("salary_currency", sa.String(length=10), nullable=True),
+    sa.Column("salary_period", sa.String(length=20), nullable=True),
+    sa.Column("has_health_issue", sa.Boolean(), nullable=True),
+    sa.Column("health_issue_description", sa.Text(), nullable=True),
+    sa.Column("has_disability", sa.Boolean(), nullable=True),
+    sa.Column("disability_description", sa.Text(), nullable=True),
+    sa.Column("takes_medication", sa.Boolean(), nullable=True),
+    sa.Column("medication_details", sa.Text(), nullable=True),
+    sa.Column("has_criminal_record", sa.Boolean(), nullable=True),
+    sa.Column("criminal_record_details", sa.Text(), nullable=True),
+    sa.Column("favorite_sport", sa.String(length=100), nullable=True),
+    sa.Column("has_transportation", sa.Boolean(), nullable=True),
+    sa.Column("willing_to_relocate", sa.Boolean(), nullable=True),
+    sa.Column("other_comments", sa.Text(), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_application_details_id"), "application_details", ["id"], unique=False)
+
+    op.create_table("children",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("full_name", sa.String(length=200), nullable=False),
+    sa.Column("age", sa.Integer(), nullable=False),
+    sa.Column("gender", sa.Enum("MALE", "FEMALE", name="genderenum"), nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_children_id"), "children", ["id"], unique=False)
+
+    op.create_table("contact_infos",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("phone", sa.String(length=11), nullable=False),
+    sa.Column("emergency_phone", sa.String(length=11), nullable=True),
+    sa.Column("email", sa.String(length=100), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+
+    op.create_table("educations",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("degree", sa.Enum("DIPLOMA", "ASSOCIATE", "BACHELOR", "MASTER", "PHD", "POST_DOC", name="educationdegreeenum"), nullable=False),
+    sa.Column("field", sa.String(length=200), nullable=False),
+    sa.Column("university", sa.String(length=200), nullable=False),
+    sa.Column("average", sa.Float(), nullable=True),
+    sa.Column("start_year", sa.Integer(), nullable=False),
+    sa.Column("end_year", sa.Integer(), nullable=True),
+    sa.Column("study_status", sa.Enum("GRADUATED", "STUDENT", "DROPPED", "CONTINUING", name="educationstudystatusenum"), nullable=False),
+    sa.Column("description", sa.Text(), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_educations_id"), "educations", ["id"], unique=False)
+
+    op.create_table("job_applications",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("job_id", sa.Integer(), nullable=False),
+    sa.Column("score", sa.Float(), nullable=False),
+    sa.Column("priority", sa.Integer(), nullable=False),
+    sa.Column("status", sa.String(length=50), nullable=True),
+    sa.Column("applied_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id"),
+    sa.UniqueConstraint("user_id", "job_id", name="unique_user_job")
+    )
+    op.create_index(op.f("ix_job_applications_id"), "job_applications", ["id"], unique=False)
+
+    op.create_table("language_skills",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("language", sa.Enum("ENGLISH", "ARABIC", "FRENCH", "GERMAN", "TURKISH", "SPANISH", "RUSSIAN", "CHINESE", "JAPANESE", "OTHER", name="languageenum"), nullable=False),
+    sa.Column("other_language", sa.String(length=100), nullable=True),
+    sa.Column("reading", sa.Enum("BASIC", "INTERMEDIATE", "ADVANCED", "NATIVE", name="proficiencyenum"), nullable=False),
+    sa.Column("writing", sa.Enum("BASIC", "INTERMEDIATE", "ADVANCED", "NATIVE", name="proficiencyenum"), nullable=False),
+    sa.Column("speaking", sa.Enum("BASIC", "INTERMEDIATE", "ADVANCED", "NATIVE", name="proficiencyenum"), nullable=False),
+    sa.Column("listening", sa.Enum("BASIC", "INTERMEDIATE", "ADVANCED", "NATIVE", name="proficiencyenum"), nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_language_skills_id"), "language_skills", ["id"], unique=False)
+
+    op.create_table("military_services",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("service_start", sa.Date(), nullable=True),
+    sa.Column("service_end", sa.Date(), nullable=True),
+    sa.Column("service_duration", sa.String(length=50), nullable=True),
+    sa.Column("shortage_duration", sa.String(length=50), nullable=True),
+    sa.Column("extra_duration", sa.String(length=50), nullable=True),
+    sa.Column("service_org", sa.String(length=200), nullable=True),
+    sa.Column("service_city", sa.String(length=100), nullable=True),
+    sa.Column("exemption_type", sa.Enum("EDUCATIONAL", "GUARDIANSHIP", "PURCHASE", "MEDICAL", "SERVED", "EXEMPT", name="militaryexemptiontypeenum"), nullable=True),
+    sa.Column("exemption_reason", sa.Text(), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_military_services_id"), "military_services", ["id"], unique=False)
+
+    op.create_table("siblings",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("full_name", sa.String(length=200), nullable=False),
+    sa.Column("age", sa.Integer(), nullable=False),
+    sa.Column("sibling_type", sa.Enum("BROTHER", "SISTER", name="siblingtypeenum"), nullable=False),
+    sa.Column("marital_status", sa.Enum("SINGLE", "MARRIED", name="maritalstatusenum"), nullable=False),
+    sa.Column("job", sa.String(length=100), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_siblings_id"), "siblings", ["id"], unique=False)
+
+    op.create_table("skills",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("skill_name", sa.String(length=100), nullable=False),
+    sa.Column("skill_level", sa.Enum("BEGINNER", "INTERMEDIATE", "ADVANCED", "EXPERT", name="skilllevelenum"), nullable=False),
+    sa.Column("years_of_experience", sa.Integer(), nullable=True),
+    sa.Column("description", sa.Text(), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_skills_id"), "skills", ["id"], unique=False)
+
+    op.create_table("spouses",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("full_name", sa.String(length=200), nullable=False),
+    sa.Column("job", sa.String(length=100), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_spouses_id"), "spouses", ["id"], unique=False)
+
+    op.create_table("training_courses",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("title", sa.String(length=200), nullable=False),
+    sa.Column("institute", sa.String(length=200), nullable=False),
+    sa.Column("duration", sa.String(length=50), nullable=False),
+    sa.Column("start_date", sa.Date(), nullable=False),
+    sa.Column("end_date", sa.Date(), nullable=True),
+    sa.Column("has_certificate", sa.Boolean(), nullable=True),
+    sa.Column("certificate_id", sa.String(length=100), nullable=True),
+    sa.Column("certificate_date", sa.Date(), nullable=True),
+    sa.Column("description", sa.Text(), nullable=True),
+    sa.Column("skills_learned", sa.Text(), nullable=True),
+    sa.Column("instructor", sa.String(length=100), nullable=True),
+    sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_training_courses_id"), "training_courses", ["id"], unique=False)
+
+    op.create_table("user_logs",
+    sa.Column("id", sa.Integer(), nullable=False),
+    sa.Column("user_id", sa.Integer(), nullable=False),
+    sa.Column("action", sa.String(length=50), nullable=False),
+    sa.Column("changes", sa.JSON(), nullable=True),
+    sa.Column("ip_address", sa.String(length=45), nullable=True),
+    sa.Column("user_agent", sa.String(length=255), nullable=True),
+    sa.Column("status", sa.String(length=20), nullable=False),
+    sa.Column("error_message", sa.String(length=500), nullable=True),
+    sa.Column("created_at", sa.DateTime(), nullable=False),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+    sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_user_logs_id"), "user_logs", ["id"], unique=False)
+    op.create_index(op.f("ix_user_logs_user_id"), "user_logs", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_table(table)
+    if op.get_bind().dialect.name == "postgresql":
+        for name in ENUM_TYPES:
+            op.execute(f"DROP TYPE IF EXISTS {name}")
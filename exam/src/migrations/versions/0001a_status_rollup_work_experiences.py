@@ -0,0 +1,143 @@
+"""UsersDetails.status, applicant stats rollup and work experiences
+
+Schema the models gained without a migration. Databases that create_all
+has already brought up to date skip the parts they have.
+
+Revision ID: 0001a_status_rollup_work_experiences
+Revises: 0001_baseline
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001a_status_rollup_work_experiences"
+down_revision: Union[str, None] = "0001_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+STATUSES = (
+    "DRAFT",
+    "PERSONAL_COMPLETED",
+    "FAMILY_COMPLETED",
+    "EDUCATION_COMPLETED",
+    "EXPERIENCE_COMPLETED",
+    "MILITARY_COMPLETED",
+    "SKILLS_COMPLETED",
+    "DOCUMENTS_COMPLETED",
+    "SUBMITTED",
+    "UNDER_REVIEW",
+    "ACCEPTED",
+    "REJECTED",
+)
+GENDERS = ("MALE", "FEMALE")
+
+
+def _enum(*values: str, name: str) -> sa.Enum:
+    # the PostgreSQL types are created explicitly (statusenum) or exist
+    # already (genderenum, from the baseline)
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), "postgresql"
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    sa.Enum(*STATUSES, name="statusenum").create(bind, checkfirst=True)
+
+    if "status" not in {column["name"] for column in inspector.get_columns("UsersDetails")}:
+        op.add_column(
+            "UsersDetails",
+            sa.Column(
+                "status",
+                _enum(*STATUSES, name="statusenum"),
+                nullable=False,
+                server_default="DRAFT",
+            ),
+        )
+        op.execute('UPDATE "UsersDetails" SET status = \'SUBMITTED\' WHERE submitted_at IS NOT NULL')
+
+    if not inspector.has_table("applicant_stats_rollup"):
+        op.create_table(
+            "applicant_stats_rollup",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("status", _enum(*STATUSES, name="statusenum"), nullable=False),
+            sa.Column("gender", _enum(*GENDERS, name="genderenum"), nullable=False),
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("count", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("status", "gender", "day", name="unique_rollup_bucket"),
+        )
+    op.create_index(
+        "ix_applicant_stats_rollup_id", "applicant_stats_rollup", ["id"], if_not_exists=True
+    )
+    _fill_rollup(bind)
+
+    if not inspector.has_table("work_experiences"):
+        op.create_table(
+            "work_experiences",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("company", sa.String(length=200), nullable=False),
+            sa.Column("position", sa.String(length=200), nullable=False),
+            sa.Column("start_date", sa.Date(), nullable=False),
+            sa.Column("end_date", sa.Date(), nullable=True),
+            sa.Column("currently_working", sa.Boolean(), nullable=True),
+            sa.Column("job_description", sa.Text(), nullable=True),
+            sa.Column("leaving_reason", sa.Text(), nullable=True),
+            sa.Column("salary", sa.Numeric(precision=12, scale=2), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    op.create_index("ix_work_experiences_id", "work_experiences", ["id"], if_not_exists=True)
+
+
+def _fill_rollup(bind) -> None:
+    """Rebuild the rollup from UsersDetails, bucketed like the services do"""
+    applicants = sa.table(
+        "UsersDetails",
+        sa.column("status"),
+        sa.column("gender"),
+        sa.column("submitted_at"),
+        sa.column("created_at"),
+    )
+    rollup = sa.table(
+        "applicant_stats_rollup",
+        sa.column("status"),
+        sa.column("gender"),
+        sa.column("day"),
+        sa.column("count"),
+    )
+    moment = sa.func.coalesce(applicants.c.submitted_at, applicants.c.created_at)
+    day = sa.func.date(moment) if bind.dialect.name == "sqlite" else sa.cast(moment, sa.Date)
+    status = sa.func.coalesce(applicants.c.status, "DRAFT")
+
+    op.execute(rollup.delete())
+    op.execute(
+        rollup.insert().from_select(
+            ["status", "gender", "day", "count"],
+            sa.select(status, applicants.c.gender, day, sa.func.count()).group_by(
+                status, applicants.c.gender, day
+            ),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_work_experiences_id", table_name="work_experiences", if_exists=True)
+    op.drop_table("work_experiences")
+    op.drop_index("ix_applicant_stats_rollup_id", table_name="applicant_stats_rollup", if_exists=True)
+    op.drop_table("applicant_stats_rollup")
+    with op.batch_alter_table("UsersDetails") as batch_op:
+        batch_op.drop_column("status")
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TYPE IF EXISTS statusenum")
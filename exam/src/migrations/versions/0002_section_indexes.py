@@ -0,0 +1,51 @@
+"""indexes for per-user section lookups and admin listings
+
+Revision ID: 0002_section_indexes
+Revises: 0001a_status_rollup_work_experiences
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_section_indexes"
+down_revision: Union[str, None] = "0001a_status_rollup_work_experiences"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns); create_all already makes these on new
+# databases, hence if_not_exists
+INDEXES = [
+    ("ix_skills_user_id_skill_level", "skills", ["user_id", "skill_level"]),
+    ("ix_language_skills_user_id_language", "language_skills", ["user_id", "language"]),
+    ("ix_educations_user_id_degree", "educations", ["user_id", "degree"]),
+    ("ix_work_experiences_user_id_currently_working", "work_experiences", ["user_id", "currently_working"]),
+    ("ix_training_courses_user_id_start_date", "training_courses", ["user_id", "start_date"]),
+    ("ix_spouses_user_id", "spouses", ["user_id"]),
+    ("ix_children_user_id", "children", ["user_id"]),
+    ("ix_siblings_user_id", "siblings", ["user_id"]),
+    ("ix_contact_infos_user_id", "contact_infos", ["user_id"]),
+    ("ix_addresses_user_id", "addresses", ["user_id"]),
+    ("ix_military_services_user_id", "military_services", ["user_id"]),
+    ("ix_application_details_user_id", "application_details", ["user_id"]),
+    ("ix_job_applications_job_id_score", "job_applications", ["job_id", sa.text("score DESC")]),
+    ("ix_job_applications_user_id_priority", "job_applications", ["user_id", "priority"]),
+    ("ix_UsersDetails_status_submitted_at", "UsersDetails", ["status", "submitted_at"]),
+    ("ix_admin_jobs_job_id", "admin_jobs", ["job_id"]),
+    ("ix_admin_jobs_admin_id_job_id", "admin_jobs", ["admin_id", "job_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,62 @@
+"""job application rank buckets
+
+Revision ID: 0003_job_application_ranks
+Revises: 0002_section_indexes
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_job_application_ranks"
+down_revision: Union[str, None] = "0002_section_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create_all at startup may already have made the table
+    if not sa.inspect(op.get_bind()).has_table("job_application_ranks"):
+        _create_ranks_table()
+    op.create_index(
+        "ix_job_application_ranks_id", "job_application_ranks", ["id"], if_not_exists=True
+    )
+    op.create_index(
+        "ix_job_applications_job_id_priority_score",
+        "job_applications",
+        ["job_id", "priority", sa.text("score DESC"), "id"],
+        if_not_exists=True,
+    )
+    # fill the buckets from the existing applications
+    op.execute("DELETE FROM job_application_ranks")
+    op.execute(
+        "INSERT INTO job_application_ranks (job_id, score, count)"
+        " SELECT job_id, score, COUNT(*) FROM job_applications"
+        " WHERE status IS NULL OR status != 'withdrawn'"
+        " GROUP BY job_id, score"
+    )
+
+
+def _create_ranks_table() -> None:
+    op.create_table(
+        "job_application_ranks",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_id", "score", name="unique_job_score_bucket"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_job_applications_job_id_priority_score", table_name="job_applications", if_exists=True
+    )
+    op.drop_index("ix_job_application_ranks_id", table_name="job_application_ranks", if_exists=True)
+    op.drop_table("job_application_ranks")
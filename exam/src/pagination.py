@@ -0,0 +1,146 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Generic, List, NamedTuple, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy import Select, and_, false, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+T = TypeVar("T")
+
+
+class SortKey(NamedTuple):
+    """
+    One column of a keyset sort order.
+    nullable columns are always ordered NULLS LAST.
+    """
+
+    column: Any
+    descending: bool = False
+    nullable: bool = False
+
+
+class Page(BaseModel, Generic[T]):
+    """Response schema for a keyset-paginated listing"""
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class CursorParams:
+    """
+    FastAPI dependency for keyset pagination.
+
+    `cursor` is the opaque `next_cursor` of the previous page
+    (omit it for the first page).
+    """
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="next_cursor صفحه قبل"),
+        limit: int = Query(50, ge=1, le=500),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of the last row into an opaque cursor"""
+    payload = [
+        value.isoformat() if isinstance(value, (date, datetime)) else getattr(value, "value", value)
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> List[Any]:
+    """Decode a cursor back into typed values for the given sort keys"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(payload, list) or len(payload) != len(keys):
+            raise ValueError("cursor does not match sort order")
+
+        values = []
+        for key, raw in zip(keys, payload):
+            if raw is None:
+                values.append(None)
+                continue
+            python_type = key.column.type.python_type
+            if python_type in (date, datetime):
+                values.append(python_type.fromisoformat(raw))
+            else:
+                values.append(python_type(raw))
+        return values
+    except (ValueError, TypeError, binascii.Error, json.JSONDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor نامعتبر است",
+        )
+
+
+def _order_by(key: SortKey):
+    clause = key.column.desc() if key.descending else key.column.asc()
+    return clause.nulls_last() if key.nullable else clause
+
+
+def _strictly_after(key: SortKey, value: Any):
+    if value is None:
+        # NULLs sort last, nothing non-null comes after them
+        return false()
+    after = key.column < value if key.descending else key.column > value
+    return or_(after, key.column.is_(None)) if key.nullable else after
+
+
+def _equal(key: SortKey, value: Any):
+    return key.column.is_(None) if value is None else key.column == value
+
+
+def _after(keys: Sequence[SortKey], values: Sequence[Any]):
+    """WHERE clause selecting the rows that sort after `values`"""
+    key, value = keys[0], values[0]
+    if len(keys) == 1:
+        return _strictly_after(key, value)
+    return or_(
+        _strictly_after(key, value),
+        and_(_equal(key, value), _after(keys[1:], values[1:])),
+    )
+
+
+def keyset_query(query: Select, keys: Sequence[SortKey], params: CursorParams) -> Select:
+    """
+    Apply keyset ordering, the cursor predicate and LIMIT (+1 to detect
+    a next page) to a select().
+    """
+    if params.cursor:
+        values = decode_cursor(params.cursor, keys)
+        query = query.where(_after(keys, values))
+    return query.order_by(*(_order_by(key) for key in keys)).limit(params.limit + 1)
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    keys: Sequence[SortKey],
+    params: CursorParams,
+) -> Page:
+    """Run a keyset-paginated select() of ORM entities and build a Page"""
+    result = await db.execute(keyset_query(query, keys, params))
+    rows = list(result.scalars().all())
+
+    has_more = len(rows) > params.limit
+    items = rows[:params.limit]
+    next_cursor = None
+    if has_more and items:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            [getattr(last, key.column.key) for key in keys]
+        )
+
+    return Page(items=items, next_cursor=next_cursor, has_more=has_more)
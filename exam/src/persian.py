@@ -0,0 +1,30 @@
+import re
+from typing import Optional
+
+
+_PERSIAN_CHARS = str.maketrans({
+    "\u064a": "\u06cc",  # Arabic yeh -> Persian yeh
+    "\u0649": "\u06cc",  # alef maksura -> Persian yeh
+    "\u0643": "\u06a9",  # Arabic kaf -> Persian kaf
+    "\u0629": "\u0647",  # teh marbuta -> heh
+    "\u06c0": "\u0647",  # heh with yeh above -> heh
+    "\u0623": "\u0627",  # alef with hamza above -> alef
+    "\u0625": "\u0627",  # alef with hamza below -> alef
+    **{chr(0x06F0 + d): str(d) for d in range(10)},  # Persian digits
+    **{chr(0x0660 + d): str(d) for d in range(10)},  # Arabic-Indic digits
+})
+# ZWNJ and other zero-width/bidi marks, tatweel, Arabic diacritics
+_STRIP_RE = re.compile("[\u200b-\u200f\u202a-\u202e\ufeff\u0640\u064b-\u065f\u0670]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_persian(value: Optional[str]) -> str:
+    """
+    Fold the spelling variants users type into one form: Arabic yeh/kaf to
+    Persian, Persian/Arabic digits to ASCII, ZWNJ and diacritics removed,
+    lower case, single spaces.
+    """
+    if not value:
+        return ""
+    value = _STRIP_RE.sub("", value.translate(_PERSIAN_CHARS))
+    return _SPACE_RE.sub(" ", value).strip().casefold()
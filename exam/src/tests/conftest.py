@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+
+# the settings are read at import time: point the app at a throwaway database
+# before anything imports config
+_db_dir = tempfile.mkdtemp(prefix="exam-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_db_dir, 'test.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+import main  # noqa: E402
+from auth import depends  # noqa: E402
+from auth.enums import RoleEnum  # noqa: E402
+from auth.models import User  # noqa: E402
+from database import AsyncSessionLocal  # noqa: E402
+
+
+USER_ID = 1
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def client():
+    """
+    API client authenticated as a plain user. Only the token check is
+    replaced; the user itself is loaded through the real dependencies.
+    """
+    async with main.lifespan(main.app):
+        async with AsyncSessionLocal() as db:
+            if await db.get(User, USER_ID) is None:
+                db.add(User(id=USER_ID, mobile="09120000001", password_hash="x", role=RoleEnum.USER))
+                await db.commit()
+
+        main.app.dependency_overrides[depends.get_current_user] = lambda: str(USER_ID)
+        transport = httpx.ASGITransport(app=main.app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://test/api/v1") as api:
+                yield api
+        finally:
+            main.app.dependency_overrides.clear()
@@ -0,0 +1,42 @@
+import pytest
+
+
+pytestmark = pytest.mark.anyio
+
+
+# static GET paths that share a prefix with an /{id} route
+STATIC_PATHS = [
+    "/skills/statistics/",
+    "/languages/statistics/",
+    "/languages/proficiency-summary/",
+    "/education/statistics/",
+    "/education/highest-degree/",
+    "/work-experience/statistics/",
+    "/work-experience/total-experience/",
+    "/work-experience/current/",
+    "/training/statistics/",
+    "/training/with-certificate/",
+    "/family/children/statistics",
+    "/family/siblings/statistics",
+    "/job/statistics",
+]
+
+
+@pytest.mark.parametrize("path", STATIC_PATHS)
+async def test_static_route_is_not_shadowed(client, path):
+    response = await client.get(path)
+    assert response.status_code == 200, response.text
+
+
+async def test_skill_statistics(client):
+    for name, level in [("python", "advanced"), ("sql", "advanced"), ("go", "beginner")]:
+        response = await client.post("/skills/", json={"skill_name": name, "skill_level": level})
+        assert response.status_code == 201, response.text
+
+    response = await client.get("/skills/statistics/")
+
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total"] == 3
+    assert stats["by_level"]["advanced"] == 2
+    assert stats["by_level"]["beginner"] == 1